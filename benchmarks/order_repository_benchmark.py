@@ -0,0 +1,139 @@
+"""
+Benchmark of the order and position repository queries that run on every
+iteration of a live trading bot, for a growing order history.
+
+Usage:
+    python benchmarks/order_repository_benchmark.py [--without-indexes]
+"""
+import os
+import random
+import sys
+import tempfile
+from datetime import datetime, timedelta
+from timeit import timeit
+
+from sqlalchemy import create_engine, insert
+
+from investing_algorithm_framework.infrastructure import Session, \
+    SQLOrderRepository, SQLPositionRepository, create_all_tables
+from investing_algorithm_framework.infrastructure.database import \
+    SQLBaseModel
+from investing_algorithm_framework.infrastructure.models import SQLOrder, \
+    SQLPosition, SQLPortfolio
+
+HISTORY_SIZES = [1000, 10000, 100000, 250000]
+SYMBOLS = ["BTC", "ETH", "ADA", "DOT", "SOL", "XRP", "LTC", "BNB"]
+REPEAT = 20
+
+
+def setup_database(database_path, with_indexes):
+    engine = create_engine(f"sqlite:///{database_path}")
+    Session.configure(bind=engine)
+    create_all_tables()
+
+    if not with_indexes:
+
+        for table in SQLBaseModel.metadata.sorted_tables:
+
+            for index in table.indexes:
+                index.drop(bind=engine)
+
+    with Session() as db:
+        db.execute(
+            insert(SQLPortfolio),
+            [
+                {
+                    "identifier": f"portfolio_{portfolio_id}",
+                    "trading_symbol": "EUR",
+                    "market": "BINANCE",
+                }
+                for portfolio_id in [1, 2]
+            ]
+        )
+        db.execute(
+            insert(SQLPosition),
+            [
+                {"symbol": symbol, "amount": 0, "cost": 0,
+                 "portfolio_id": portfolio_id}
+                for portfolio_id in [1, 2]
+                for symbol in SYMBOLS
+            ]
+        )
+        db.commit()
+
+
+def add_orders(number_of_orders, offset):
+    created_at = datetime(2023, 1, 1)
+    orders = []
+
+    for index in range(offset, offset + number_of_orders):
+        # Only a handful of orders in the history are still open
+        status = "OPEN" if random.random() < 0.001 else "CLOSED"
+        orders.append(
+            {
+                "external_id": index,
+                "target_symbol": random.choice(SYMBOLS),
+                "trading_symbol": "EUR",
+                "order_side": random.choice(["BUY", "SELL"]),
+                "order_type": "LIMIT",
+                "price": 10,
+                "amount": 1,
+                "status": status,
+                "position_id": random.randint(1, 2 * len(SYMBOLS)),
+                "created_at": created_at + timedelta(minutes=index),
+                "updated_at": created_at + timedelta(minutes=index),
+            }
+        )
+
+    with Session() as db:
+        db.execute(insert(SQLOrder), orders)
+        db.commit()
+
+
+def run_benchmark(with_indexes):
+    order_repository = SQLOrderRepository()
+    position_repository = SQLPositionRepository()
+    queries = {
+        "open orders of portfolio": lambda: order_repository.get_all(
+            {"portfolio_id": 1, "status": "OPEN"}
+        ),
+        "open orders of position": lambda: order_repository.get_all(
+            {"position": 3, "status": "OPEN", "order_side": "BUY"}
+        ),
+        "pending orders": lambda: order_repository.get_all(
+            {"status": "OPEN"}
+        ),
+        "order by external id": lambda: order_repository.find(
+            {"external_id": 42}
+        ),
+        "position of portfolio": lambda: position_repository.find(
+            {"portfolio": 2, "symbol": "ETH"}
+        ),
+    }
+
+    with tempfile.TemporaryDirectory() as directory:
+        setup_database(
+            os.path.join(directory, "benchmark.sqlite3"), with_indexes
+        )
+        number_of_orders = 0
+        print(f"Indexes: {'on' if with_indexes else 'off'}")
+        print(
+            f"{'orders':>8} " + " ".join(f"{name:>26}" for name in queries)
+        )
+
+        for history_size in HISTORY_SIZES:
+            add_orders(history_size - number_of_orders, number_of_orders)
+            number_of_orders = history_size
+            durations = [
+                timeit(query, number=REPEAT) / REPEAT * 1000
+                for query in queries.values()
+            ]
+            print(
+                f"{number_of_orders:>8} "
+                + " ".join(f"{duration:>23.3f} ms" for duration in durations)
+            )
+
+
+if __name__ == "__main__":
+    random.seed(0)
+    run_benchmark(with_indexes="--without-indexes" not in sys.argv)
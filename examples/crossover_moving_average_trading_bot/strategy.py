@@ -1,7 +1,5 @@
-import tulipy as ti
-
 from investing_algorithm_framework import TimeUnit, TradingStrategy, \
-    Algorithm, OrderSide
+    Algorithm, OrderSide, SMA
 
 """
 This strategy is based on the golden cross strategy. It will buy when the
@@ -11,38 +9,36 @@ when the fast moving average crosses the slow moving average from above.
 The strategy will also check if the fast moving average is above the trend
 moving average. If it is not above the trend moving average it will not buy.
 
-It uses tulipy indicators to calculate the metrics. You need to 
-install this library in your environment to run this strategy.
-You can find instructions on how to install tulipy here:
-https://tulipindicators.org/ or go directly to the pypi page:
-https://pypi.org/project/tulipy/
+It uses the streaming indicators of the framework to calculate the moving
+averages. The indicators are updated with the new candles before every run,
+so the moving averages are not recalculated over the complete window.
 """
 # Define market data sources
 
-def is_below_trend(fast_series, slow_series):
-    return fast_series[-1] < slow_series[-1]
+def is_below_trend(fast, slow):
+    return fast.value < slow.value
 
 
-def is_above_trend(fast_series, slow_series):
-    return fast_series[-1] > slow_series[-1]
+def is_above_trend(fast, slow):
+    return fast.value > slow.value
 
 
 def is_crossover(fast, slow):
     """
-    Expect df to have columns: Date, ma_<period_one>, ma_<period_two>.
-    With the given date time it will check if the ma_<period_one> is a
-    crossover with the ma_<period_two>
+    Check if the fast moving average crossed the slow moving average
+    from below at the last candle.
     """
-    return fast[-2] <= slow[-2] and fast[-1] > slow[-1]
+    return fast.previous_value <= slow.previous_value \
+        and fast.value > slow.value
 
 
 def is_crossunder(fast, slow):
     """
-    Expect df to have columns: Date, ma_<period_one>, ma_<period_two>.
-    With the given date time it will check if the ma_<period_one> is a
-    crossover with the ma_<period_two>
+    Check if the fast moving average crossed the slow moving average
+    from above at the last candle.
     """
-    return fast[-2] >= slow[-2] and fast[-1] < slow[-1]
+    return fast.previous_value >= slow.previous_value \
+        and fast.value < slow.value
 
 
 class CrossOverStrategy(TradingStrategy):
@@ -55,6 +51,11 @@ class CrossOverStrategy(TradingStrategy):
         "DOT/EUR-ticker"
     ]
     symbols = ["BTC/EUR", "DOT/EUR"]
+    indicators = [
+        SMA(f"{symbol}-ohlcv", period)
+        for symbol in symbols
+        for period in [9, 50, 100]
+    ]
 
     def apply_strategy(self, algorithm: Algorithm, market_data):
 
@@ -64,13 +65,15 @@ class CrossOverStrategy(TradingStrategy):
             if algorithm.has_open_orders(target_symbol):
                 continue
 
-            df = market_data[f"{symbol}-ohlcv"]
             ticker_data = market_data[f"{symbol}-ticker"]
-            fast = ti.sma(df['Close'].to_numpy(), 9)
-            slow = ti.sma(df['Close'].to_numpy(), 50)
-            trend = ti.sma(df['Close'].to_numpy(), 100)
+            fast = self.get_indicator("sma_9", f"{symbol}-ohlcv")
+            slow = self.get_indicator("sma_50", f"{symbol}-ohlcv")
+            trend = self.get_indicator("sma_100", f"{symbol}-ohlcv")
             price = ticker_data['bid']
 
+            if trend.value is None or slow.previous_value is None:
+                continue
+
             if not algorithm.has_position(target_symbol) \
                     and is_crossover(fast, slow)\
                     and not is_above_trend(fast, trend):
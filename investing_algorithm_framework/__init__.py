@@ -6,7 +6,9 @@ from investing_algorithm_framework.domain import ApiException, \
     Position, TimeFrame, BACKTESTING_INDEX_DATETIME, MarketCredential, \
     PortfolioConfiguration, RESOURCE_DIRECTORY, pretty_print_backtest, \
     Trade, OHLCVMarketDataSource, OrderBookMarketDataSource, \
-    TickerMarketDataSource, MarketService
+    TickerMarketDataSource, MarketService, SnapshotPolicy, SNAPSHOT_POLICY, \
+    SNAPSHOT_INTERVAL, SQLITE_PRAGMAS, Indicator, SMA, EMA, RSI, MACD, ATR, \
+    BollingerBands, RollingMin, RollingMax
 from investing_algorithm_framework.app import TradingStrategy, \
     StatelessAction, Task
 from investing_algorithm_framework.infrastructure import \
@@ -48,5 +50,18 @@ __all__ = [
     "CSVOHLCVMarketDataSource",
     "CSVTickerMarketDataSource",
     "MarketCredential",
-    "MarketService"
+    "MarketService",
+    "SnapshotPolicy",
+    "SNAPSHOT_POLICY",
+    "SNAPSHOT_INTERVAL",
+    "SQLITE_PRAGMAS",
+    "Indicator",
+    "SMA",
+    "EMA",
+    "RSI",
+    "MACD",
+    "ATR",
+    "BollingerBands",
+    "RollingMin",
+    "RollingMax",
 ]
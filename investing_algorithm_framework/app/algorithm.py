@@ -48,6 +48,10 @@ class Algorithm:
                 number_of_iterations=number_of_iterations
             )
 
+    def stop(self, wait=False):
+        self.strategy_orchestrator_service.stop(wait=wait)
+        self.order_service.create_pending_snapshots(flush=True)
+
     @property
     def config(self):
         return self.configuration_service.config
@@ -59,6 +63,9 @@ class Algorithm:
     def run_jobs(self):
         self.strategy_orchestrator_service.run_pending_jobs()
 
+    def time_until_next_job(self):
+        return self.strategy_orchestrator_service.time_until_next_run()
+
     def create_order(
         self,
         target_symbol,
@@ -1,11 +1,14 @@
 import inspect
+import itertools
 import logging
+import multiprocessing
 import os
 import shutil
 import threading
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from distutils.sysconfig import get_python_lib
-from time import sleep
+from time import sleep, monotonic
 
 from flask import Flask
 
@@ -18,14 +21,21 @@ from investing_algorithm_framework.domain import DATABASE_NAME, TimeUnit, \
     DATABASE_DIRECTORY_PATH, RESOURCE_DIRECTORY, ENVIRONMENT, Environment, \
     SQLALCHEMY_DATABASE_URI, OperationalException, BACKTESTING_FLAG, \
     BACKTESTING_START_DATE, MarketService, BACKTESTING_END_DATE, \
-    BACKTESTING_PENDING_ORDER_CHECK_INTERVAL
+    BACKTESTING_PENDING_ORDER_CHECK_INTERVAL, OHLCVMarketDataSource, \
+    TickerMarketDataSource, BacktestMarketDataSource
 from investing_algorithm_framework.infrastructure import setup_sqlalchemy, \
-    create_all_tables
+    create_all_tables, InMemoryDatabase, InMemoryOrderRepository, \
+    InMemoryOrderFeeRepository, InMemoryPositionRepository, \
+    InMemoryPortfolioRepository, InMemoryPortfolioSnapshotRepository, \
+    InMemoryPositionSnapshotRepository, remove_sqlite_database, \
+    CCXTOHLCVBacktestMarketDataSource, set_base_timeframes
 from investing_algorithm_framework.services import OrderBacktestService, \
     BacktestMarketDataSourceService, BacktestPortfolioService, \
-    MarketDataSourceService, MarketCredentialService
+    MarketDataSourceService, MarketCredentialService, PortfolioSnapshotService
 
 logger = logging.getLogger("investing_algorithm_framework")
+# Seconds between two checks of the pending orders in a live run
+PENDING_ORDERS_CHECK_INTERVAL = 30
 
 
 class App:
@@ -43,6 +53,7 @@ class App:
         self._market_service: MarketService = None
         self._market_data_source_service: MarketDataSourceService = None
         self._market_credential_service: MarketCredentialService = None
+        self._in_memory_database: InMemoryDatabase = None
 
     def set_config(self, config: dict):
         configuration_service = self.container.configuration_service()
@@ -116,7 +127,8 @@ class App:
         self,
         backtest_start_date,
         backtest_end_date,
-        pending_order_check_interval
+        pending_order_check_interval,
+        database_name="backtest-database.sqlite3"
     ) -> None:
         """
         Initialize the app for backtesting by setting the configuration
@@ -125,6 +137,8 @@ class App:
         when running a backtest.
 
         :param backtest_start_date: The start date of the backtest
+        :param database_name: The name of the backtest database in the
+            databases directory of the resource directory
         :return: None
         """
         configuration_service = self.container.configuration_service()
@@ -145,16 +159,13 @@ class App:
         resource_dir = self._create_resource_directory_if_not_exists()
         configuration_service.config[DATABASE_DIRECTORY_PATH] = \
             os.path.join(resource_dir, "databases")
-        configuration_service.config[DATABASE_NAME] = \
-            "backtest-database.sqlite3"
+        configuration_service.config[DATABASE_NAME] = database_name
         database_path = os.path.join(
             configuration_service.config[DATABASE_DIRECTORY_PATH],
             configuration_service.config[DATABASE_NAME]
         )
 
-        if os.path.exists(database_path):
-            os.remove(database_path)
-
+        remove_sqlite_database(database_path)
         configuration_service.config[SQLALCHEMY_DATABASE_URI] = \
             "sqlite:///" + os.path.join(
                 configuration_service.config[DATABASE_DIRECTORY_PATH],
@@ -164,19 +175,40 @@ class App:
         setup_sqlalchemy(self)
         create_all_tables()
 
+        # Override the repositories with in memory repositories, the state
+        # of the backtest is only written to the sql database on request
+        self._in_memory_database = InMemoryDatabase()
+        self.container.order_repository.override(
+            InMemoryOrderRepository(database=self._in_memory_database)
+        )
+        self.container.order_fee_repository.override(
+            InMemoryOrderFeeRepository(database=self._in_memory_database)
+        )
+        self.container.position_repository.override(
+            InMemoryPositionRepository(database=self._in_memory_database)
+        )
+        self.container.portfolio_repository.override(
+            InMemoryPortfolioRepository(database=self._in_memory_database)
+        )
+        self.container.position_snapshot_repository.override(
+            InMemoryPositionSnapshotRepository(
+                database=self._in_memory_database
+            )
+        )
+        self.container.portfolio_snapshot_repository.override(
+            InMemoryPortfolioSnapshotRepository(
+                database=self._in_memory_database
+            )
+        )
+
         # Override the MarketDataSourceService service with the backtest
         # market data source service equivalent. Additionally, convert the
         # market data sources to backtest market data sources
         # market_data_sources = self.get_market_data_sources()
         # backtest_market_data_sources = []
-        market_data_sources_service: MarketDataSourceService = \
-            self.container.market_data_source_service()
-        market_data_sources = market_data_sources_service\
-            .get_market_data_sources()
-        backtest_market_data_sources = [
-            market_data_source.to_backtest_market_data_source()
-            for market_data_source in market_data_sources
-        ]
+        backtest_market_data_sources = self._get_backtest_market_data_sources(
+            pending_order_check_interval
+        )
         self.container.market_data_source_service.override(
             BacktestMarketDataSourceService(
                 market_data_sources=backtest_market_data_sources,
@@ -186,6 +218,17 @@ class App:
                 configuration_service=self.container.configuration_service(),
             )
         )
+        # Share one snapshot service between the services, it keeps the
+        # snapshot requests that are written at the end of every run
+        self.container.portfolio_snapshot_service.override(
+            PortfolioSnapshotService(
+                repository=self.container.portfolio_snapshot_repository(),
+                position_repository=self.container.position_repository(),
+                position_snapshot_service=self.container
+                .position_snapshot_service(),
+                configuration_service=self.container.configuration_service(),
+            )
+        )
         # Override the portfolio service with the backtest portfolio service
         self.container.portfolio_service.override(BacktestPortfolioService(
             market_service=self.container.market_service(),
@@ -285,19 +328,34 @@ class App:
             flask_thread.setDaemon(True)
             flask_thread.start()
 
-        number_of_iterations_since_last_orders_check = 1
         self.algorithm.check_pending_orders()
+        next_orders_check = monotonic() + PENDING_ORDERS_CHECK_INTERVAL
 
         try:
             while self.algorithm.running:
-                if number_of_iterations_since_last_orders_check == 30:
+                if monotonic() >= next_orders_check:
                     logger.info("Checking pending orders")
                     self.algorithm.check_pending_orders()
-                    number_of_iterations_since_last_orders_check = 1
+                    next_orders_check = \
+                        monotonic() + PENDING_ORDERS_CHECK_INTERVAL
 
                 self.algorithm.run_jobs()
-                number_of_iterations_since_last_orders_check += 1
-                sleep(1)
+                self.algorithm.order_service.create_pending_snapshots()
+
+                if not self.algorithm.running:
+                    break
+
+                # Sleep until the next scheduled job or orders check
+                time_until_next_job = self.algorithm.time_until_next_job()
+                sleep_time = next_orders_check - monotonic()
+
+                if time_until_next_job is not None:
+                    sleep_time = min(sleep_time, time_until_next_job)
+
+                sleep(max(sleep_time, 0))
+
+            # Let the last strategy and task runs finish
+            self.algorithm.stop(wait=True)
         except KeyboardInterrupt:
             exit(0)
 
@@ -376,6 +434,7 @@ class App:
         time_unit: TimeUnit = TimeUnit.MINUTE,
         interval=10,
         market_data_sources=None,
+        indicators=None,
     ):
 
         if function:
@@ -383,7 +442,8 @@ class App:
                 decorated=function,
                 time_unit=time_unit,
                 interval=interval,
-                market_data_sources=market_data_sources
+                market_data_sources=market_data_sources,
+                indicators=indicators
             )
             self.add_strategy(strategy_object)
         else:
@@ -395,7 +455,8 @@ class App:
                         time_unit=time_unit,
                         interval=interval,
                         market_data_sources=market_data_sources,
-                        worker_id=f.__name__
+                        worker_id=f.__name__,
+                        indicators=indicators
                     )
                 )
                 return f
@@ -528,29 +589,480 @@ class App:
         return self.algorithm.get_portfolio_configurations()
 
     def backtest(
-        self, start_date, end_date, pending_order_check_interval='1h'
+        self,
+        start_date,
+        end_date,
+        pending_order_check_interval='1h',
+        persist_database=False,
+        sparse_schedule=False
     ):
+        """
+        Function to run a backtest of the algorithm. The state of the
+        backtest is kept in memory. Set persist_database to write the
+        orders, positions, portfolios and snapshots of the backtest to the
+        backtest sqlite database in the resource directory for inspection.
+
+        Set sparse_schedule to skip the runs of a strategy at which none
+        of its market data sources has new data and no orders are
+        pending, for example a strategy that runs every minute on 15m
+        candles.
+        """
         logger.info("Initializing backtest")
 
         if end_date is None:
             end_date = datetime.utcnow()
 
+        return self._run_backtest(
+            start_date=start_date,
+            end_date=end_date,
+            pending_order_check_interval=pending_order_check_interval,
+            persist_database=persist_database,
+            sparse_schedule=sparse_schedule
+        )
+
+    def vector_backtest(
+        self,
+        start_date,
+        end_date=None,
+        signals=None,
+        market_data_source=None,
+        order_type="MARKET",
+        percentage_of_portfolio=100,
+        fee_percentage=0.0,
+        precision=None
+    ):
+        """
+        Function to run a vectorized backtest of entry and exit signals
+        over the OHLCV data of a market data source. Instead of running
+        the strategies at every scheduled time, the signals of all
+        candles are given at once and the orders, fills and equity are
+        simulated with array operations.
+
+        The signals are either a tuple with an entries and an exits
+        array, a function that takes the OHLCV data and returns that
+        tuple, or a strategy that implements generate_signals. Without
+        signals, the first strategy of the app that implements
+        generate_signals is used. The arrays can also be given as a dict
+        with entries and exits keys.
+
+        The market data source is the identifier or the OHLCV market data
+        source of the backtest, and can be left out when the app has a
+        single OHLCV market data source. The balance and trading symbol
+        are taken from the portfolio configuration of its market.
+
+        :return: a BacktestProfile
+        """
+        configuration_service = self.container.configuration_service()
+
+        if configuration_service.config.get(RESOURCE_DIRECTORY) is None:
+            raise OperationalException(
+                "Resource directory is not specified. "
+                "A resource directory is required for running a backtest."
+            )
+
+        if end_date is None:
+            end_date = datetime.utcnow()
+
+        market_data_source = self._get_vector_backtest_market_data_source(
+            market_data_source
+        )
+        portfolio_configuration = self._get_vector_backtest_portfolio(
+            market_data_source.market
+        )
+        self._create_resource_directory_if_not_exists()
+        backtest_market_data_source = \
+            market_data_source.to_backtest_market_data_source()
+        self._add_indicators([backtest_market_data_source])
+        BacktestMarketDataSourceService.prepare_market_data_sources(
+            market_data_sources=[backtest_market_data_source],
+            config=configuration_service.get_config(),
+            backtest_start_date=start_date,
+            backtest_end_date=end_date,
+            market_credential_service=self._market_credential_service
+        )
+        data = backtest_market_data_source.data
+        entries, exits = self._get_vector_backtest_signals(signals, data)
+        logger.info("Running vector backtest")
+        return self.container.vector_backtest_service().backtest(
+            data=data,
+            entries=entries,
+            exits=exits,
+            start_date=start_date,
+            end_date=end_date,
+            initial_balance=portfolio_configuration.initial_balance,
+            target_symbol=market_data_source.symbol.split("/")[0].upper(),
+            trading_symbol=portfolio_configuration.trading_symbol,
+            order_type=order_type,
+            percentage_of_portfolio=percentage_of_portfolio,
+            fee_percentage=fee_percentage,
+            precision=precision
+        )
+
+    def _get_vector_backtest_market_data_source(self, market_data_source):
+        market_data_sources = [
+            registered_market_data_source
+            for registered_market_data_source
+            in self._market_data_source_service.get_market_data_sources()
+            if isinstance(registered_market_data_source, OHLCVMarketDataSource)
+        ]
+
+        if isinstance(market_data_source, OHLCVMarketDataSource):
+            return market_data_source
+
+        if market_data_source is not None:
+
+            for registered_market_data_source in market_data_sources:
+
+                if registered_market_data_source.get_identifier() \
+                        == market_data_source:
+                    return registered_market_data_source
+
+            raise OperationalException(
+                f"No OHLCV market data source with identifier "
+                f"{market_data_source} found"
+            )
+
+        if len(market_data_sources) != 1:
+            raise OperationalException(
+                "Specify the OHLCV market data source of the vector "
+                "backtest, the app has "
+                f"{len(market_data_sources)} OHLCV market data sources"
+            )
+
+        return market_data_sources[0]
+
+    def _get_vector_backtest_portfolio(self, market):
+        portfolio_configurations = self.container\
+            .portfolio_configuration_service().get_all()
+
+        if len(portfolio_configurations) == 0:
+            raise OperationalException("No portfolios configured")
+
+        for portfolio_configuration in portfolio_configurations:
+
+            if portfolio_configuration.market.lower() == market.lower():
+                return portfolio_configuration
+
+        raise OperationalException(
+            f"No portfolio configured for market {market}"
+        )
+
+    def _get_vector_backtest_signals(self, signals, data):
+
+        if signals is None:
+
+            for strategy in self.strategies:
+
+                if type(strategy).generate_signals \
+                        is not TradingStrategy.generate_signals:
+                    signals = strategy
+                    break
+            else:
+                raise OperationalException(
+                    "No signals given and no strategy implements "
+                    "generate_signals"
+                )
+
+        if inspect.isclass(signals):
+            signals = signals()
+
+        if isinstance(signals, TradingStrategy):
+            signals = signals.generate_signals(data)
+        elif callable(signals):
+            signals = signals(data)
+
+        if isinstance(signals, dict):
+            return signals["entries"], signals["exits"]
+
+        entries, exits = signals
+        return entries, exits
+
+    def backtest_many(
+        self,
+        param_grid,
+        start_date,
+        end_date,
+        pending_order_check_interval='1h',
+        workers=None,
+        persist_database=False,
+        sparse_schedule=False
+    ):
+        """
+        Function to run a backtest for every parameterisation of a
+        parameter grid in parallel over a pool of processes.
+
+        The param grid is either a list of dicts or a dict of lists, of
+        which all combinations are backtested. The params of a run are
+        added to the config of the app, where strategies can read them
+        through algorithm.config. A run can override its date range
+        with the BACKTESTING_START_DATE and BACKTESTING_END_DATE keys.
+
+        Every run rebuilds the app in its worker process with its own
+        backtest database, so strategies, market data sources and
+        portfolio configurations need to be picklable and the function
+        should be called from an if __name__ == "__main__" block. The
+        backtest data is prepared once up front and shared read only by
+        all runs.
+
+        :return: a list of BacktestProfiles in the order of the param grid
+        """
+        configuration_service = self.container.configuration_service()
+
+        if configuration_service.config.get(RESOURCE_DIRECTORY) is None:
+            raise OperationalException(
+                "Resource directory is not specified. "
+                "A resource directory is required for running a backtest."
+            )
+
+        if end_date is None:
+            end_date = datetime.utcnow()
+
+        if isinstance(param_grid, dict):
+            param_grid = [
+                dict(zip(param_grid.keys(), values))
+                for values in itertools.product(*param_grid.values())
+            ]
+
+        specification = {
+            "config": configuration_service.config.to_dict(),
+            "strategies": self.strategies,
+            "market_data_sources": self._market_data_source_service
+            .get_market_data_sources(),
+            "market_credentials": self._market_credential_service.get_all(),
+            "portfolio_configurations": self.container
+            .portfolio_configuration_service().get_all(),
+            "pending_order_check_interval": pending_order_check_interval,
+            "persist_database": persist_database,
+            "sparse_schedule": sparse_schedule,
+        }
+        runs = []
+
+        for index, params in enumerate(param_grid):
+            runs.append({
+                "params": params,
+                "start_date": params.get(BACKTESTING_START_DATE, start_date),
+                "end_date": params.get(BACKTESTING_END_DATE, end_date),
+                "database_name": f"backtest-database-{index}.sqlite3",
+            })
+
+        # Download the backtest data before starting the workers, so
+        # runs never write the same backtest data file concurrently
+        self._create_resource_directory_if_not_exists()
+        date_ranges = set((run["start_date"], run["end_date"]) for run in runs)
+
+        for backtest_start_date, backtest_end_date in date_ranges:
+            self._prepare_backtest_data(
+                backtest_start_date,
+                backtest_end_date,
+                pending_order_check_interval
+            )
+
+        logger.info(f"Running {len(runs)} backtests")
+
+        # Workers are spawned instead of forked, forking a process that
+        # already started the thread pool of polars can deadlock
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn")
+        ) as executor:
+            return list(
+                executor.map(
+                    _run_backtest_in_process,
+                    [specification] * len(runs),
+                    runs
+                )
+            )
+
+    def _run_backtest(
+        self,
+        start_date,
+        end_date,
+        pending_order_check_interval,
+        persist_database,
+        database_name="backtest-database.sqlite3",
+        sparse_schedule=False
+    ):
         self._initialize_backtest(
             backtest_start_date=start_date,
             backtest_end_date=end_date,
-            pending_order_check_interval=pending_order_check_interval
+            pending_order_check_interval=pending_order_check_interval,
+            database_name=database_name
         )
         backtest_service = self.container.backtest_service()
         backtest_service.resource_directory = self.config.get(
             RESOURCE_DIRECTORY
         )
         report = backtest_service.backtest(
-            self.algorithm, start_date, end_date
+            self.algorithm,
+            start_date,
+            end_date,
+            sparse_schedule=sparse_schedule
         )
+
+        if persist_database:
+            self._in_memory_database.dump()
+
         return report
 
+    def _prepare_backtest_data(
+        self,
+        backtest_start_date,
+        backtest_end_date,
+        pending_order_check_interval
+    ):
+        configuration_service = self.container.configuration_service()
+        backtest_market_data_sources = self._get_backtest_market_data_sources(
+            pending_order_check_interval
+        )
+        BacktestMarketDataSourceService.prepare_market_data_sources(
+            market_data_sources=[
+                backtest_market_data_source
+                for backtest_market_data_source in backtest_market_data_sources
+                if backtest_market_data_source is not None
+            ],
+            config=configuration_service.get_config(),
+            backtest_start_date=backtest_start_date,
+            backtest_end_date=backtest_end_date,
+            market_credential_service=self._market_credential_service
+        )
+
+    def _get_backtest_market_data_sources(self, pending_order_check_interval):
+        """
+        Function to convert the market data sources of the app to backtest
+        market data sources. The data sources for the pending order checks
+        are added, and the data sources of a market and symbol share the
+        data of their smallest timeframe.
+        """
+        backtest_market_data_sources = [
+            market_data_source.to_backtest_market_data_source()
+            for market_data_source in self._market_data_source_service
+            .get_market_data_sources()
+        ]
+        self._add_order_check_market_data_sources(
+            backtest_market_data_sources, pending_order_check_interval
+        )
+        set_base_timeframes(backtest_market_data_sources)
+        self._add_indicators(backtest_market_data_sources)
+        return backtest_market_data_sources
+
+    @staticmethod
+    def _add_order_check_market_data_sources(
+        backtest_market_data_sources, pending_order_check_interval
+    ):
+        """
+        Function to add an OHLCV backtest market data source with the
+        pending order check interval as timeframe for every market and
+        symbol of the OHLCV and ticker backtest market data sources that
+        does not have one. Its data is resampled from the data of the other
+        timeframes of the market and symbol when possible.
+        """
+        symbols = {}
+
+        for backtest_market_data_source in backtest_market_data_sources:
+
+            if not isinstance(
+                backtest_market_data_source, BacktestMarketDataSource
+            ) or not isinstance(
+                backtest_market_data_source,
+                (OHLCVMarketDataSource, TickerMarketDataSource)
+            ):
+                continue
+
+            key = (
+                backtest_market_data_source.market.upper(),
+                backtest_market_data_source.symbol.upper()
+            )
+            symbols.setdefault(key, False)
+
+            if isinstance(
+                backtest_market_data_source, OHLCVMarketDataSource
+            ) and backtest_market_data_source.timeframe \
+                    == pending_order_check_interval:
+                symbols[key] = True
+
+        for (market, symbol), present in symbols.items():
+
+            if present:
+                continue
+
+            backtest_market_data_sources.append(
+                CCXTOHLCVBacktestMarketDataSource(
+                    identifier=f"{symbol}-{market}-"
+                               f"{pending_order_check_interval}-order-check",
+                    market=market,
+                    symbol=symbol,
+                    timeframe=pending_order_check_interval,
+                    window_size=1
+                )
+            )
+
+    def _add_indicators(self, backtest_market_data_sources):
+        """
+        Function to give every backtest market data source the
+        indicators of the strategies that use its data, so the indicator
+        columns are precomputed when the data is prepared.
+        """
+
+        for backtest_market_data_source in backtest_market_data_sources:
+
+            if backtest_market_data_source is None:
+                continue
+
+            identifier = backtest_market_data_source.get_identifier()
+            backtest_market_data_source.indicators = [
+                indicator
+                for strategy in self.strategies
+                for indicator in strategy.indicators
+                if indicator.market_data_source == identifier
+            ]
+
     def add_market_data_source(self, market_data_source):
         self._market_data_source_service.add(market_data_source)
 
     def add_market_credential(self, market_credential):
         self._market_credential_service.add(market_credential)
+
+
+def _run_backtest_in_process(specification, run):
+    """
+    Function to run a single backtest of App.backtest_many in a worker
+    process. The app is rebuilt from the specification, so the run does
+    not share its config, database or services with other runs.
+    """
+    from investing_algorithm_framework.create_app import create_app
+
+    config = {**specification["config"], **run["params"]}
+    app = create_app(config=config)
+
+    for strategy in specification["strategies"]:
+        app.add_strategy(strategy)
+
+    for market_data_source in specification["market_data_sources"]:
+        app.add_market_data_source(market_data_source)
+
+    for market_credential in specification["market_credentials"]:
+        app.add_market_credential(market_credential)
+
+    for portfolio_configuration in \
+            specification["portfolio_configurations"]:
+        app.add_portfolio_configuration(portfolio_configuration)
+
+    report = app._run_backtest(
+        start_date=run["start_date"],
+        end_date=run["end_date"],
+        pending_order_check_interval=specification[
+            "pending_order_check_interval"
+        ],
+        persist_database=specification["persist_database"],
+        database_name=run["database_name"],
+        sparse_schedule=specification["sparse_schedule"]
+    )
+
+    if not specification["persist_database"]:
+        remove_sqlite_database(
+            os.path.join(
+                app.config[DATABASE_DIRECTORY_PATH], run["database_name"]
+            )
+        )
+
+    return report
@@ -11,12 +11,15 @@ class RunStrategyHandler(ActionHandlerStrategy):
         strategies = algorithm.strategy_orchestrator_service\
             .get_strategies(payload.get("strategies", None))
         tasks = algorithm.strategy_orchestrator_service.get_tasks()
+        market_data_context = algorithm.strategy_orchestrator_service\
+            .create_market_data_context()
 
         for strategy in strategies:
             algorithm.strategy_orchestrator_service.run_strategy(
                 strategy=strategy,
                 algorithm=algorithm,
-                sync=True
+                sync=True,
+                market_data_context=market_data_context
             )
 
         for task in tasks:
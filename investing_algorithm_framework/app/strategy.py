@@ -1,5 +1,7 @@
+from copy import deepcopy
+
 from investing_algorithm_framework.domain import \
-    TimeUnit, StrategyProfile, Trade
+    TimeUnit, StrategyProfile, Trade, MarketDataSource
 from .algorithm import Algorithm
 
 
@@ -9,6 +11,7 @@ class TradingStrategy:
     worker_id: str = None
     decorated = None
     market_data_sources = None
+    indicators = None
 
     def __init__(
         self,
@@ -16,7 +19,8 @@ class TradingStrategy:
         interval=None,
         market_data_sources=None,
         worker_id=None,
-        decorated=None
+        decorated=None,
+        indicators=None
     ):
 
         if time_unit is not None:
@@ -34,6 +38,11 @@ class TradingStrategy:
         if decorated is not None:
             self.decorated = decorated
 
+        if indicators is not None:
+            self.indicators = indicators
+
+        self.initialize_indicators()
+
         if worker_id is not None:
             self.worker_id = worker_id
         elif self.decorated:
@@ -41,7 +50,63 @@ class TradingStrategy:
         else:
             self.worker_id = self.__class__.__name__
 
+    def initialize_indicators(self):
+        """
+        Function to give the strategy its own copy of the indicators, so
+        their state is not shared with other instances of the strategy,
+        and to add the market data sources of the indicators to the
+        market data sources of the strategy.
+        """
+        self.indicators = [
+            deepcopy(indicator) for indicator in self.indicators or []
+        ]
+
+        if len(self.indicators) == 0:
+            return
+
+        market_data_sources = list(self.market_data_sources or [])
+        identifiers = [
+            market_data_source.get_identifier()
+            if isinstance(market_data_source, MarketDataSource)
+            else market_data_source
+            for market_data_source in market_data_sources
+        ]
+
+        for indicator in self.indicators:
+
+            if indicator.market_data_source not in identifiers:
+                identifiers.append(indicator.market_data_source)
+                market_data_sources.append(indicator.market_data_source)
+
+        self.market_data_sources = market_data_sources
+
+    def update_indicators(self, market_data):
+        """
+        Function to update the indicators with the new candles of the
+        market data of a run.
+        """
+
+        for indicator in self.indicators:
+            indicator.update(market_data.get(indicator.market_data_source))
+
+    def get_indicator(self, name, market_data_source=None):
+        """
+        Function to get an indicator of the strategy by its name, and
+        optionally the identifier of its market data source.
+        """
+
+        for indicator in self.indicators:
+
+            if indicator.name == name and (
+                market_data_source is None
+                or indicator.market_data_source == market_data_source
+            ):
+                return indicator
+
+        return None
+
     def run_strategy(self, algorithm, market_data):
+        self.update_indicators(market_data)
         self.apply_strategy(algorithm=algorithm, market_data=market_data)
 
     def apply_strategy(self, algorithm, market_data):
@@ -50,6 +115,18 @@ class TradingStrategy:
         else:
             raise NotImplementedError("Apply strategy is not implemented")
 
+    def generate_signals(self, data):
+        """
+        Function to generate the entry and exit signals of the strategy
+        for a vector backtest. The data is the complete OHLCV data of
+        the backtest, with the columns of the indicators of the
+        strategy added.
+
+        :return: tuple with a boolean array of entry signals and a
+            boolean array of exit signals, with a signal per candle
+        """
+        raise NotImplementedError("Generate signals is not implemented")
+
     @property
     def strategy_profile(self):
         return StrategyProfile(
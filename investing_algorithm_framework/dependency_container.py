@@ -4,12 +4,12 @@ from investing_algorithm_framework.app.algorithm import Algorithm
 from investing_algorithm_framework.infrastructure import SQLOrderRepository, \
     SQLPositionRepository, SQLPortfolioRepository, \
     SQLOrderFeeRepository, SQLPortfolioSnapshotRepository, \
-    SQLPositionSnapshotRepository, PerformanceService, CCXTMarketService
+    SQLPositionSnapshotRepository, PerformanceService, SyncCCXTMarketService
 from investing_algorithm_framework.services import OrderService, \
     PositionService, PortfolioService, StrategyOrchestratorService, \
     PortfolioConfigurationService, MarketDataSourceService, BackTestService, \
     ConfigurationService, PortfolioSnapshotService, PositionSnapshotService, \
-    MarketCredentialService
+    MarketCredentialService, VectorBacktestService
 
 
 def setup_dependency_container(app, modules=None, packages=None):
@@ -37,8 +37,9 @@ class DependencyContainer(containers.DeclarativeContainer):
     portfolio_snapshot_repository = providers.Factory(
         SQLPortfolioSnapshotRepository
     )
-    market_service = providers.Factory(
-        CCXTMarketService,
+    # A single market service keeps the pooled exchanges between calls
+    market_service = providers.ThreadSafeSingleton(
+        SyncCCXTMarketService,
         market_credential_service=market_credential_service,
     )
     market_data_source_service = providers.Factory(
@@ -50,11 +51,13 @@ class DependencyContainer(containers.DeclarativeContainer):
         PositionSnapshotService,
         repository=position_snapshot_repository,
     )
-    portfolio_snapshot_service = providers.Factory(
+    # A single snapshot service keeps the postponed snapshot requests
+    portfolio_snapshot_service = providers.ThreadSafeSingleton(
         PortfolioSnapshotService,
         repository=portfolio_snapshot_repository,
         position_snapshot_service=position_snapshot_service,
         position_repository=position_repository,
+        configuration_service=configuration_service,
     )
     portfolio_configuration_service = providers.ThreadSafeSingleton(
         PortfolioConfigurationService,
@@ -106,6 +109,7 @@ class DependencyContainer(containers.DeclarativeContainer):
         position_repository=position_repository,
         market_data_source_service=market_data_source_service,
     )
+    vector_backtest_service = providers.Factory(VectorBacktestService)
     algorithm = providers.Factory(
         Algorithm,
         configuration_service=configuration_service,
@@ -4,7 +4,8 @@ from .models import OrderStatus, OrderSide, OrderType, TimeInterval, \
     PortfolioConfiguration, Portfolio, Position, Order, \
     OrderFee, BacktestProfile, PositionSnapshot, \
     PortfolioSnapshot, StrategyProfile, BacktestPosition, Trade, \
-    MarketCredential
+    MarketCredential, BacktestDataStorageFormat, SnapshotPolicy, EquityCurve, \
+    Indicator, SMA, EMA, RSI, MACD, ATR, BollingerBands, RollingMin, RollingMax
 from .exceptions import OperationalException, ApiException, \
     PermissionDeniedApiException, ImproperlyConfigured
 from .constants import ITEMIZE, ITEMIZED, PER_PAGE, PAGE, ENVIRONMENT, \
@@ -14,11 +15,13 @@ from .constants import ITEMIZE, ITEMIZED, PER_PAGE, PAGE, ENVIRONMENT, \
     BACKTESTING_INDEX_DATETIME, BACKTESTING_START_DATE, CCXT_DATETIME_FORMAT, \
     BACKTEST_DATA_DIRECTORY_NAME, TICKER_DATA_TYPE, OHLCV_DATA_TYPE, \
     CURRENT_UTC_DATETIME, BACKTESTING_END_DATE, \
-    BACKTESTING_PENDING_ORDER_CHECK_INTERVAL
+    BACKTESTING_PENDING_ORDER_CHECK_INTERVAL, BACKTEST_DATA_STORAGE_FORMAT, \
+    SNAPSHOT_POLICY, SNAPSHOT_INTERVAL, SQLITE_PRAGMAS
 from .singleton import Singleton
 from .utils import random_string, append_dict_as_row_to_csv, \
     add_column_headers_to_csv, get_total_amount_of_rows, \
-    csv_to_list, StoppableThread
+    csv_to_list, StoppableThread, create_ohlcv_data_frame, \
+    OHLCV_COLUMN_NAMES, resample_ohlcv_data_frame
 from .strategy import Strategy
 from .stateless_actions import StatelessActions
 from .decimal_parsing import parse_decimal_to_string, parse_string_to_decimal
@@ -48,6 +51,18 @@ __all__ = [
     "DEFAULT_PAGE_VALUE",
     "SQLALCHEMY_DATABASE_URI",
     "TradingDataType",
+    "BacktestDataStorageFormat",
+    "SnapshotPolicy",
+    "EquityCurve",
+    "Indicator",
+    "SMA",
+    "EMA",
+    "RSI",
+    "MACD",
+    "ATR",
+    "BollingerBands",
+    "RollingMin",
+    "RollingMax",
     "TradingTimeFrame",
     "Singleton",
     "random_string",
@@ -73,6 +88,9 @@ __all__ = [
     "parse_string_to_decimal",
     "BacktestProfile",
     "pretty_print_backtest",
+    "create_ohlcv_data_frame",
+    "OHLCV_COLUMN_NAMES",
+    "resample_ohlcv_data_frame",
     "DATETIME_FORMAT_BACKTESTING",
     "BACKTESTING_FLAG",
     "BACKTESTING_INDEX_DATETIME",
@@ -95,5 +113,9 @@ __all__ = [
     "MarketService",
     "PeekableQueue",
     "BACKTESTING_END_DATE",
-    "BACKTESTING_PENDING_ORDER_CHECK_INTERVAL"
+    "BACKTESTING_PENDING_ORDER_CHECK_INTERVAL",
+    "BACKTEST_DATA_STORAGE_FORMAT",
+    "SNAPSHOT_POLICY",
+    "SNAPSHOT_INTERVAL",
+    "SQLITE_PRAGMAS",
 ]
@@ -76,6 +76,20 @@ class Config(dict):
     SQLITE_ENABLED = True
     SQLITE_INITIALIZED = False
     BACKTEST_DATA_DIRECTORY_NAME = "backtest_data"
+    BACKTEST_DATA_STORAGE_FORMAT = "CSV"
+    SNAPSHOT_POLICY = "ORDER"
+    # Minimum time between two snapshots of a portfolio in seconds, only
+    # used by the INTERVAL snapshot policy
+    SNAPSHOT_INTERVAL = 3600
+    # Pragmas that are set on every connection to a sqlite database file.
+    # WAL lets strategy threads read while another thread writes.
+    SQLITE_PRAGMAS = {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "mmap_size": 268435456,
+        "cache_size": -64000,
+        "busy_timeout": 5000,
+    }
 
     def __init__(self, resource_directory=None):
         super().__init__()
@@ -162,6 +176,16 @@ class Config(dict):
     def set(self, key: str, value) -> None:
         self[key] = value
 
+    def to_dict(self):
+        """
+        Function to convert the config to a dict of its configuration
+        values, without the attributes and functions of the class itself.
+        """
+        return {
+            key: value for key, value in self.items()
+            if key.isupper() or not hasattr(self.__class__, key)
+        }
+
     @staticmethod
     def from_dict(dictionary):
         config = Config()
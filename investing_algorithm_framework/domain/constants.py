@@ -13,9 +13,13 @@ DEFAULT_DATABASE_NAME = "database"
 
 RESOURCE_DIRECTORY = "RESOURCE_DIRECTORY"
 BACKTEST_DATA_DIRECTORY_NAME = "BACKTEST_DATA_DIRECTORY_NAME"
+BACKTEST_DATA_STORAGE_FORMAT = "BACKTEST_DATA_STORAGE_FORMAT"
+SNAPSHOT_POLICY = "SNAPSHOT_POLICY"
+SNAPSHOT_INTERVAL = "SNAPSHOT_INTERVAL"
 LOG_LEVEL = 'LOG_LEVEL'
 BASE_DIR = 'BASE_DIR'
 SQLALCHEMY_DATABASE_URI = 'SQLALCHEMY_DATABASE_URI'
+SQLITE_PRAGMAS = "SQLITE_PRAGMAS"
 SQLITE_INITIALIZED = "SQLITE_INITIALIZED"
 SQLALCHEMY_INITIALIZED = "SQLALCHEMY_INITIALIZED"
 
@@ -4,10 +4,15 @@ from .time_interval import TimeInterval
 from .time_unit import TimeUnit
 from .market import MarketCredential
 from .trading_data_types import TradingDataType
+from .backtest_data_storage_format import BacktestDataStorageFormat
+from .snapshot_policy import SnapshotPolicy
 from .trading_time_frame import TradingTimeFrame
 from .portfolio import PortfolioConfiguration, Portfolio, PortfolioSnapshot
 from .position import Position, PositionSnapshot
 from .backtest_profile import BacktestProfile, BacktestPosition
+from .equity_curve import EquityCurve
+from .indicators import Indicator, SMA, EMA, RSI, MACD, ATR, \
+    BollingerBands, RollingMin, RollingMax
 from .strategy_profile import StrategyProfile
 from .trade import Trade
 
@@ -21,11 +26,23 @@ __all__ = [
     "TimeUnit",
     "TradingTimeFrame",
     "TradingDataType",
+    "BacktestDataStorageFormat",
+    "SnapshotPolicy",
     "PortfolioConfiguration",
     "Position",
     "Portfolio",
     "OrderFee",
     "BacktestProfile",
+    "EquityCurve",
+    "Indicator",
+    "SMA",
+    "EMA",
+    "RSI",
+    "MACD",
+    "ATR",
+    "BollingerBands",
+    "RollingMin",
+    "RollingMax",
     "PositionSnapshot",
     "PortfolioSnapshot",
     "StrategyProfile",
@@ -0,0 +1,50 @@
+from enum import Enum
+
+
+class BacktestDataStorageFormat(Enum):
+    CSV = "CSV"
+    ARROW = "ARROW"
+
+    @staticmethod
+    def from_value(value):
+
+        if isinstance(value, BacktestDataStorageFormat):
+            for storage_format in BacktestDataStorageFormat:
+
+                if value == storage_format:
+                    return storage_format
+
+        elif isinstance(value, str):
+            return BacktestDataStorageFormat.from_string(value)
+
+        raise ValueError(
+            "Could not convert value to backtest data storage format"
+        )
+
+    @staticmethod
+    def from_string(value: str):
+
+        if isinstance(value, str):
+            for storage_format in BacktestDataStorageFormat:
+
+                if value.upper() == storage_format.value:
+                    return storage_format
+
+        raise ValueError(
+            "Could not convert value to backtest data storage format"
+        )
+
+    @property
+    def file_extension(self):
+        return self.value.lower()
+
+    def equals(self, other):
+
+        if other is None:
+            return False
+
+        if isinstance(other, Enum):
+            return self.value == other.value
+
+        else:
+            return BacktestDataStorageFormat.from_string(other) == self
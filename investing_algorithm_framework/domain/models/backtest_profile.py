@@ -132,7 +132,16 @@ class BacktestProfile(BaseModel):
         positions=None,
         average_trade_duration=0,
         average_trade_size=0.0,
-        trades=None
+        trades=None,
+        max_drawdown=0.0,
+        max_drawdown_duration=0.0,
+        sharpe_ratio=0.0,
+        sortino_ratio=0.0,
+        calmar_ratio=0.0,
+        volatility=0.0,
+        exposure=0.0,
+        equity_curve=None,
+        number_of_skipped_runs=0
     ):
         self._portfolio_id = portfolio_id
         self._interval = interval
@@ -142,6 +151,7 @@ class BacktestProfile(BaseModel):
         self._backtest_end_date = backtest_end_date
         self._backtest_index_date = backtest_index_date
         self._number_of_runs = 0
+        self._number_of_skipped_runs = number_of_skipped_runs
         self._trading_time_frame = trading_time_frame
         self._trading_time_frame_start_date = trading_time_frame_start_date
         self._symbols = symbols
@@ -169,6 +179,14 @@ class BacktestProfile(BaseModel):
         self._average_trade_duration = average_trade_duration
         self._average_trade_size = average_trade_size
         self._trades = trades
+        self._max_drawdown = max_drawdown
+        self._max_drawdown_duration = max_drawdown_duration
+        self._sharpe_ratio = sharpe_ratio
+        self._sortino_ratio = sortino_ratio
+        self._calmar_ratio = calmar_ratio
+        self._volatility = volatility
+        self._exposure = exposure
+        self._equity_curve = equity_curve
 
     @property
     def portfolio_id(self):
@@ -262,6 +280,14 @@ class BacktestProfile(BaseModel):
     def number_of_runs(self, value):
         self._number_of_runs = value
 
+    @property
+    def number_of_skipped_runs(self):
+        return self._number_of_skipped_runs
+
+    @number_of_skipped_runs.setter
+    def number_of_skipped_runs(self, value):
+        self._number_of_skipped_runs = value
+
     @trading_time_frame.setter
     def trading_time_frame(self, value):
         self._trading_time_frame = value
@@ -434,6 +460,70 @@ class BacktestProfile(BaseModel):
     def trades(self, value):
         self._trades = value
 
+    @property
+    def max_drawdown(self):
+        return self._max_drawdown
+
+    @max_drawdown.setter
+    def max_drawdown(self, value):
+        self._max_drawdown = value
+
+    @property
+    def max_drawdown_duration(self):
+        return self._max_drawdown_duration
+
+    @max_drawdown_duration.setter
+    def max_drawdown_duration(self, value):
+        self._max_drawdown_duration = value
+
+    @property
+    def sharpe_ratio(self):
+        return self._sharpe_ratio
+
+    @sharpe_ratio.setter
+    def sharpe_ratio(self, value):
+        self._sharpe_ratio = value
+
+    @property
+    def sortino_ratio(self):
+        return self._sortino_ratio
+
+    @sortino_ratio.setter
+    def sortino_ratio(self, value):
+        self._sortino_ratio = value
+
+    @property
+    def calmar_ratio(self):
+        return self._calmar_ratio
+
+    @calmar_ratio.setter
+    def calmar_ratio(self, value):
+        self._calmar_ratio = value
+
+    @property
+    def volatility(self):
+        return self._volatility
+
+    @volatility.setter
+    def volatility(self, value):
+        self._volatility = value
+
+    @property
+    def exposure(self):
+        return self._exposure
+
+    @exposure.setter
+    def exposure(self, value):
+        self._exposure = value
+
+    @property
+    def equity_curve(self):
+        return self._equity_curve
+
+    @equity_curve.setter
+    def equity_curve(self, value):
+        self._equity_curve = value
+
     def get_runs_per_day(self):
 
         if self.time_unit is None:
@@ -0,0 +1,171 @@
+import numpy as np
+
+SECONDS_PER_YEAR = 365 * 24 * 60 * 60
+
+
+class EquityCurve:
+    """
+    Time series of the equity, cash and exposure of a backtest, with one
+    sample per scheduled run. The samples are kept in numpy arrays that
+    grow by doubling, so recording a sample is O(1).
+
+    The exposure of a sample is the fraction of the equity that is
+    allocated to positions.
+    """
+
+    def __init__(self, capacity=1024):
+        capacity = max(capacity, 1)
+        self._size = 0
+        self._timestamps = np.empty(capacity, dtype="datetime64[us]")
+        self._equity = np.empty(capacity, dtype=np.float64)
+        self._cash = np.empty(capacity, dtype=np.float64)
+        self._exposure = np.empty(capacity, dtype=np.float64)
+
+    def __len__(self):
+        return self._size
+
+    @classmethod
+    def from_arrays(cls, timestamps, equity, cash, exposure):
+        """
+        Function to create an equity curve from arrays with a sample per
+        element, for backtests that calculate all samples at once.
+        """
+        equity_curve = cls(capacity=len(equity))
+        equity_curve._size = len(equity)
+        equity_curve._timestamps[:equity_curve._size] = \
+            np.asarray(timestamps).astype("datetime64[us]")
+        equity_curve._equity[:equity_curve._size] = equity
+        equity_curve._cash[:equity_curve._size] = cash
+        equity_curve._exposure[:equity_curve._size] = exposure
+        return equity_curve
+
+    def record(self, timestamp, equity, cash, exposure):
+
+        if self._size == len(self._equity):
+            self._grow()
+
+        self._timestamps[self._size] = np.datetime64(timestamp, "us")
+        self._equity[self._size] = equity
+        self._cash[self._size] = cash
+        self._exposure[self._size] = exposure
+        self._size += 1
+
+    def _grow(self):
+        capacity = len(self._equity) * 2
+
+        for name in ["_timestamps", "_equity", "_cash", "_exposure"]:
+            array = getattr(self, name)
+            grown_array = np.empty(capacity, dtype=array.dtype)
+            grown_array[:self._size] = array[:self._size]
+            setattr(self, name, grown_array)
+
+    @property
+    def timestamps(self):
+        return self._timestamps[:self._size]
+
+    @property
+    def equity(self):
+        return self._equity[:self._size]
+
+    @property
+    def cash(self):
+        return self._cash[:self._size]
+
+    @property
+    def exposure(self):
+        return self._exposure[:self._size]
+
+    def get_drawdowns(self):
+        """
+        Function to get the drawdown of every sample, as a fraction of
+        the highest equity up to that sample.
+        """
+        equity = self.equity
+        peaks = np.maximum.accumulate(equity)
+        return np.divide(
+            peaks - equity,
+            peaks,
+            out=np.zeros_like(equity),
+            where=peaks > 0
+        )
+
+    def get_risk_metrics(self):
+        """
+        Function to calculate the risk metrics of the equity curve.
+
+        Sharpe and sortino ratios use a risk free rate of zero. Ratios
+        and volatility are annualized with the median time between
+        samples. Drawdown, volatility and exposure are percentages, and
+        the drawdown duration is the longest time under a previous
+        equity peak in hours.
+
+        :return: dict with max_drawdown, max_drawdown_duration,
+            sharpe_ratio, sortino_ratio, calmar_ratio, volatility
+            and exposure
+        """
+        metrics = {
+            "max_drawdown": 0.0,
+            "max_drawdown_duration": 0.0,
+            "sharpe_ratio": 0.0,
+            "sortino_ratio": 0.0,
+            "calmar_ratio": 0.0,
+            "volatility": 0.0,
+            "exposure": 0.0,
+        }
+
+        if self._size == 0:
+            return metrics
+
+        equity = self.equity
+        seconds = (self.timestamps - self.timestamps[0]) \
+            / np.timedelta64(1, "s")
+        drawdowns = self.get_drawdowns()
+        max_drawdown = drawdowns.max()
+        metrics["max_drawdown"] = max_drawdown * 100
+        metrics["exposure"] = self.exposure.mean() * 100
+
+        # The start of the current drawdown is the last sample at a peak
+        peak_indexes = np.maximum.accumulate(
+            np.where(drawdowns == 0, np.arange(self._size), 0)
+        )
+        metrics["max_drawdown_duration"] = \
+            (seconds - seconds[peak_indexes]).max() / 3600
+
+        if self._size > 1 and equity[0] > 0:
+            self._add_return_metrics(metrics, equity, seconds, max_drawdown)
+
+        return {key: float(value) for key, value in metrics.items()}
+
+    def _add_return_metrics(self, metrics, equity, seconds, max_drawdown):
+        returns = np.divide(
+            np.diff(equity),
+            equity[:-1],
+            out=np.zeros(self._size - 1),
+            where=equity[:-1] != 0
+        )
+        intervals = np.diff(seconds)
+        intervals = intervals[intervals > 0]
+
+        if len(intervals) == 0:
+            return
+
+        periods_per_year = SECONDS_PER_YEAR / np.median(intervals)
+        mean_return = returns.mean()
+        standard_deviation = returns.std()
+        downside_deviation = np.sqrt(np.mean(np.minimum(returns, 0) ** 2))
+        metrics["volatility"] = \
+            standard_deviation * np.sqrt(periods_per_year) * 100
+
+        if standard_deviation > 0:
+            metrics["sharpe_ratio"] = mean_return / standard_deviation \
+                * np.sqrt(periods_per_year)
+
+        if downside_deviation > 0:
+            metrics["sortino_ratio"] = mean_return / downside_deviation \
+                * np.sqrt(periods_per_year)
+
+        years = seconds[-1] / SECONDS_PER_YEAR
+
+        if max_drawdown > 0 and years > 0 and equity[-1] > 0:
+            annual_return = (equity[-1] / equity[0]) ** (1 / years) - 1
+            metrics["calmar_ratio"] = annual_return / max_drawdown
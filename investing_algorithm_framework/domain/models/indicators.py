@@ -0,0 +1,611 @@
+from collections import deque
+from math import sqrt
+
+import polars
+
+from investing_algorithm_framework.domain.utils import OHLCV_COLUMN_NAMES
+
+
+class Indicator:
+    """
+    Base class of the streaming indicators. An indicator follows the
+    OHLCV data of one market data source, and is updated with the
+    candles that are newer than the candles it has already seen, so
+    every update is O(new candles) instead of O(window).
+
+    The last candle of the data can still be open, so it is not added
+    to the state of the indicator. Its value is calculated on top of the
+    state, and the candle is only added once a newer candle arrives.
+    When the data is older than the last seen candle, e.g. when a new
+    backtest starts, the indicator is reset.
+
+    Subclasses implement _update, which calculates the value of the
+    indicator for a candle, and only changes the state when commit
+    is True.
+
+    In backtests the whole history is known up front, so subclasses
+    also implement _create_expressions, the polars expressions of the
+    indicator over all candles. When the data contains these
+    precomputed columns, an update is a lookup of the last row.
+    """
+    prefix = None
+    outputs = None
+
+    def __init__(self, market_data_source, name=None):
+        self.market_data_source = market_data_source
+        self._name = name
+        self.reset()
+
+    @property
+    def name(self):
+
+        if self._name is not None:
+            return self._name
+
+        return self.key
+
+    @property
+    def params(self):
+        return []
+
+    @property
+    def key(self):
+        """
+        Key of the type and params of the indicator, used to name its
+        precomputed columns.
+        """
+        key = [self.prefix] + [str(param) for param in self.params]
+        column = getattr(self, "column", "Close")
+
+        if column != "Close":
+            key.append(column.lower())
+
+        return "_".join(key)
+
+    @property
+    def column_names(self):
+
+        if self.outputs is None:
+            return [self.key]
+
+        return [f"{self.key}_{output}" for output in self.outputs]
+
+    def create_columns(self):
+        """
+        Function to get the polars expressions that calculate the
+        columns of the indicator over all candles of OHLCV data.
+        """
+        return [
+            expression.alias(column_name) for expression, column_name
+            in zip(self._create_expressions(), self.column_names)
+        ]
+
+    def _create_expressions(self):
+        raise NotImplementedError("Create expressions is not implemented")
+
+    def reset(self):
+        self.value = None
+        self.previous_value = None
+        self._last_datetime = None
+        self._reset()
+
+    def _reset(self):
+        pass
+
+    def _update(self, candle, commit):
+        raise NotImplementedError("Update is not implemented")
+
+    def update(self, data):
+        """
+        Function to update the indicator with the candles of OHLCV data
+        that it has not seen yet.
+
+        :param data: polars dataframe (or list of rows) with the
+            Datetime, Open, High, Low, Close and Volume columns
+        :return: the value of the indicator for the last candle
+        """
+
+        if data is None or len(data) == 0:
+            return self.value
+
+        if not isinstance(data, polars.DataFrame):
+            data = polars.DataFrame(
+                data, schema=OHLCV_COLUMN_NAMES, orient="row"
+            )
+
+        if self.column_names[0] in data.columns:
+            self.value = self._get_precomputed_value(data, len(data) - 1)
+            self.previous_value = \
+                self._get_precomputed_value(data, len(data) - 2)
+            return self.value
+
+        datetimes = data["Datetime"]
+
+        if self._last_datetime is not None:
+
+            if datetimes[-1] < self._last_datetime:
+                self.reset()
+            else:
+                data = data.slice(
+                    datetimes.search_sorted(
+                        polars.Series([self._last_datetime])
+                        .cast(datetimes.dtype),
+                        side="right"
+                    )[0]
+                )
+
+        candles = list(data.iter_rows(named=True))
+
+        if len(candles) == 0:
+            return self.value
+
+        for candle in candles[:-1]:
+            self.previous_value = self._update(candle, commit=True)
+            self._last_datetime = candle["Datetime"]
+
+        self.value = self._update(candles[-1], commit=False)
+        return self.value
+
+    def _get_precomputed_value(self, data, index):
+
+        if index < 0 or data[self.column_names[0]][index] is None:
+            return None
+
+        if self.outputs is None:
+            return data[self.column_names[0]][index]
+
+        return {
+            output: data[column_name][index] for output, column_name
+            in zip(self.outputs, self.column_names)
+        }
+
+
+def _wilder_average(expression, period, offset=0):
+    """
+    Function to create the expression of Wilder's moving average, which
+    starts with the simple average of the first period values from the
+    offset.
+    """
+    index = polars.int_range(0, polars.len())
+    first_index = offset + period - 1
+    return polars.when(index == first_index)\
+        .then(expression.rolling_mean(period))\
+        .when(index > first_index)\
+        .then(expression)\
+        .otherwise(None)\
+        .ewm_mean(alpha=1 / period, adjust=False)
+
+
+class SMA(Indicator):
+    """
+    Simple moving average of a column. The sum of the window is kept
+    up to date, so an update is O(1).
+    """
+    prefix = "sma"
+
+    def __init__(self, market_data_source, period, column="Close", name=None):
+        self.period = period
+        self.column = column
+        super().__init__(market_data_source, name)
+
+    @property
+    def params(self):
+        return [self.period]
+
+    def _reset(self):
+        self._window = deque(maxlen=self.period)
+        self._total = 0.0
+
+    def _update(self, candle, commit):
+        return self._update_value(candle[self.column], commit)
+
+    def _update_value(self, value, commit):
+        total = self._total + value
+        size = len(self._window) + 1
+
+        if size > self.period:
+            total -= self._window[0]
+            size = self.period
+
+        if commit:
+            self._window.append(value)
+            self._total = total
+
+        if size < self.period:
+            return None
+
+        return total / self.period
+
+    def _create_expressions(self):
+        return [polars.col(self.column).rolling_mean(self.period)]
+
+
+class EMA(Indicator):
+    """
+    Exponential moving average of a column, with a smoothing factor of
+    2 / (period + 1). The average starts at the first value.
+    """
+    prefix = "ema"
+
+    def __init__(self, market_data_source, period, column="Close", name=None):
+        self.period = period
+        self.column = column
+        self.alpha = 2 / (period + 1)
+        super().__init__(market_data_source, name)
+
+    @property
+    def params(self):
+        return [self.period]
+
+    def _reset(self):
+        self._average = None
+
+    def _update(self, candle, commit):
+        return self._update_value(candle[self.column], commit)
+
+    def _update_value(self, value, commit):
+
+        if self._average is None:
+            average = value
+        else:
+            average = self._average + self.alpha * (value - self._average)
+
+        if commit:
+            self._average = average
+
+        return average
+
+    def _create_expressions(self):
+        return [
+            polars.col(self.column).ewm_mean(alpha=self.alpha, adjust=False)
+        ]
+
+
+class RSI(Indicator):
+    """
+    Relative strength index of a column with Wilder's smoothing. The
+    first average gain and loss are the mean of the first period
+    changes, so the first value is available after period + 1 candles.
+    """
+    prefix = "rsi"
+
+    def __init__(
+        self, market_data_source, period=14, column="Close", name=None
+    ):
+        self.period = period
+        self.column = column
+        super().__init__(market_data_source, name)
+
+    @property
+    def params(self):
+        return [self.period]
+
+    def _reset(self):
+        self._previous = None
+        self._changes = 0
+        self._gain = 0.0
+        self._loss = 0.0
+
+    def _update(self, candle, commit):
+        value = candle[self.column]
+
+        if self._previous is None:
+
+            if commit:
+                self._previous = value
+
+            return None
+
+        change = value - self._previous
+        gain = max(change, 0)
+        loss = max(-change, 0)
+        changes = self._changes + 1
+
+        if changes <= self.period:
+            # Sums of the first period changes, averaged at the last one
+            gain += self._gain
+            loss += self._loss
+
+            if changes == self.period:
+                gain /= self.period
+                loss /= self.period
+        else:
+            gain = (self._gain * (self.period - 1) + gain) / self.period
+            loss = (self._loss * (self.period - 1) + loss) / self.period
+
+        if commit:
+            self._previous = value
+            self._changes = changes
+            self._gain = gain
+            self._loss = loss
+
+        if changes < self.period:
+            return None
+
+        if gain + loss == 0:
+            return 50.0
+
+        return 100 * gain / (gain + loss)
+
+    def _create_expressions(self):
+        change = polars.col(self.column).diff()
+        gain = _wilder_average(change.clip(lower_bound=0), self.period, 1)
+        loss = _wilder_average(
+            (-change).clip(lower_bound=0), self.period, 1
+        )
+        return [
+            polars.when(gain + loss == 0)
+            .then(50.0)
+            .otherwise(100 * gain / (gain + loss))
+        ]
+
+
+class MACD(Indicator):
+    """
+    Moving average convergence divergence of a column. The value is a
+    dict with the macd line, the signal line and their difference, the
+    histogram. Values are available once the slow average has seen
+    slow_period candles.
+    """
+    prefix = "macd"
+    outputs = ["macd", "signal", "histogram"]
+
+    def __init__(
+        self,
+        market_data_source,
+        fast_period=12,
+        slow_period=26,
+        signal_period=9,
+        column="Close",
+        name=None
+    ):
+        self.column = column
+        self._fast = EMA(market_data_source, fast_period)
+        self._slow = EMA(market_data_source, slow_period)
+        self._signal = EMA(market_data_source, signal_period)
+        super().__init__(market_data_source, name)
+
+    @property
+    def params(self):
+        return [self._fast.period, self._slow.period, self._signal.period]
+
+    def _reset(self):
+        self._fast.reset()
+        self._slow.reset()
+        self._signal.reset()
+        self._size = 0
+
+    def _update(self, candle, commit):
+        value = candle[self.column]
+        macd = self._fast._update_value(value, commit) \
+            - self._slow._update_value(value, commit)
+        size = self._size + 1
+
+        if commit:
+            self._size = size
+
+        if size < self._slow.period:
+            return None
+
+        signal = self._signal._update_value(macd, commit)
+        return {
+            "macd": macd,
+            "signal": signal,
+            "histogram": macd - signal,
+        }
+
+    def _create_expressions(self):
+        column = polars.col(self.column)
+        macd = polars.when(
+            polars.int_range(0, polars.len()) >= self._slow.period - 1
+        ).then(
+            column.ewm_mean(alpha=self._fast.alpha, adjust=False)
+            - column.ewm_mean(alpha=self._slow.alpha, adjust=False)
+        ).otherwise(None)
+        signal = macd.ewm_mean(alpha=self._signal.alpha, adjust=False)
+        return [macd, signal, macd - signal]
+
+
+class ATR(Indicator):
+    """
+    Average true range with Wilder's smoothing. The first average is
+    the mean of the first period true ranges.
+    """
+    prefix = "atr"
+
+    def __init__(self, market_data_source, period=14, name=None):
+        self.period = period
+        super().__init__(market_data_source, name)
+
+    @property
+    def params(self):
+        return [self.period]
+
+    def _reset(self):
+        self._previous_close = None
+        self._size = 0
+        self._average = 0.0
+
+    def _update(self, candle, commit):
+        high = candle["High"]
+        low = candle["Low"]
+        true_range = high - low
+
+        if self._previous_close is not None:
+            true_range = max(
+                true_range,
+                abs(high - self._previous_close),
+                abs(low - self._previous_close)
+            )
+
+        size = self._size + 1
+
+        if size <= self.period:
+            average = self._average + true_range
+
+            if size == self.period:
+                average /= self.period
+        else:
+            average = (self._average * (self.period - 1) + true_range) \
+                / self.period
+
+        if commit:
+            self._previous_close = candle["Close"]
+            self._size = size
+            self._average = average
+
+        if size < self.period:
+            return None
+
+        return average
+
+    def _create_expressions(self):
+        previous_close = polars.col("Close").shift(1)
+        true_range = polars.max_horizontal(
+            polars.col("High") - polars.col("Low"),
+            (polars.col("High") - previous_close).abs(),
+            (polars.col("Low") - previous_close).abs()
+        )
+        return [_wilder_average(true_range, self.period)]
+
+
+class BollingerBands(Indicator):
+    """
+    Bollinger bands of a column. The value is a dict with the lower,
+    middle and upper band, where the middle band is the simple moving
+    average and the bands are number_of_std population standard
+    deviations away from it.
+    """
+    prefix = "bollinger_bands"
+    outputs = ["lower", "middle", "upper"]
+
+    def __init__(
+        self,
+        market_data_source,
+        period=20,
+        number_of_std=2,
+        column="Close",
+        name=None
+    ):
+        self.period = period
+        self.number_of_std = number_of_std
+        self.column = column
+        super().__init__(market_data_source, name)
+
+    @property
+    def params(self):
+        return [self.period, self.number_of_std]
+
+    def _reset(self):
+        self._window = deque(maxlen=self.period)
+        self._total = 0.0
+        self._total_of_squares = 0.0
+
+    def _update(self, candle, commit):
+        value = candle[self.column]
+        total = self._total + value
+        total_of_squares = self._total_of_squares + value ** 2
+        size = len(self._window) + 1
+
+        if size > self.period:
+            total -= self._window[0]
+            total_of_squares -= self._window[0] ** 2
+            size = self.period
+
+        if commit:
+            self._window.append(value)
+            self._total = total
+            self._total_of_squares = total_of_squares
+
+        if size < self.period:
+            return None
+
+        mean = total / self.period
+        variance = max(total_of_squares / self.period - mean ** 2, 0)
+        width = self.number_of_std * sqrt(variance)
+        return {
+            "lower": mean - width,
+            "middle": mean,
+            "upper": mean + width,
+        }
+
+    def _create_expressions(self):
+        mean = polars.col(self.column).rolling_mean(self.period)
+        width = self.number_of_std \
+            * polars.col(self.column).rolling_std(self.period, ddof=0)
+        return [mean - width, mean, mean + width]
+
+
+class RollingMax(Indicator):
+    """
+    Highest value of a column in the last period candles. The candidates
+    are kept in a monotonic queue, so an update is amortized O(1).
+    """
+    prefix = "rolling_max"
+
+    def __init__(
+        self, market_data_source, period, column="Close", name=None
+    ):
+        self.period = period
+        self.column = column
+        super().__init__(market_data_source, name)
+
+    @property
+    def params(self):
+        return [self.period]
+
+    def _reset(self):
+        self._candidates = deque()
+        self._size = 0
+
+    def _is_replaced_by(self, candidate, value):
+        return candidate <= value
+
+    def _update(self, candle, commit):
+        value = candle[self.column]
+        index = self._size
+        candidates = self._candidates
+
+        # The oldest candidate drops out of the window of this candle
+        first = 1 if len(candidates) > 0 \
+            and candidates[0][0] <= index - self.period else 0
+
+        if commit:
+
+            if first:
+                candidates.popleft()
+
+            while len(candidates) > 0 \
+                    and self._is_replaced_by(candidates[-1][1], value):
+                candidates.pop()
+
+            candidates.append((index, value))
+            self._size += 1
+            result = candidates[0][1]
+        elif len(candidates) > first \
+                and not self._is_replaced_by(candidates[first][1], value):
+            result = candidates[first][1]
+        else:
+            result = value
+
+        if index + 1 < self.period:
+            return None
+
+        return result
+
+    def _create_expressions(self):
+        return [polars.col(self.column).rolling_max(self.period)]
+
+
+class RollingMin(RollingMax):
+    """
+    Lowest value of a column in the last period candles. The candidates
+    are kept in a monotonic queue, so an update is amortized O(1).
+    """
+    prefix = "rolling_min"
+
+    def _is_replaced_by(self, candidate, value):
+        return candidate >= value
+
+    def _create_expressions(self):
+        return [polars.col(self.column).rolling_min(self.period)]
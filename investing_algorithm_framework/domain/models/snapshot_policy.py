@@ -0,0 +1,50 @@
+from enum import Enum
+
+
+class SnapshotPolicy(Enum):
+    """
+    Policy for writing portfolio snapshots.
+
+    ORDER writes a snapshot for every order event, TICK writes at most
+    one snapshot per portfolio per run of the algorithm, and INTERVAL
+    writes at most one snapshot per portfolio per snapshot interval.
+    """
+    ORDER = "ORDER"
+    TICK = "TICK"
+    INTERVAL = "INTERVAL"
+
+    @staticmethod
+    def from_value(value):
+
+        if isinstance(value, SnapshotPolicy):
+            for snapshot_policy in SnapshotPolicy:
+
+                if value == snapshot_policy:
+                    return snapshot_policy
+
+        elif isinstance(value, str):
+            return SnapshotPolicy.from_string(value)
+
+        raise ValueError("Could not convert value to snapshot policy")
+
+    @staticmethod
+    def from_string(value: str):
+
+        if isinstance(value, str):
+            for snapshot_policy in SnapshotPolicy:
+
+                if value.upper() == snapshot_policy.value:
+                    return snapshot_policy
+
+        raise ValueError("Could not convert value to snapshot policy")
+
+    def equals(self, other):
+
+        if other is None:
+            return False
+
+        if isinstance(other, Enum):
+            return self.value == other.value
+
+        else:
+            return SnapshotPolicy.from_string(other) == self
@@ -1,6 +1,5 @@
 import logging
 import os
-import csv
 from abc import abstractmethod, ABC
 from datetime import datetime, timedelta
 from typing import Callable
@@ -8,13 +7,15 @@ from typing import Callable
 import polars
 
 from investing_algorithm_framework.domain import TimeFrame, \
-    OperationalException
+    OperationalException, BacktestDataStorageFormat, DATETIME_FORMAT, \
+    BACKTEST_DATA_STORAGE_FORMAT
 
 logger = logging.getLogger(__name__)
 
 
 class BacktestMarketDataSource(ABC):
     column_names = []
+    storage_format = BacktestDataStorageFormat.CSV
 
     def __init__(
         self,
@@ -34,6 +35,17 @@ class BacktestMarketDataSource(ABC):
         self._backtest_data_start_date = backtest_data_start_date
         self._backtest_data_index_date = backtest_data_index_date
 
+    def set_storage_format(self, config):
+        """
+        Function to set the storage format of the backtest data files
+        with the BACKTEST_DATA_STORAGE_FORMAT value of the given config.
+        """
+        storage_format = config.get(BACKTEST_DATA_STORAGE_FORMAT)
+
+        if storage_format is not None:
+            self.storage_format = BacktestDataStorageFormat\
+                .from_value(storage_format)
+
     def _data_source_exists(self, file_path):
         """
         Function to check if the data source exists.
@@ -44,14 +56,23 @@ class BacktestMarketDataSource(ABC):
         are correct. If the file does not exist or the column names are not
         correct, this function will return False.
 
+        For arrow files only the schema in the metadata of the file is
+        read, for csv files only the header and the first row.
+
         This function prevents the backtest datasource to download the data
         every time the backtest is run.
         """
         try:
             if os.path.isfile(file_path):
-                df = polars.read_csv(file_path)
 
-                if df.columns != self.column_names:
+                if BacktestDataStorageFormat.ARROW.equals(
+                    self.storage_format
+                ):
+                    columns = list(polars.read_ipc_schema(file_path).keys())
+                else:
+                    columns = polars.read_csv(file_path, n_rows=1).columns
+
+                if columns != self.column_names:
                     raise OperationalException(
                         f"Wrong column names on {file_path}, required "
                         f"column names are {self.column_names}"
@@ -67,16 +88,76 @@ class BacktestMarketDataSource(ABC):
 
     def write_data_to_file_path(self, data_file, data):
         """
-        Function to write data to a csv file.
-        This function will write the column names and all the data to the
-        file.
+        Function to write data to a csv or arrow file, depending on the
+        storage format. This function will write the column names and all
+        the data to the file.
+
+        The data is either a polars dataframe or a list of rows. Arrow
+        files are written uncompressed with a datetime column and float
+        columns, so they can be memory mapped when they are read.
+        """
+        datetime_column = self.column_names[0]
+
+        if isinstance(data, polars.DataFrame):
+            df = data.select(self.column_names).with_columns(
+                polars.col(self.column_names[1:]).cast(polars.Float64)
+            )
+        else:
+            schema = {
+                column_name: polars.Float64
+                for column_name in self.column_names
+            }
+            schema[datetime_column] = polars.Datetime
+            df = polars.DataFrame(data, schema=schema, orient="row")
+
+        if BacktestDataStorageFormat.ARROW.equals(self.storage_format):
+            df.write_ipc(data_file, compression="uncompressed")
+            return
+
+        df.with_columns(
+            polars.col(datetime_column).dt.strftime(DATETIME_FORMAT)
+        ).write_csv(data_file)
+
+    def read_data_from_file_path(self, data_file):
+        """
+        Function to read the data of a csv or arrow file, depending on the
+        storage format, into a polars dataframe sorted on its datetime
+        column.
+
+        Arrow files are memory mapped, so processes that read the same
+        file share its pages. The data is only sorted (and copied) when
+        the file is not sorted yet.
         """
-        with open(data_file, "w") as file:
-            column_headers = self.column_names
-            writer = csv.writer(file)
-            writer.writerow(column_headers)
-            rows = data
-            writer.writerows(rows)
+        datetime_column = self.column_names[0]
+
+        if BacktestDataStorageFormat.ARROW.equals(self.storage_format):
+            df = polars.read_ipc(
+                data_file, columns=self.column_names, memory_map=True
+            )
+        else:
+            df = polars.read_csv(
+                data_file, columns=self.column_names, separator=","
+            )
+            df = df.with_columns(
+                polars.col(datetime_column).str.strptime(
+                    polars.Datetime, DATETIME_FORMAT
+                )
+            )
+
+        if not df[datetime_column].is_sorted():
+            df = df.sort(datetime_column)
+
+        return df
+
+    def export_data_to_csv(self, data_file, csv_file):
+        """
+        Function to export the data of a backtest data file to a csv
+        file with the column names as header.
+        """
+        df = self.read_data_from_file_path(data_file)
+        df.with_columns(
+            polars.col(self.column_names[0]).dt.strftime(DATETIME_FORMAT)
+        ).write_csv(csv_file)
 
     @abstractmethod
     def prepare_data(
@@ -123,6 +204,16 @@ class BacktestMarketDataSource(ABC):
     def empty(self):
         pass
 
+    def get_update_timestamps(self):
+        """
+        Function to get the sorted timestamps at which get_data starts
+        to return new data, as a numpy datetime64 array. Returns None
+        when this is not known for the data source, so strategies that
+        use the data source are never skipped by a sparse backtest
+        schedule.
+        """
+        return None
+
     @property
     def market_credential_service(self):
         return self._market_credential_service
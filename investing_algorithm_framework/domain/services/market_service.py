@@ -39,6 +39,18 @@ class MarketService(ABC):
     def get_order(self, order, market):
         pass
 
+    def get_order_updates(self, orders, market):
+        """
+        Function to retrieve the current state of the given orders from
+        the market. Market services that can retrieve multiple orders at
+        once should override this method.
+
+        :param orders: list of orders with an external id
+        :param market: the market of the orders
+        :return: list of orders in the same order as the given orders
+        """
+        return [self.get_order(order, market) for order in orders]
+
     @abstractmethod
     def get_orders(self, symbol, market, since: datetime = None):
         pass
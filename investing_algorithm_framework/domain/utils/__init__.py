@@ -4,6 +4,8 @@ from .synchronized import synchronized
 from .csv import get_total_amount_of_rows, append_dict_as_row_to_csv, \
     add_column_headers_to_csv, csv_to_list
 from .backtesting import pretty_print_backtest
+from .ohlcv import create_ohlcv_data_frame, OHLCV_COLUMN_NAMES, \
+    resample_ohlcv_data_frame
 
 __all__ = [
     'synchronized',
@@ -13,5 +15,8 @@ __all__ = [
     'append_dict_as_row_to_csv',
     'add_column_headers_to_csv',
     'csv_to_list',
-    'pretty_print_backtest'
+    'pretty_print_backtest',
+    'create_ohlcv_data_frame',
+    'OHLCV_COLUMN_NAMES',
+    'resample_ohlcv_data_frame',
 ]
@@ -14,6 +14,9 @@ def pretty_print_backtest(backtest_report, show_positions=True, show_trades=True
     print(f"* End date: {backtest_report.backtest_end_date}")
     print(f"* Number of days: {backtest_report.number_of_days}")
     print(f"* Number of runs: {backtest_report.number_of_runs}")
+
+    if backtest_report.number_of_skipped_runs > 0:
+        print(f"* Number of skipped runs: {backtest_report.number_of_skipped_runs}")
     print("====================Portfolio overview============================")
     print(f"* Number of orders: {backtest_report.number_of_orders}")
     print(f"* Initial balance: "
@@ -29,6 +32,16 @@ def pretty_print_backtest(backtest_report, show_positions=True, show_trades=True
           f"{float(backtest_report.growth_rate):.{precision}f}%")
     print(f"* Growth {backtest_report.growth:.{precision}f} "
           f"{backtest_report.trading_symbol}")
+    print("====================Risk overview=================================")
+    print(f"* Max drawdown: "
+          f"{backtest_report.max_drawdown:.{precision}f}%")
+    print(f"* Max drawdown duration: "
+          f"{backtest_report.max_drawdown_duration:.{precision}f} hours")
+    print(f"* Sharpe ratio: {backtest_report.sharpe_ratio:.{precision}f}")
+    print(f"* Sortino ratio: {backtest_report.sortino_ratio:.{precision}f}")
+    print(f"* Calmar ratio: {backtest_report.calmar_ratio:.{precision}f}")
+    print(f"* Volatility: {backtest_report.volatility:.{precision}f}%")
+    print(f"* Exposure: {backtest_report.exposure:.{precision}f}%")
 
     if show_positions:
         print("====================Positions overview========================")
@@ -0,0 +1,87 @@
+import polars
+
+from investing_algorithm_framework.domain.models.time_frame import TimeFrame
+
+OHLCV_COLUMN_NAMES = ["Datetime", "Open", "High", "Low", "Close", "Volume"]
+
+
+def create_ohlcv_data_frame(timestamps, values):
+    """
+    Function to create a polars dataframe with OHLCV data from an int64
+    array with timestamps in milliseconds and a float64 array with a row
+    of open, high, low, close and volume for every timestamp.
+
+    The timestamps are converted with a single cast to a datetime column
+    in microseconds, the column type of the backtest OHLCV data.
+    """
+    return polars.DataFrame(
+        {
+            "Datetime": polars.Series(timestamps, dtype=polars.Int64)
+            .cast(polars.Datetime("ms"))
+            .cast(polars.Datetime("us")),
+            "Open": values[:, 0],
+            "High": values[:, 1],
+            "Low": values[:, 2],
+            "Close": values[:, 3],
+            "Volume": values[:, 4],
+        }
+    )
+
+
+def _get_duration(timeframe):
+    timeframe = TimeFrame.from_value(timeframe)
+
+    if TimeFrame.ONE_MONTH.equals(timeframe):
+        return "1mo"
+
+    if TimeFrame.ONE_YEAR.equals(timeframe):
+        return "1y"
+
+    if TimeFrame.ONE_WEEK.equals(timeframe):
+        return "1w"
+
+    if TimeFrame.ONE_DAY.equals(timeframe):
+        return "1d"
+
+    return f"{timeframe.amount_of_minutes}m"
+
+
+def resample_ohlcv_data_frame(data, timeframe):
+    """
+    Function to resample a polars dataframe with OHLCV data to a coarser
+    timeframe in a single group by over the datetime column.
+
+    Candles start at multiples of the timeframe since the epoch, weeks
+    on mondays, like the candles of exchanges. Of every candle the open
+    is the first open, the high the highest high, the low the lowest
+    low, the close the last close and the volume the summed volume. A
+    first candle that starts before the data is dropped, because its
+    prices are incomplete.
+
+    :param data: polars dataframe with OHLCV data sorted on datetime
+    :param timeframe: the timeframe of the candles of the result
+    :return: polars dataframe with the OHLCV columns
+    """
+    resampled = data.select(OHLCV_COLUMN_NAMES)\
+        .with_columns(polars.col("Datetime").alias("First datetime"))\
+        .set_sorted("Datetime")\
+        .group_by_dynamic(
+            "Datetime",
+            every=_get_duration(timeframe),
+            closed="left",
+            label="left"
+        )\
+        .agg(
+            polars.col("Open").first(),
+            polars.col("High").max(),
+            polars.col("Low").min(),
+            polars.col("Close").last(),
+            polars.col("Volume").sum(),
+            polars.col("First datetime").first(),
+        )
+
+    if len(resampled) > 0 \
+            and resampled["First datetime"][0] != resampled["Datetime"][0]:
+        resampled = resampled.slice(1)
+
+    return resampled.select(OHLCV_COLUMN_NAMES)
@@ -1,14 +1,18 @@
 from .repositories import SQLOrderRepository, SQLPositionRepository, \
     SQLPortfolioRepository, SQLOrderFeeRepository, \
-    SQLPortfolioSnapshotRepository, SQLPositionSnapshotRepository
-from .services import PerformanceService, CCXTMarketService
+    SQLPortfolioSnapshotRepository, SQLPositionSnapshotRepository, \
+    InMemoryOrderRepository, InMemoryPositionRepository, \
+    InMemoryPortfolioRepository, InMemoryOrderFeeRepository, \
+    InMemoryPortfolioSnapshotRepository, InMemoryPositionSnapshotRepository
+from .services import PerformanceService, CCXTMarketService, \
+    AsyncCCXTMarketService, SyncCCXTMarketService
 from .database import setup_sqlalchemy, Session, \
-    create_all_tables
+    create_all_tables, InMemoryDatabase, unit_of_work, remove_sqlite_database
 from .models import SQLPortfolio, SQLOrder, SQLPosition, SQLOrderFee, \
     SQLPortfolioSnapshot, SQLPositionSnapshot, \
     CCXTOHLCVBacktestMarketDataSource, CCXTOrderBookMarketDataSource, \
     CCXTTickerMarketDataSource, CCXTOHLCVMarketDataSource, \
-    CSVOHLCVMarketDataSource, CSVTickerMarketDataSource
+    CSVOHLCVMarketDataSource, CSVTickerMarketDataSource, set_base_timeframes
 
 __all__ = [
     "create_all_tables",
@@ -18,8 +22,17 @@ __all__ = [
     "SQLOrderFeeRepository",
     "SQLPortfolioSnapshotRepository",
     "SQLPositionSnapshotRepository",
+    "InMemoryOrderRepository",
+    "InMemoryPositionRepository",
+    "InMemoryPortfolioRepository",
+    "InMemoryOrderFeeRepository",
+    "InMemoryPortfolioSnapshotRepository",
+    "InMemoryPositionSnapshotRepository",
+    "InMemoryDatabase",
     "setup_sqlalchemy",
     "Session",
+    "unit_of_work",
+    "remove_sqlite_database",
     "SQLPortfolio",
     "SQLOrder",
     "SQLOrderFee",
@@ -32,8 +45,11 @@ __all__ = [
     "CCXTTickerMarketDataSource",
     "CCXTOHLCVMarketDataSource",
     "CCXTMarketService",
+    "AsyncCCXTMarketService",
+    "SyncCCXTMarketService",
     "CSVOHLCVMarketDataSource",
     "CSVTickerMarketDataSource",
     "CCXTOHLCVBacktestMarketDataSource",
     "CCXTOrderBookMarketDataSource",
+    "set_base_timeframes",
 ]
@@ -1,6 +1,10 @@
 from .sql_alchemy import Session, setup_sqlalchemy, SQLBaseModel, \
-    create_all_tables
+    create_all_tables, unit_of_work, get_unit_of_work, UnitOfWork, \
+    remove_sqlite_database
+from .in_memory_database import InMemoryDatabase, copy_model
 
 __all__ = [
-    "Session", "setup_sqlalchemy", "SQLBaseModel", "create_all_tables"
+    "Session", "setup_sqlalchemy", "SQLBaseModel", "create_all_tables",
+    "InMemoryDatabase", "copy_model", "unit_of_work", "get_unit_of_work",
+    "UnitOfWork", "remove_sqlite_database"
 ]
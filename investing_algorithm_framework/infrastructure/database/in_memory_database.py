@@ -0,0 +1,77 @@
+import logging
+
+from sqlalchemy import inspect
+from sqlalchemy.orm import configure_mappers
+
+from .sql_alchemy import Session, SQLBaseModel
+
+logger = logging.getLogger("investing_algorithm_framework")
+
+
+class InMemoryDatabase:
+    """
+    Database that keeps all records in python dictionaries. It is used
+    by the in memory repositories for backtesting, where every round trip
+    to an sql database slows down the backtest.
+
+    Records are stored as transient sql models, so they can be written
+    to the sql database at the end of a backtest with the dump function.
+    """
+
+    def __init__(self):
+        configure_mappers()
+        self._tables = {}
+        self._ids = {}
+
+    def get_table(self, table_name):
+        """
+        Function to get the records of a table, keyed by their id.
+        """
+        return self._tables.setdefault(table_name, {})
+
+    def next_id(self, table_name):
+        """
+        Function to generate the next primary key for a table. Ids start
+        at 1, like the autoincrement ids of the sql database.
+        """
+        self._ids[table_name] = self._ids.get(table_name, 0) + 1
+        return self._ids[table_name]
+
+    def clear(self):
+        self._tables = {}
+        self._ids = {}
+
+    def dump(self):
+        """
+        Function to write all records of the in memory database to the
+        configured sql database. Tables are written in dependency order,
+        so foreign keys always refer to existing records.
+        """
+
+        with Session() as db:
+
+            for table in SQLBaseModel.metadata.sorted_tables:
+                records = self._tables.get(table.name, {})
+                db.add_all(
+                    [copy_model(record) for record in records.values()]
+                )
+
+            db.commit()
+
+
+def copy_model(model):
+    """
+    Function to create a detached copy of an sql model with all its
+    column attributes.
+    """
+    mapper = inspect(type(model))
+    copied_model = mapper.class_manager.new_instance()
+
+    for column_attribute in mapper.column_attrs:
+        setattr(
+            copied_model,
+            column_attribute.key,
+            getattr(model, column_attribute.key)
+        )
+
+    return copied_model
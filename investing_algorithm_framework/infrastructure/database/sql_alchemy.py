@@ -1,13 +1,18 @@
 import logging
+import os
+import threading
+from contextlib import contextmanager
 
-from sqlalchemy import create_engine, StaticPool
+from sqlalchemy import create_engine, event, make_url, QueuePool, \
+    StaticPool
 from sqlalchemy.orm import DeclarativeBase, sessionmaker
 
 from investing_algorithm_framework.domain import SQLALCHEMY_DATABASE_URI, \
-    OperationalException
+    OperationalException, SQLITE_PRAGMAS
 
 Session = sessionmaker()
 logger = logging.getLogger("investing_algorithm_framework")
+_local = threading.local()
 
 
 class SQLAlchemyAdapter:
@@ -20,20 +25,59 @@ class SQLAlchemyAdapter:
 
         global Session
 
-        if app.config[SQLALCHEMY_DATABASE_URI] != "sqlite:///:memory:":
+        database_uri = app.config[SQLALCHEMY_DATABASE_URI]
+        url = make_url(database_uri)
+
+        if url.get_backend_name() != "sqlite":
+            engine = create_engine(database_uri)
+        elif url.database in [None, "", ":memory:"]:
+            # An in memory database only exists within its connection,
+            # so all threads share a single connection
             engine = create_engine(
-                app.config[SQLALCHEMY_DATABASE_URI],
+                database_uri,
                 connect_args={'check_same_thread': False},
                 poolclass=StaticPool
             )
         else:
+            # Every thread checks out its own connection from the pool,
+            # so strategy threads can read while another thread writes
             engine = create_engine(
-                app.config[SQLALCHEMY_DATABASE_URI],
+                database_uri,
+                connect_args={'check_same_thread': False},
+                poolclass=QueuePool
             )
+            pragmas = app.config.get(SQLITE_PRAGMAS)
+
+            if pragmas:
+                event.listen(
+                    engine, "connect", create_pragma_listener(pragmas)
+                )
+
+        previous_engine = Session.kw.get("bind")
+
+        if previous_engine is not None:
+            previous_engine.dispose()
 
         Session.configure(bind=engine)
 
 
+def create_pragma_listener(pragmas):
+    """
+    Function to create a connect listener that sets the given pragmas on
+    every new sqlite connection.
+    """
+
+    def set_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+
+        for key, value in pragmas.items():
+            cursor.execute(f"PRAGMA {key}={value}")
+
+        cursor.close()
+
+    return set_pragmas
+
+
 def setup_sqlalchemy(app, throw_exception_if_not_set=True):
 
     try:
@@ -49,5 +93,105 @@ class SQLBaseModel(DeclarativeBase):
     pass
 
 
+def remove_sqlite_database(database_path):
+    """
+    Function to remove a sqlite database file, together with its write
+    ahead log and shared memory files. A log that is left behind would
+    otherwise be replayed into a new database at the same path.
+    """
+    engine = Session.kw.get("bind")
+
+    # Closing the connections checkpoints the write ahead log
+    if engine is not None:
+        engine.dispose()
+
+    for suffix in ["", "-wal", "-shm"]:
+        path = f"{database_path}{suffix}"
+
+        if os.path.exists(path):
+            os.remove(path)
+
+
 def create_all_tables():
-    SQLBaseModel.metadata.create_all(bind=Session().bind)
+    bind = Session().bind
+    SQLBaseModel.metadata.create_all(bind=bind)
+
+    # Tables of existing databases are skipped by create_all, so indexes
+    # that were added to the models later are created separately
+    for table in SQLBaseModel.metadata.sorted_tables:
+
+        for index in table.indexes:
+            index.create(bind=bind, checkfirst=True)
+
+
+class UnitOfWork:
+    """
+    Transaction that is shared by all repository operations of a thread.
+    The session is only created once a repository uses it, so units of
+    work around in memory repositories never touch the database.
+    """
+
+    def __init__(self):
+        self._session = None
+
+    @property
+    def session(self):
+
+        # The models of the unit of work are used after the commit, so
+        # they are not expired
+        if self._session is None:
+            self._session = Session(expire_on_commit=False)
+
+        return self._session
+
+    def commit(self):
+
+        if self._session is not None:
+            self._session.commit()
+
+    def rollback(self):
+
+        if self._session is not None:
+            self._session.rollback()
+
+    def close(self):
+
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+
+
+def get_unit_of_work():
+    """
+    Function to get the active unit of work of the current thread, or
+    None if there is no active unit of work.
+    """
+    return getattr(_local, "unit_of_work", None)
+
+
+@contextmanager
+def unit_of_work():
+    """
+    Context manager that runs all repository operations of the current
+    thread in one transaction. The transaction is committed when the
+    outermost unit of work exits and rolled back on an exception. Nested
+    units of work join the outer one.
+    """
+    active_unit_of_work = get_unit_of_work()
+
+    if active_unit_of_work is not None:
+        yield active_unit_of_work
+        return
+
+    active_unit_of_work = UnitOfWork()
+    _local.unit_of_work = active_unit_of_work
+
+    try:
+        yield active_unit_of_work
+        active_unit_of_work.commit()
+    except BaseException:
+        active_unit_of_work.rollback()
+        raise
+    finally:
+        _local.unit_of_work = None
+        active_unit_of_work.close()
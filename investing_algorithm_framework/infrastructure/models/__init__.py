@@ -4,7 +4,7 @@ from .position import SQLPosition, SQLPositionSnapshot
 from .market_data_sources import CCXTOrderBookMarketDataSource, \
     CCXTTickerMarketDataSource, CCXTOHLCVMarketDataSource, \
     CCXTOHLCVBacktestMarketDataSource, CSVOHLCVMarketDataSource, \
-    CSVTickerMarketDataSource
+    CSVTickerMarketDataSource, set_base_timeframes
 
 __all__ = [
     "SQLOrder",
@@ -19,4 +19,5 @@ __all__ = [
     "CCXTOHLCVMarketDataSource",
     "CSVTickerMarketDataSource",
     "CSVOHLCVMarketDataSource",
+    "set_base_timeframes",
 ]
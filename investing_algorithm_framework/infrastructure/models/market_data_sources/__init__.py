@@ -1,6 +1,7 @@
 from .ccxt import CCXTOrderBookMarketDataSource, CCXTTickerMarketDataSource, \
     CCXTOHLCVMarketDataSource, CCXTOHLCVBacktestMarketDataSource
 from .csv import CSVOHLCVMarketDataSource, CSVTickerMarketDataSource
+from .resampling import set_base_timeframes
 
 __all__ = [
     'CCXTOrderBookMarketDataSource',
@@ -8,5 +9,6 @@ __all__ = [
     'CCXTOHLCVMarketDataSource',
     "CCXTOHLCVBacktestMarketDataSource",
     "CSVOHLCVMarketDataSource",
-    "CSVTickerMarketDataSource"
-]
\ No newline at end of file
+    "CSVTickerMarketDataSource",
+    "set_base_timeframes",
+]
@@ -0,0 +1,131 @@
+import os
+import re
+from datetime import datetime
+
+from investing_algorithm_framework.domain import DATETIME_FORMAT_BACKTESTING
+
+OHLCV_FILE_NAME_PATTERN = re.compile(
+    r"^OHLCV_(?P<symbol>[^_]+)_(?P<market>[^_]+)_(?P<timeframe>[^_]+)_"
+    r"(?P<start_date>\d{4}-\d{2}-\d{2}:\d{2}:\d{2})_"
+    r"(?P<end_date>\d{4}-\d{2}-\d{2}:\d{2}:\d{2})\.(?P<extension>\w+)$"
+)
+
+
+class BacktestDataCatalogEntry:
+
+    def __init__(
+        self,
+        file_path,
+        symbol,
+        market,
+        timeframe,
+        start_date,
+        end_date,
+        extension
+    ):
+        self.file_path = file_path
+        self.symbol = symbol
+        self.market = market
+        self.timeframe = timeframe
+        self.start_date = start_date
+        self.end_date = end_date
+        self.extension = extension
+
+    def covers(self, start_date, end_date):
+        return self.start_date <= start_date and self.end_date >= end_date
+
+    def overlap(self, start_date, end_date):
+        """
+        Function to calculate the overlap of the range of the entry with
+        the given range, as a timedelta.
+        """
+        return min(self.end_date, end_date) \
+            - max(self.start_date, start_date)
+
+
+class BacktestDataCatalog:
+    """
+    Catalog of the ohlcv files in a backtest data directory. The files
+    are indexed on their market, symbol, timeframe and covered range,
+    which are all part of the file name, so the catalog needs no separate
+    index file and always reflects the files on disk.
+    """
+
+    def __init__(self, backtest_data_directory):
+        self.backtest_data_directory = backtest_data_directory
+
+    def get_ohlcv_entries(self, symbol, market, timeframe, extension):
+        entries = []
+
+        if not os.path.isdir(self.backtest_data_directory):
+            return entries
+
+        symbol = symbol.replace("/", "-")
+
+        for file_name in os.listdir(self.backtest_data_directory):
+            match = OHLCV_FILE_NAME_PATTERN.match(file_name)
+
+            if match is None \
+                    or match.group("symbol").upper() != symbol.upper() \
+                    or match.group("market").upper() != market.upper() \
+                    or match.group("timeframe") != timeframe \
+                    or match.group("extension") != extension:
+                continue
+
+            entries.append(
+                BacktestDataCatalogEntry(
+                    file_path=os.path.join(
+                        self.backtest_data_directory, file_name
+                    ),
+                    symbol=symbol,
+                    market=market,
+                    timeframe=timeframe,
+                    start_date=datetime.strptime(
+                        match.group("start_date"),
+                        DATETIME_FORMAT_BACKTESTING
+                    ),
+                    end_date=datetime.strptime(
+                        match.group("end_date"), DATETIME_FORMAT_BACKTESTING
+                    ),
+                    extension=extension
+                )
+            )
+
+        return entries
+
+    def find_ohlcv_entry(
+        self, symbol, market, timeframe, extension, start_date, end_date
+    ):
+        """
+        Function to find the ohlcv file that overlaps most with the given
+        range. A file that covers the complete range is always preferred,
+        and of those the file with the smallest range.
+
+        :return: a BacktestDataCatalogEntry or None if no file overlaps
+            with the given range
+        """
+        entries = self.get_ohlcv_entries(
+            symbol, market, timeframe, extension
+        )
+        covering_entries = [
+            entry for entry in entries if entry.covers(start_date, end_date)
+        ]
+
+        if len(covering_entries) > 0:
+            return min(
+                covering_entries,
+                key=lambda entry: entry.end_date - entry.start_date
+            )
+
+        overlapping_entries = [
+            entry for entry in entries
+            if entry.overlap(start_date, end_date).total_seconds() >= 0
+        ]
+
+        if len(overlapping_entries) == 0:
+            return None
+
+        return max(
+            overlapping_entries,
+            key=lambda entry: entry.overlap(start_date, end_date)
+        )
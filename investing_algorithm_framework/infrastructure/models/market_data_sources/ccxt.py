@@ -1,18 +1,68 @@
 import logging
 import os
-from datetime import timedelta
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from math import ceil
+from threading import Lock
 
+import numpy as np
 import polars
 
 from investing_algorithm_framework.domain import RESOURCE_DIRECTORY, \
     BACKTEST_DATA_DIRECTORY_NAME, DATETIME_FORMAT_BACKTESTING, \
     OperationalException, DATETIME_FORMAT, OHLCVMarketDataSource, \
     BacktestMarketDataSource, OrderBookMarketDataSource, \
-    TickerMarketDataSource, TimeFrame
+    TickerMarketDataSource, TimeFrame, OHLCV_COLUMN_NAMES
 from investing_algorithm_framework.infrastructure.services import \
     CCXTMarketService
+from .backtest_data_catalog import BacktestDataCatalog
+from .indicator_columns import add_indicator_columns, \
+    remove_indicator_columns
+from .ohlcv_buffer import get_ohlcv_buffer
+from .resampling import get_resampled_data
 
 logger = logging.getLogger(__name__)
+_data_file_locks = {}
+_data_file_locks_lock = Lock()
+
+
+def _to_milliseconds(value):
+    """
+    Function to convert a datetime to a timestamp in milliseconds. Naive
+    datetimes are in UTC.
+    """
+
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+
+    return int(value.timestamp() * 1000)
+
+
+def _get_data_file_lock(market, symbol, timeframe):
+    """
+    Function to get the lock of the backtest data files of a market,
+    symbol and timeframe, so data sources that are prepared concurrently
+    do not download, merge or remove the same file at the same time.
+    """
+    key = (market.upper(), symbol.upper(), timeframe)
+
+    with _data_file_locks_lock:
+        return _data_file_locks.setdefault(key, Lock())
+
+
+def _search_sorted(datetime_column, value, side):
+    """
+    Function to binary search the index of a datetime value in a sorted
+    polars datetime column. Pandas timestamps (e.g. from a backtest
+    schedule index) are converted to native datetime objects first.
+    """
+
+    if hasattr(value, "to_pydatetime"):
+        value = value.to_pydatetime()
+
+    return datetime_column.search_sorted(
+        polars.Series([value]), side=side
+    )[0]
 
 
 class CCXTOHLCVBacktestMarketDataSource(
@@ -37,6 +87,10 @@ class CCXTOHLCVBacktestMarketDataSource(
     backtest_data_end_date = None
     total_minutes_timeframe = None
     column_names = ["Datetime", "Open", "High", "Low", "Close", "Volume"]
+    data = None
+    data_file_path = None
+    indicators = None
+    base_timeframe = None
 
     def __init__(
         self,
@@ -78,6 +132,32 @@ class CCXTOHLCVBacktestMarketDataSource(
         of unnecessary resources.
 
         When downloading the data it will use the ccxt library.
+
+        When the data source has a base timeframe, only the data of the
+        base timeframe is prepared, from which the data of the timeframe
+        of the data source is resampled.
+
+        The data file is prepared and loaded while holding the lock of
+        its market, symbol and timeframe, because preparing the data of
+        another data source can merge and remove the same file.
+        """
+        with _get_data_file_lock(
+            self.market, self.symbol, self.base_timeframe or self.timeframe
+        ):
+            self.data_file_path = self._prepare_data_file(
+                config, backtest_start_date, backtest_end_date, **kwargs
+            )
+            self.load_data(self.data_file_path)
+
+    def _prepare_data_file(
+        self, config, backtest_start_date, backtest_end_date, **kwargs
+    ):
+        """
+        Function to prepare the data file of the data source, without
+        loading its data.
+
+        :return: the path of the file with the data of the data source,
+            or of its base timeframe
         """
         # Calculating the backtest data start date
 
@@ -105,6 +185,7 @@ class CCXTOHLCVBacktestMarketDataSource(
         self.backtest_data_end_date = backtest_end_date.replace(microsecond=0)
 
         # Creating the backtest data directory and file
+        self.set_storage_format(config)
         self.backtest_data_directory = os.path.join(
             config.get(RESOURCE_DIRECTORY),
             config.get(BACKTEST_DATA_DIRECTORY_NAME)
@@ -113,35 +194,196 @@ class CCXTOHLCVBacktestMarketDataSource(
         if not os.path.isdir(self.backtest_data_directory):
             os.mkdir(self.backtest_data_directory)
 
+        if self.base_timeframe is not None:
+            return self._prepare_base_data(
+                config, backtest_start_date, backtest_end_date, **kwargs
+            )
+
         file_path = self._create_file_path()
 
         if not self._data_source_exists(file_path):
-            if not os.path.isfile(file_path):
-                try:
-                    with open(file_path, 'w') as _:
-                        pass
-                except Exception as e:
-                    logger.error(e)
-                    raise OperationalException(
-                        f"Could not create backtest data file {file_path}"
-                    )
+            file_path = self._prepare_data_from_catalog()
 
-            # Get the OHLCV data from the ccxt market service
-            market_service = CCXTMarketService(self.market_credential_service)
+        return file_path
+
+    def _prepare_base_data(
+        self, config, backtest_start_date, backtest_end_date, **kwargs
+    ):
+        """
+        Function to prepare the data of the base timeframe of the data
+        source. The base data starts one candle of the timeframe of the
+        data source earlier, so the first resampled candle is complete.
+
+        :return: the path of the file with the base data
+        """
+        minutes = TimeFrame.from_string(self.timeframe).amount_of_minutes
+        base_market_data_source = CCXTOHLCVBacktestMarketDataSource(
+            identifier=f"{self.identifier}-{self.base_timeframe}",
+            market=self.market,
+            symbol=self.symbol,
+            timeframe=self.base_timeframe,
+            window_size=ceil(
+                (self.window_size + 1) * minutes / TimeFrame.from_string(
+                    self.base_timeframe
+                ).amount_of_minutes
+            )
+        )
+        base_market_data_source.market_credential_service = \
+            kwargs.get("market_credential_service")
+
+        return base_market_data_source._prepare_data_file(
+            config, backtest_start_date, backtest_end_date
+        )
+
+    def _prepare_data_from_catalog(self):
+        """
+        Function to prepare the backtest data with the files that were
+        downloaded before.
+
+        The file that overlaps most with the backtest data range is
+        taken from the backtest data catalog. Only the candles before and
+        after the range of that file are downloaded, after which they are
+        merged with the file into a new file that covers both ranges.
+        When no file overlaps, the complete range is downloaded.
+
+        :return: the path of the file that covers the backtest data range
+        """
+        start_date = self.backtest_data_start_date
+        end_date = self.backtest_data_end_date
+        catalog = BacktestDataCatalog(self.backtest_data_directory)
+        entry = catalog.find_ohlcv_entry(
+            symbol=self.symbol,
+            market=self.market,
+            timeframe=self.timeframe.replace("_", ""),
+            extension=self.storage_format.file_extension,
+            start_date=start_date,
+            end_date=end_date
+        )
+
+        if entry is not None and not self._data_source_exists(
+            entry.file_path
+        ):
+            entry = None
+
+        if entry is not None and entry.covers(start_date, end_date):
+            return entry.file_path
+
+        market_service = CCXTMarketService(self.market_credential_service)
+
+        if entry is None:
+            file_path = self._create_file_path()
             ohlcv = market_service.get_ohlcv(
                 symbol=self.symbol,
                 time_frame=self.timeframe,
-                from_timestamp=backtest_data_start_date,
-                to_timestamp=backtest_end_date,
+                from_timestamp=start_date,
+                to_timestamp=end_date,
                 market=self.market
             )
             self.write_data_to_file_path(file_path, ohlcv)
+            return file_path
 
-    def _create_file_path(self):
+        # Only download the head and tail that are missing in the file
+        frames = [self.read_data_from_file_path(entry.file_path)]
+
+        if start_date < entry.start_date:
+            frames.insert(0, market_service.get_ohlcv(
+                symbol=self.symbol,
+                time_frame=self.timeframe,
+                from_timestamp=start_date,
+                to_timestamp=entry.start_date,
+                market=self.market
+            ))
+
+        if end_date > entry.end_date:
+            frames.append(market_service.get_ohlcv(
+                symbol=self.symbol,
+                time_frame=self.timeframe,
+                from_timestamp=entry.end_date,
+                to_timestamp=end_date,
+                market=self.market
+            ))
+
+        # Candles on the boundaries of the file are downloaded twice
+        data = polars.concat(
+            [frame.select(self.column_names) for frame in frames],
+            how="vertical_relaxed"
+        ).unique(subset="Datetime", keep="first", maintain_order=True)
+
+        file_path = self._create_file_path(
+            start_date=min(start_date, entry.start_date),
+            end_date=max(end_date, entry.end_date)
+        )
+        self.write_data_to_file_path(file_path, data.sort("Datetime"))
+
+        if file_path != entry.file_path:
+            os.remove(entry.file_path)
+
+        remove_indicator_columns(entry.file_path)
+
+        return file_path
+
+    def load_data(self, file_path):
+        """
+        Function to load the data of the given data file into memory.
+
+        The data is loaded only once, with the Datetime column parsed to
+        a datetime type and sorted, so that every call of get_data can
+        select its window with a binary search instead of re-reading and
+        filtering the complete file.
+
+        The columns of the indicators of the data source are added to
+        the data, so the window of every run contains the precomputed
+        indicator values.
+
+        When the data source has a base timeframe, the file has the data
+        of the base timeframe, which is resampled to the timeframe of
+        the data source.
+        """
+
+        if self.base_timeframe is None:
+            self.data = add_indicator_columns(
+                self.read_data_from_file_path(file_path),
+                self.indicators,
+                file_path
+            )
+            return
+
+        self.data = add_indicator_columns(
+            get_resampled_data(
+                file_path, self.timeframe, self.read_data_from_file_path
+            ),
+            self.indicators,
+            file_path,
+            timeframe=self.timeframe
+        )
+
+    def get_update_timestamps(self):
+        """
+        Function to get the timestamps of the candles of the data. The
+        window of a run contains every candle up to the backtest index
+        date, so the data changes at the timestamp of every candle.
+        """
+
+        if self.data is None:
+            return None
+
+        return self.data["Datetime"].to_numpy()
+
+    def _create_file_path(self, start_date=None, end_date=None):
         """
         Function to create a filename in the following format:
         OHLCV_{symbol}_{market}_{timeframe}_{start_date}_{end_date}.csv
+
+        The start and end date default to the backtest data start and
+        end date.
         """
+
+        if start_date is None:
+            start_date = self.backtest_data_start_date
+
+        if end_date is None:
+            end_date = self.backtest_data_end_date
+
         symbol_string = self.symbol.replace("/", "-")
         time_frame_string = self.timeframe.replace("_", "")
         return os.path.join(
@@ -151,18 +393,23 @@ class CCXTOHLCVBacktestMarketDataSource(
                 f"{symbol_string}_"
                 f"{self.market}_"
                 f"{time_frame_string}_"
-                f"{self.backtest_data_start_date.strftime(DATETIME_FORMAT_BACKTESTING)}_"
-                f"{self.backtest_data_end_date.strftime(DATETIME_FORMAT_BACKTESTING)}.csv"
+                f"{start_date.strftime(DATETIME_FORMAT_BACKTESTING)}_"
+                f"{end_date.strftime(DATETIME_FORMAT_BACKTESTING)}"
+                f".{self.storage_format.file_extension}"
             )
         )
 
     def get_data(self, backtest_index_date, **kwargs):
         """
         Get data implementation of ccxt based ohlcv backtest market data
-        source. This implementation will use polars to load and filter the
-        data.
+        source. This implementation will select the window from the data
+        that was loaded in memory by the prepare_data method. The returned
+        dataframe is a zero-copy slice of the loaded data.
+
+        An explicit from_timestamp, e.g. the creation date of the oldest
+        pending order, selects the data since that date instead of the
+        window, limited to the start of the backtest data.
         """
-        file_path = self._create_file_path()
         to_timestamp = backtest_index_date
         from_timestamp = backtest_index_date - timedelta(
             minutes=self.total_minutes_timeframe
@@ -171,6 +418,14 @@ class CCXTOHLCVBacktestMarketDataSource(
             .replace(microsecond=0)
         from_timestamp = from_timestamp.replace(microsecond=0)
 
+        if kwargs.get("from_timestamp") is not None:
+            from_timestamp = max(
+                kwargs["from_timestamp"].replace(
+                    tzinfo=self.backtest_data_start_date.tzinfo
+                ),
+                self.backtest_data_start_date
+            )
+
         if from_timestamp < self.backtest_data_start_date:
             raise OperationalException(
                 f"Cannot get data from {from_timestamp} as the "
@@ -183,16 +438,14 @@ class CCXTOHLCVBacktestMarketDataSource(
                 f"backtest data ends at {self.end_date}"
             )
 
-        # Load the csv file and filter out the dates that are not in the
-        # backtest index date range
-        df = polars.read_csv(
-            file_path, columns=self.column_names, separator=","
-        )
-        df = df.filter(
-            (df['Datetime'] >= from_timestamp.strftime(DATETIME_FORMAT))
-            & (df['Datetime'] <= to_timestamp.strftime(DATETIME_FORMAT))
-        )
-        return df
+        if self.data is None:
+            self.load_data(self.data_file_path or self._create_file_path())
+
+        # Binary search the window boundaries in the sorted datetime column
+        datetime_column = self.data["Datetime"]
+        start_index = _search_sorted(datetime_column, from_timestamp, "left")
+        end_index = _search_sorted(datetime_column, to_timestamp, "right")
+        return self.data.slice(start_index, end_index - start_index)
 
     def to_backtest_market_data_source(self) -> BacktestMarketDataSource:
         # Ignore this method for now
@@ -228,6 +481,8 @@ class CCXTTickerBacktestMarketDataSource(
     backtest_data_end_date = None
     timeframe = "15m"
     column_names = ["Datetime", "Open", "High", "Low", "Close", "Volume"]
+    ticker_cache_size = 128
+    timestamps = None
 
     def __init__(
         self,
@@ -267,6 +522,7 @@ class CCXTTickerBacktestMarketDataSource(
         self.backtest_data_end_date = backtest_end_date
 
         # Creating the backtest data directory and file
+        self.set_storage_format(config)
         self.backtest_data_directory = os.path.join(
             config.get(RESOURCE_DIRECTORY),
             config.get(BACKTEST_DATA_DIRECTORY_NAME)
@@ -310,6 +566,67 @@ class CCXTTickerBacktestMarketDataSource(
             )
             self.write_data_to_file_path(file_path, ohlcv)
 
+        self.load_data(file_path)
+
+    def load_data(self, file_path):
+        """
+        Function to load the data of the given data file into memory.
+
+        Only the sorted timestamps, the mid prices and the formatted
+        datetime strings are kept as arrays, so a ticker is looked up
+        with a binary search on the timestamps. The tickers of recent
+        index dates are kept in an lru cache, because a tick requests
+        the ticker of the same index date many times.
+        """
+        df = self.read_data_from_file_path(file_path)
+        self.timestamps = df["Datetime"].to_numpy()
+        self.mid_prices = (
+            (df["Low"].cast(polars.Float64) + df["High"].cast(polars.Float64))
+            / 2
+        ).to_numpy()
+        self.datetimes = df["Datetime"].dt.strftime(DATETIME_FORMAT).to_list()
+        self._get_ticker = lru_cache(maxsize=self.ticker_cache_size)(
+            self._create_ticker
+        )
+
+    def get_update_timestamps(self):
+        """
+        Function to get the timestamps at which the ticker changes. The
+        ticker of a run is the first candle at or after the backtest
+        index date, so the ticker changes right after every candle.
+        """
+
+        if self.timestamps is None:
+            return None
+
+        return self.timestamps + np.timedelta64(1, "us")
+
+    def _create_ticker(self, backtest_index_date):
+        timeframe_minutes = TimeFrame.from_string(self.timeframe)\
+            .amount_of_minutes
+        end_date = backtest_index_date + timedelta(minutes=timeframe_minutes)
+
+        # Select the first row from the backtest index date up to one
+        # timeframe after the backtest index date
+        index = np.searchsorted(
+            self.timestamps, np.datetime64(backtest_index_date), side="left"
+        )
+
+        if index == len(self.timestamps) \
+                or self.timestamps[index] > np.datetime64(end_date):
+            raise OperationalException(
+                f"No ticker data found for {self.symbol} at "
+                f"{backtest_index_date}"
+            )
+
+        # The bid and ask price are the mid price of the high and low price
+        return {
+            "symbol": self.symbol,
+            "bid": float(self.mid_prices[index]),
+            "ask": float(self.mid_prices[index]),
+            "datetime": self.datetimes[index],
+        }
+
     def _create_file_path(self):
 
         if self.symbol is None or self.market is None:
@@ -324,7 +641,8 @@ class CCXTTickerBacktestMarketDataSource(
                 f"{symbol_string}_"
                 f"{market_string}_"
                 f"{self.backtest_data_start_date.strftime(DATETIME_FORMAT_BACKTESTING)}_"
-                f"{self.backtest_data_end_date.strftime(DATETIME_FORMAT_BACKTESTING)}.csv"
+                f"{self.backtest_data_end_date.strftime(DATETIME_FORMAT_BACKTESTING)}"
+                f".{self.storage_format.file_extension}"
             )
         )
 
@@ -346,29 +664,15 @@ class CCXTTickerBacktestMarketDataSource(
                 "for CCXTTickerBacktestMarketDataSource"
             )
 
-        file_path = self._create_file_path()
-        timeframe_minutes = TimeFrame.from_string(self.timeframe).amount_of_minutes
-        backtest_index_date = kwargs["backtest_index_date"]
-        end_date = backtest_index_date + timedelta(minutes=timeframe_minutes)
+        if self.timestamps is None:
+            self.load_data(self._create_file_path())
 
-        # Filter the data based on the backtest index date and the end date
-        df = polars.read_csv(file_path)
-        df = df.filter(
-            (df['Datetime'] >= backtest_index_date
-             .strftime(DATETIME_FORMAT))
-            & (df['Datetime'] <= end_date.strftime(DATETIME_FORMAT))
-        )
+        backtest_index_date = kwargs["backtest_index_date"]
 
-        # Take the first row of the dataframe
-        first_row = df.head(1)[0]
+        if hasattr(backtest_index_date, "to_pydatetime"):
+            backtest_index_date = backtest_index_date.to_pydatetime()
 
-        # Calculate the bid and ask price based on the high and low price
-        return {
-            "symbol": self.symbol,
-            "bid": float((first_row["Low"][0]) + float(first_row["High"][0]))/2,
-            "ask": float((first_row["Low"][0]) + float(first_row["High"][0]))/2,
-            "datetime": first_row["Datetime"][0],
-        }
+        return dict(self._get_ticker(backtest_index_date))
 
 
 class CCXTOHLCVMarketDataSource(OHLCVMarketDataSource):
@@ -376,30 +680,71 @@ class CCXTOHLCVMarketDataSource(OHLCVMarketDataSource):
     def get_data(self, **kwargs):
         market_service = CCXTMarketService(self.market_credential_service)
 
-        if self.start_date is None:
+        start_date = self.start_date
+
+        if start_date is None:
             raise OperationalException(
                 "Either start_date or start_date_func should be set "
                 "for OHLCVMarketDataSource"
             )
 
-        return market_service.get_ohlcv(
-            symbol=self.symbol,
-            time_frame=self.timeframe,
-            from_timestamp=self.start_date,
-            to_timestamp=self.end_date,
-            market=self.market
+        end_date = self.end_date
+        start_timestamp = _to_milliseconds(start_date)
+        end_timestamp = _to_milliseconds(end_date)
+        minutes = TimeFrame.from_string(self.timeframe).amount_of_minutes
+        capacity = max(
+            self.window_size or 0,
+            (end_date - start_date).total_seconds() / 60 / minutes
+        ) + 1
+        buffer = get_ohlcv_buffer(
+            self.market, self.symbol, self.timeframe, capacity
         )
 
+        with buffer.lock:
+            last_timestamp = buffer.last_timestamp
+
+            # Only download the candles from the last stored candle
+            # onwards, which also refreshes the candle that was still open.
+            # This requires the buffer to start at the first candle of the
+            # window, otherwise all candles of the window are downloaded.
+            if last_timestamp is not None \
+                    and buffer.timestamps[0] < start_timestamp \
+                    + minutes * 60 * 1000 \
+                    and start_timestamp <= last_timestamp <= end_timestamp:
+                from_timestamp = datetime.fromtimestamp(
+                    last_timestamp / 1000, tz=timezone.utc
+                ).replace(tzinfo=None)
+            else:
+                from_timestamp = start_date
+                buffer.clear()
+
+            ohlcv = market_service.get_ohlcv(
+                symbol=self.symbol,
+                time_frame=self.timeframe,
+                from_timestamp=from_timestamp,
+                to_timestamp=end_date,
+                market=self.market
+            )
+
+            if len(ohlcv) > 0:
+                buffer.update(
+                    ohlcv["Datetime"].dt.epoch("ms").to_numpy(),
+                    ohlcv.select(OHLCV_COLUMN_NAMES[1:]).to_numpy()
+                )
+
+            return buffer.to_frame(start_timestamp, end_timestamp)
+
     def to_backtest_market_data_source(self) -> BacktestMarketDataSource:
         return CCXTOHLCVBacktestMarketDataSource(
             identifier=self.identifier,
             market=self.market,
             symbol=self.symbol,
-            start_date=self.start_date,
+            start_date=self._start_date,
             start_date_func=self.start_date_func,
-            end_date=self.end_date,
+            end_date=self._end_date,
             end_date_func=self.end_date_func,
             timeframe=self.timeframe,
+            window_size=self.window_size,
         )
 
 
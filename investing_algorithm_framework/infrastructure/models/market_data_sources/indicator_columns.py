@@ -0,0 +1,112 @@
+import logging
+import os
+import shutil
+
+import polars
+
+logger = logging.getLogger(__name__)
+
+INDICATORS_DIRECTORY_NAME = "indicators"
+
+
+def get_indicator_columns_directory(data_file_path, timeframe=None):
+    """
+    Function to get the directory with the precomputed indicator columns
+    of a backtest data file. The directory is next to the data file, in
+    an indicators directory, so the catalog of the backtest data
+    directory does not see the cached columns as data files.
+
+    The columns of data that is resampled from the file to another
+    timeframe are in a subdirectory for that timeframe.
+    """
+    directory, file_name = os.path.split(data_file_path)
+    directory = os.path.join(
+        directory,
+        INDICATORS_DIRECTORY_NAME,
+        os.path.splitext(file_name)[0]
+    )
+
+    if timeframe is not None:
+        directory = os.path.join(directory, timeframe)
+
+    return directory
+
+
+def _is_cache_of(columns, data):
+    return len(columns) == len(data) and (
+        len(data) == 0 or (
+            columns["Datetime"][0] == data["Datetime"][0]
+            and columns["Datetime"][-1] == data["Datetime"][-1]
+        )
+    )
+
+
+def _load_or_create_columns(data, indicator, directory):
+    file_path = os.path.join(directory, f"{indicator.key}.arrow")
+
+    if os.path.isfile(file_path):
+
+        try:
+            columns = polars.read_ipc(file_path, memory_map=True)
+
+            if _is_cache_of(columns, data):
+                return columns.drop("Datetime")
+        except Exception as e:
+            logger.warning(f"Could not read indicator columns {file_path}")
+            logger.warning(e)
+
+    columns = data.select(
+        [polars.col("Datetime")] + indicator.create_columns()
+    )
+    os.makedirs(directory, exist_ok=True)
+
+    # Data sources of the same file can be prepared concurrently, so the
+    # columns are written to a temporary file that replaces the cache
+    temporary_file_path = f"{file_path}.{os.getpid()}.{id(columns)}.tmp"
+    columns.write_ipc(temporary_file_path, compression="uncompressed")
+    os.replace(temporary_file_path, file_path)
+    return columns.drop("Datetime")
+
+
+def add_indicator_columns(data, indicators, data_file_path, timeframe=None):
+    """
+    Function to add the columns of indicators, calculated over all
+    candles of a backtest data file, to the data of the file.
+
+    The columns of an indicator are computed once with polars
+    expressions and cached as an arrow file keyed by the params of the
+    indicator, so later backtests on the same file only read them.
+
+    :param data: polars dataframe with the OHLCV data of the file
+    :param indicators: list of indicators of the data
+    :param data_file_path: path of the backtest data file
+    :param timeframe: the timeframe the data is resampled to, None when
+        the data is the data of the file
+    :return: the data with the indicator columns added
+    """
+    directory = get_indicator_columns_directory(data_file_path, timeframe)
+    columns = []
+    keys = set()
+
+    for indicator in indicators or []:
+
+        if indicator.key in keys:
+            continue
+
+        keys.add(indicator.key)
+        columns.append(_load_or_create_columns(data, indicator, directory))
+
+    if len(columns) == 0:
+        return data
+
+    return polars.concat([data] + columns, how="horizontal")
+
+
+def remove_indicator_columns(data_file_path):
+    """
+    Function to remove the cached indicator columns of a backtest
+    data file.
+    """
+    shutil.rmtree(
+        get_indicator_columns_directory(data_file_path), ignore_errors=True
+    )
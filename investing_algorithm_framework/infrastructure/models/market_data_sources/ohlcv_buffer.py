@@ -0,0 +1,177 @@
+from math import ceil
+from threading import Lock
+
+import numpy as np
+
+from investing_algorithm_framework.domain import create_ohlcv_data_frame
+
+_ohlcv_buffers = {}
+_ohlcv_buffers_lock = Lock()
+
+
+class OHLCVBuffer:
+    """
+    Fixed size buffer with the most recent candles of a market, symbol
+    and timeframe. Candle timestamps are kept as int64 milliseconds and
+    the open, high, low, close and volume as a float64 array.
+
+    The arrays hold twice the capacity, so appending a candle is a
+    write at the end, and the rows are moved back to the front only
+    once every capacity appends. The rows of the buffer therefore
+    always are a contiguous view of the arrays.
+    """
+
+    def __init__(self, capacity):
+        self._capacity = max(int(capacity), 1)
+        self._start = 0
+        self._end = 0
+        self._timestamps = np.empty(2 * self._capacity, dtype=np.int64)
+        self._values = np.empty((2 * self._capacity, 5), dtype=np.float64)
+        self.lock = Lock()
+
+    def __len__(self):
+        return self._end - self._start
+
+    @property
+    def capacity(self):
+        return self._capacity
+
+    @property
+    def timestamps(self):
+        return self._timestamps[self._start:self._end]
+
+    @property
+    def values(self):
+        return self._values[self._start:self._end]
+
+    @property
+    def last_timestamp(self):
+
+        if self._end == self._start:
+            return None
+
+        return int(self._timestamps[self._end - 1])
+
+    def resize(self, capacity):
+        """
+        Function to change the capacity of the buffer. When the buffer
+        shrinks, the oldest rows are evicted.
+        """
+        capacity = max(int(capacity), 1)
+        size = min(len(self), capacity)
+        timestamps = np.empty(2 * capacity, dtype=np.int64)
+        values = np.empty((2 * capacity, 5), dtype=np.float64)
+        timestamps[:size] = self._timestamps[self._end - size:self._end]
+        values[:size] = self._values[self._end - size:self._end]
+        self._timestamps = timestamps
+        self._values = values
+        self._capacity = capacity
+        self._start = 0
+        self._end = size
+
+    def clear(self):
+        """
+        Function to remove all candles from the buffer.
+        """
+        self._start = 0
+        self._end = 0
+
+    def update(self, timestamps, values):
+        """
+        Function to add candles, sorted by timestamp, to the buffer.
+
+        Candles older than the last candle in the buffer are ignored.
+        A candle with the same timestamp as the last candle replaces it,
+        because that candle was still open when it was stored. The
+        oldest candles are evicted when the buffer is full.
+
+        :param timestamps: int64 array with the timestamps in milliseconds
+        :param values: float64 array with a row of open, high, low,
+            close and volume for every timestamp
+        :return: None
+        """
+        last_timestamp = self.last_timestamp
+
+        if last_timestamp is not None:
+            newer = timestamps >= last_timestamp
+            timestamps = timestamps[newer]
+            values = values[newer]
+
+            if len(timestamps) > 0 and timestamps[0] == last_timestamp:
+                self._values[self._end - 1] = values[0]
+                timestamps = timestamps[1:]
+                values = values[1:]
+
+        timestamps = timestamps[-self._capacity:]
+        values = values[-self._capacity:]
+        size = len(timestamps)
+
+        if size == 0:
+            return
+
+        if self._end + size > len(self._timestamps):
+            keep = min(len(self), self._capacity - size)
+            self._timestamps[:keep] = \
+                self._timestamps[self._end - keep:self._end]
+            self._values[:keep] = self._values[self._end - keep:self._end]
+            self._start = 0
+            self._end = keep
+
+        self._timestamps[self._end:self._end + size] = timestamps
+        self._values[self._end:self._end + size] = values
+        self._end += size
+        self._start = max(self._start, self._end - self._capacity)
+
+    def to_frame(self, from_timestamp=None, to_timestamp=None):
+        """
+        Function to get the candles of the buffer between two timestamps
+        in milliseconds as a polars DataFrame, with the same columns as
+        the backtest OHLCV data.
+
+        The frame holds a copy of the rows, because polars shares the
+        memory of numpy arrays and the rows of the buffer are
+        overwritten by later updates.
+        """
+        timestamps = self.timestamps
+        start = 0
+        end = len(timestamps)
+
+        if from_timestamp is not None:
+            start = np.searchsorted(timestamps, from_timestamp, side="left")
+
+        if to_timestamp is not None:
+            end = np.searchsorted(timestamps, to_timestamp, side="right")
+
+        return create_ohlcv_data_frame(
+            timestamps[start:end].copy(), self.values[start:end].copy()
+        )
+
+
+def get_ohlcv_buffer(market, symbol, timeframe, capacity):
+    """
+    Function to get the OHLCV buffer of a market, symbol and timeframe.
+    The buffers are shared, so all live data sources of the same candles
+    only download the candles that are not in the buffer yet. A buffer
+    grows when a data source needs a larger window.
+
+    :param market: the id of the market
+    :param symbol: the symbol of the candles
+    :param timeframe: the timeframe of the candles
+    :param capacity: the minimum number of candles the buffer should hold
+    :return: an OHLCVBuffer
+    """
+    key = (market.upper(), symbol.upper(), timeframe)
+    capacity = max(ceil(capacity), 1)
+
+    with _ohlcv_buffers_lock:
+        buffer = _ohlcv_buffers.get(key)
+
+        if buffer is None:
+            buffer = OHLCVBuffer(capacity)
+            _ohlcv_buffers[key] = buffer
+        elif buffer.capacity < capacity:
+
+            with buffer.lock:
+                buffer.resize(capacity)
+
+        return buffer
@@ -0,0 +1,95 @@
+import os
+from threading import Lock
+
+from investing_algorithm_framework.domain import TimeFrame, \
+    resample_ohlcv_data_frame
+
+_resampled_data = {}
+_resampled_data_lock = Lock()
+
+
+def get_resampled_data(data_file_path, timeframe, read_data):
+    """
+    Function to get the OHLCV data of a backtest data file resampled to
+    a coarser timeframe.
+
+    The resampled data is cached in memory per file and timeframe, so
+    all data sources with the same timeframe resample the file once.
+    The cache is invalidated when the file is modified.
+
+    :param data_file_path: path of the backtest data file
+    :param timeframe: the timeframe to resample the data to
+    :param read_data: function that reads the data of the file
+    :return: polars dataframe with the resampled OHLCV data
+    """
+    key = (data_file_path, TimeFrame.from_value(timeframe))
+    modified_at = os.path.getmtime(data_file_path)
+
+    with _resampled_data_lock:
+        entry = _resampled_data.get(key)
+
+        if entry is not None and entry[0] == modified_at:
+            return entry[1]
+
+    data = resample_ohlcv_data_frame(read_data(data_file_path), timeframe)
+
+    with _resampled_data_lock:
+        _resampled_data[key] = (modified_at, data)
+
+    return data
+
+
+def _get_amount_of_minutes(timeframe):
+
+    try:
+        return TimeFrame.from_value(timeframe).amount_of_minutes
+    except ValueError:
+        return None
+
+
+def set_base_timeframes(market_data_sources):
+    """
+    Function to select the base timeframe of the OHLCV backtest market
+    data sources of every market and symbol.
+
+    The base timeframe is the smallest timeframe of the data sources of
+    a market and symbol. Only the data of the base timeframe is
+    downloaded and stored, the data of every timeframe that is a
+    multiple of it is resampled from that data. Data sources of other
+    timeframes keep their own data.
+    """
+    market_data_sources_by_symbol = {}
+
+    for market_data_source in market_data_sources:
+
+        if not hasattr(market_data_source, "base_timeframe"):
+            continue
+
+        market_data_source.base_timeframe = None
+
+        if _get_amount_of_minutes(market_data_source.timeframe) is None:
+            continue
+
+        market_data_sources_by_symbol.setdefault(
+            (
+                market_data_source.market.upper(),
+                market_data_source.symbol.upper()
+            ),
+            []
+        ).append(market_data_source)
+
+    for symbol_market_data_sources in market_data_sources_by_symbol.values():
+        base_timeframe = min(
+            (
+                market_data_source.timeframe
+                for market_data_source in symbol_market_data_sources
+            ),
+            key=_get_amount_of_minutes
+        )
+        base_minutes = _get_amount_of_minutes(base_timeframe)
+
+        for market_data_source in symbol_market_data_sources:
+            minutes = _get_amount_of_minutes(market_data_source.timeframe)
+
+            if minutes != base_minutes and minutes % base_minutes == 0:
+                market_data_source.base_timeframe = base_timeframe
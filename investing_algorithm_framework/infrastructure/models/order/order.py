@@ -1,7 +1,8 @@
 import logging
 from datetime import datetime
 
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Float
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, \
+    Float, Index
 from sqlalchemy.orm import relationship
 
 from investing_algorithm_framework.domain import OrderType, \
@@ -42,6 +43,17 @@ class SQLOrder(Order, SQLBaseModel, SQLAlchemyModelExtension):
         cascade="all, delete"
     )
     _available_amount = None
+    __table_args__ = (
+        Index(
+            "ix_orders_position_id_status_order_side",
+            "position_id",
+            "status",
+            "order_side"
+        ),
+        Index("ix_orders_status_order_side", "status", "order_side"),
+        Index("ix_orders_external_id", "external_id"),
+        Index("ix_orders_created_at", "created_at"),
+    )
 
     def update(self, data):
 
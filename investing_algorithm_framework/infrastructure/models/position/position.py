@@ -1,5 +1,5 @@
 from sqlalchemy import Column, Integer, String, ForeignKey, Float
-from sqlalchemy import UniqueConstraint
+from sqlalchemy import UniqueConstraint, Index
 from sqlalchemy.orm import relationship, validates
 
 from investing_algorithm_framework.domain import Position
@@ -26,6 +26,7 @@ class SQLPosition(SQLBaseModel, Position, SQLAlchemyModelExtension):
         UniqueConstraint(
             'symbol', 'portfolio_id', name='_symbol_portfolio_uc'
         ),
+        Index("ix_positions_portfolio_id_symbol", "portfolio_id", "symbol"),
     )
 
     def __init__(
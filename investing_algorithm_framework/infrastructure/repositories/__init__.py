@@ -1,9 +1,15 @@
-from .order_repository import SQLOrderRepository
-from .order_fee_repository import SQLOrderFeeRepository
-from .position_repository import SQLPositionRepository
-from .position_snapshot_repository import SQLPositionSnapshotRepository
-from .portfolio_repository import SQLPortfolioRepository
-from .portfolio_snapshot_repository import SQLPortfolioSnapshotRepository
+from .order_repository import SQLOrderRepository, InMemoryOrderRepository
+from .order_fee_repository import SQLOrderFeeRepository, \
+    InMemoryOrderFeeRepository
+from .position_repository import SQLPositionRepository, \
+    InMemoryPositionRepository
+from .position_snapshot_repository import SQLPositionSnapshotRepository, \
+    InMemoryPositionSnapshotRepository
+from .portfolio_repository import SQLPortfolioRepository, \
+    InMemoryPortfolioRepository
+from .portfolio_snapshot_repository import SQLPortfolioSnapshotRepository, \
+    InMemoryPortfolioSnapshotRepository
+from .in_memory_repository import InMemoryRepository
 
 __all__ = [
     "SQLOrderFeeRepository",
@@ -12,4 +18,11 @@ __all__ = [
     "SQLPositionSnapshotRepository",
     "SQLPortfolioRepository",
     "SQLPortfolioSnapshotRepository",
+    "InMemoryRepository",
+    "InMemoryOrderFeeRepository",
+    "InMemoryOrderRepository",
+    "InMemoryPositionRepository",
+    "InMemoryPositionSnapshotRepository",
+    "InMemoryPortfolioRepository",
+    "InMemoryPortfolioSnapshotRepository",
 ]
@@ -0,0 +1,135 @@
+from sqlalchemy import inspect
+from werkzeug.datastructures import MultiDict
+
+from investing_algorithm_framework.domain import ApiException
+from investing_algorithm_framework.infrastructure.database import \
+    copy_model
+from .repository import Repository
+
+
+class InMemoryRepository(Repository):
+    """
+    Repository that stores its objects in an InMemoryDatabase instead of
+    the sql database. Objects are kept as sql models, and every read
+    returns a detached copy, the same as the sql repositories do.
+    """
+
+    def __init__(self, database):
+        self._database = database
+
+    @property
+    def table(self):
+        return self._database.get_table(self.base_class.__tablename__)
+
+    def create(self, data):
+        created_object = self.base_class(**data)
+        self._set_defaults(created_object)
+        created_object.id = self._database.next_id(
+            self.base_class.__tablename__
+        )
+        self.table[created_object.id] = created_object
+        return copy_model(created_object)
+
+    def create_all(self, data):
+
+        for entry in data:
+            self.create(entry)
+
+    def update(self, object_id, data):
+        update_object = self._get(object_id)
+        update_object.update(data)
+        return copy_model(update_object)
+
+    def update_all(self, query_params, data):
+        selection = self.apply_query_params(
+            list(self.table.values()), query_params
+        )
+
+        for item in selection:
+            item.update(dict(data))
+
+    def delete(self, object_id):
+        delete_object = self._get(object_id)
+        del self.table[object_id]
+        return copy_model(delete_object)
+
+    def delete_all(self, query_params):
+
+        if query_params is None:
+            raise ApiException("No parameters are required")
+
+        selection = self.apply_query_params(
+            list(self.table.values()), query_params
+        )
+
+        for item in selection:
+            del self.table[item.id]
+
+    def get_all(self, query_params=None):
+        query_params = MultiDict(query_params)
+        selection = self.apply_query_params(
+            list(self.table.values()), query_params
+        )
+        return [copy_model(item) for item in selection]
+
+    def get(self, object_id):
+        return copy_model(self._get(object_id))
+
+    def _get(self, object_id):
+        match = self.table.get(object_id)
+
+        if match is None:
+            raise ApiException(
+                self.DEFAULT_NOT_FOUND_MESSAGE, status_code=404
+            )
+
+        return match
+
+    def _apply_query_params(self, items, query_params):
+        return items
+
+    def apply_query_params(self, items, query_params):
+
+        if query_params is not None:
+            query_params = MultiDict(query_params)
+            items = self._apply_query_params(items, query_params)
+
+        return items
+
+    def exists(self, query_params):
+        selection = self.apply_query_params(
+            list(self.table.values()), query_params
+        )
+        return len(selection) > 0
+
+    def find(self, query_params):
+        selection = self.apply_query_params(
+            list(self.table.values()), query_params
+        )
+
+        if len(selection) == 0:
+            raise ApiException(self.DEFAULT_NOT_FOUND_MESSAGE)
+
+        return copy_model(selection[0])
+
+    def count(self, query_params=None):
+        return len(
+            self.apply_query_params(list(self.table.values()), query_params)
+        )
+
+    def _set_defaults(self, model):
+        """
+        Function to set the column defaults of a model. The sql database
+        only sets these when an object is flushed.
+        """
+
+        for column in inspect(self.base_class).columns:
+            default = column.default
+
+            if default is None or getattr(model, column.key) is not None:
+                continue
+
+            if default.is_callable:
+                setattr(model, column.key, default.arg(None))
+            elif default.is_scalar:
+                setattr(model, column.key, default.arg)
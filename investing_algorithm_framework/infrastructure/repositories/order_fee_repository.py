@@ -1,5 +1,6 @@
 from investing_algorithm_framework.infrastructure.models import SQLOrderFee
 from .repository import Repository
+from .in_memory_repository import InMemoryRepository
 
 
 class SQLOrderFeeRepository(Repository):
@@ -13,3 +14,18 @@ class SQLOrderFeeRepository(Repository):
             query = query.filter_by(order_id=order_query_param)
 
         return query
+
+
+class InMemoryOrderFeeRepository(InMemoryRepository):
+    base_class = SQLOrderFee
+    DEFAULT_NOT_FOUND_MESSAGE = "Order fee not found"
+
+    def _apply_query_params(self, items, query_params):
+        order_query_param = self.get_query_param("order", query_params)
+
+        if order_query_param:
+            items = [
+                item for item in items if item.order_id == order_query_param
+            ]
+
+        return items
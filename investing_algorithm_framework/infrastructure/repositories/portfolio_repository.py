@@ -1,6 +1,7 @@
 from investing_algorithm_framework.infrastructure.models import SQLPortfolio, \
     SQLPosition
 from .repository import Repository
+from .in_memory_repository import InMemoryRepository
 
 
 class SQLPortfolioRepository(Repository):
@@ -28,3 +29,38 @@ class SQLPortfolioRepository(Repository):
             query = query.filter_by(id=position.portfolio_id)
 
         return query
+
+
+class InMemoryPortfolioRepository(InMemoryRepository):
+    base_class = SQLPortfolio
+    DEFAULT_NOT_FOUND_MESSAGE = "Portfolio not found"
+
+    def _apply_query_params(self, items, query_params):
+        id_query_param = query_params.get("id")
+        market_query_param = query_params.get("market")
+        identifier_query_param = query_params.get("identifier")
+        position_query_param = query_params.get("position")
+
+        if id_query_param:
+            items = [item for item in items if item.id == id_query_param]
+
+        if market_query_param:
+            items = [
+                item for item in items if item.market == market_query_param
+            ]
+
+        if identifier_query_param:
+            items = [
+                item for item in items
+                if item.identifier == identifier_query_param.lower()
+            ]
+
+        if position_query_param:
+            position = self._database.get_table(
+                SQLPosition.__tablename__
+            ).get(position_query_param)
+            items = [
+                item for item in items if item.id == position.portfolio_id
+            ]
+
+        return items
@@ -1,6 +1,7 @@
 from investing_algorithm_framework.infrastructure.models import \
     SQLPortfolioSnapshot
 from .repository import Repository
+from .in_memory_repository import InMemoryRepository
 
 
 class SQLPortfolioSnapshotRepository(Repository):
@@ -54,3 +55,66 @@ class SQLPortfolioSnapshotRepository(Repository):
             )
 
         return query
+
+
+class InMemoryPortfolioSnapshotRepository(InMemoryRepository):
+    base_class = SQLPortfolioSnapshot
+    DEFAULT_NOT_FOUND_MESSAGE = "Portfolio snapshot not found"
+
+    def _apply_query_params(self, items, query_params):
+        portfolio_id_query_param = self.get_query_param(
+            "portfolio_id", query_params
+        )
+        created_at_query_param = self.get_query_param(
+            "created_at", query_params
+        )
+        created_at_gt_query_param = self.get_query_param(
+            "created_at_gt", query_params
+        )
+        created_at_gte_query_param = self.get_query_param(
+            "created_at_gte", query_params
+        )
+        created_at_lt_query_param = self.get_query_param(
+            "created_at_lt", query_params
+        )
+        created_at_lte_query_param = self.get_query_param(
+            "created_at_lte", query_params
+        )
+
+        if portfolio_id_query_param is not None:
+            items = [
+                item for item in items
+                if item.portfolio_id == portfolio_id_query_param
+            ]
+
+        if created_at_query_param is not None:
+            items = [
+                item for item in items
+                if item.created_at == created_at_query_param
+            ]
+
+        if created_at_gt_query_param is not None:
+            items = [
+                item for item in items
+                if item.created_at > created_at_gt_query_param
+            ]
+
+        if created_at_gte_query_param is not None:
+            items = [
+                item for item in items
+                if item.created_at >= created_at_gte_query_param
+            ]
+
+        if created_at_lt_query_param is not None:
+            items = [
+                item for item in items
+                if item.created_at < created_at_lt_query_param
+            ]
+
+        if created_at_lte_query_param is not None:
+            items = [
+                item for item in items
+                if item.created_at <= created_at_lte_query_param
+            ]
+
+        return items
@@ -2,6 +2,7 @@ from sqlalchemy import cast, Numeric, Float
 
 from investing_algorithm_framework.infrastructure.models import SQLPosition
 from .repository import Repository
+from .in_memory_repository import InMemoryRepository
 
 
 class SQLPositionRepository(Repository):
@@ -53,3 +54,64 @@ class SQLPositionRepository(Repository):
             )
 
         return query
+
+
+class InMemoryPositionRepository(InMemoryRepository):
+    base_class = SQLPosition
+    DEFAULT_NOT_FOUND_MESSAGE = "Position not found"
+
+    def _apply_query_params(self, items, query_params):
+        amount_query_param = self.get_query_param("amount", query_params)
+        symbol_query_param = self.get_query_param("symbol", query_params)
+        portfolio_query_param = self.get_query_param("portfolio", query_params)
+        amount_gt_query_param = self.get_query_param("amount_gt", query_params)
+        amount_gte_query_param = self.get_query_param(
+            "amount_gte", query_params
+        )
+        amount_lt_query_param = self.get_query_param("amount_lt", query_params)
+        amount_lte_query_param = self.get_query_param(
+            "amount_lte", query_params
+        )
+
+        if amount_query_param:
+            items = [
+                item for item in items
+                if item.amount == float(amount_query_param)
+            ]
+
+        if symbol_query_param:
+            items = [
+                item for item in items if item.symbol == symbol_query_param
+            ]
+
+        if portfolio_query_param is not None:
+            items = [
+                item for item in items
+                if item.portfolio_id == portfolio_query_param
+            ]
+
+        if amount_gt_query_param is not None:
+            items = [
+                item for item in items
+                if item.amount > float(amount_gt_query_param)
+            ]
+
+        if amount_gte_query_param is not None:
+            items = [
+                item for item in items
+                if item.amount >= float(amount_gte_query_param)
+            ]
+
+        if amount_lt_query_param is not None:
+            items = [
+                item for item in items
+                if item.amount < float(amount_lt_query_param)
+            ]
+
+        if amount_lte_query_param:
+            items = [
+                item for item in items
+                if item.amount <= float(amount_lte_query_param)
+            ]
+
+        return items
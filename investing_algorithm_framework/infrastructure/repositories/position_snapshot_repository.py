@@ -1,6 +1,7 @@
 from investing_algorithm_framework.infrastructure.models import \
     SQLPositionSnapshot
 from .repository import Repository
+from .in_memory_repository import InMemoryRepository
 
 
 class SQLPositionSnapshotRepository(Repository):
@@ -19,3 +20,22 @@ class SQLPositionSnapshotRepository(Repository):
                 )
 
         return query
+
+
+class InMemoryPositionSnapshotRepository(InMemoryRepository):
+    base_class = SQLPositionSnapshot
+    DEFAULT_NOT_FOUND_MESSAGE = "Position snapshot not found"
+
+    def _apply_query_params(self, items, query_params):
+        portfolio_snapshot_query_param = self.get_query_param(
+            "portfolio_snapshot", query_params
+        )
+
+        if portfolio_snapshot_query_param is not None:
+            items = [
+                item for item in items
+                if item.portfolio_snapshot_id
+                == portfolio_snapshot_query_param
+            ]
+
+        return items
@@ -1,13 +1,16 @@
 import logging
 from abc import ABC
+from contextlib import contextmanager
 from typing import Callable
 
+from sqlalchemy import insert
 from sqlalchemy.exc import SQLAlchemyError
 from werkzeug.datastructures import MultiDict
 
 from investing_algorithm_framework.domain import ApiException, \
     DEFAULT_PAGE_VALUE, DEFAULT_PER_PAGE_VALUE
-from investing_algorithm_framework.infrastructure.database import Session
+from investing_algorithm_framework.infrastructure.database import Session, \
+    get_unit_of_work, unit_of_work
 
 logger = logging.getLogger("investing_algorithm_framework")
 
@@ -20,34 +23,58 @@ class Repository(ABC):
 
     def create(self, data):
 
-        with Session() as db:
+        with self.session_scope() as db:
             try:
                 created_object = self.base_class(**data)
                 db.add(created_object)
-                db.commit()
+                self._commit(db)
                 return self.get(created_object.id)
             except SQLAlchemyError as e:
                 logger.error(e)
-                db.rollback()
+                self._rollback(db)
                 raise ApiException("Error creating object")
 
+    def create_all(self, data):
+        """
+        Function to create multiple objects with a single insert and
+        commit.
+
+        :param data: list of dicts with the data of the objects
+        :return: None
+        """
+
+        if len(data) == 0:
+            return
+
+        with self.session_scope() as db:
+            try:
+                db.execute(insert(self.base_class), data)
+                self._commit(db)
+            except SQLAlchemyError as e:
+                logger.error(e)
+                self._rollback(db)
+                raise ApiException("Error creating objects")
+
     def update(self, object_id, data):
 
-        with Session() as db:
+        with self.session_scope() as db:
             try:
-                update_object = self.get(object_id)
+                update_object = self._get(db, object_id)
                 update_object.update(data)
-                db.add(update_object)
-                db.commit()
-                return self.get(object_id)
+                self._commit(db)
+
+                if get_unit_of_work() is None:
+                    db.refresh(update_object)
+
+                return update_object
             except SQLAlchemyError as e:
                 logger.error(e)
-                db.rollback()
+                self._rollback(db)
                 raise ApiException("Error updating object")
 
     def update_all(self, query_params, data):
 
-        with Session() as db:
+        with self.session_scope() as db:
             try:
                 selection = self.get_all(query_params)
 
@@ -56,30 +83,36 @@ class Repository(ABC):
                         item.update(db, data)
                     except SQLAlchemyError as e:
                         logger.error(e)
+
+                        # The unit of work rolls back its whole transaction
+                        if get_unit_of_work() is not None:
+                            raise
+
                         db.rollback()
 
-                db.commit()
+                self._commit(db)
 
             except SQLAlchemyError as e:
                 logger.error(e)
-                db.rollback()
+                self._rollback(db)
                 raise ApiException("Error updating object")
 
     def delete(self, object_id):
 
-        with Session() as db:
+        with self.session_scope() as db:
             try:
-                delete_object = self.get(object_id)
+                delete_object = self._get(db, object_id)
                 db.delete(delete_object)
+                self._commit(db)
                 return delete_object
             except SQLAlchemyError as e:
                 logger.error(e)
-                db.rollback()
+                self._rollback(db)
                 raise ApiException("Error deleting object")
 
     def delete_all(self, query_params):
 
-        with Session() as db:
+        with self.session_scope() as db:
             if query_params is None:
                 raise ApiException("No parameters are required")
 
@@ -91,17 +124,17 @@ class Repository(ABC):
 
                 for item in query_set.all():
                     item.delete(db)
-                    db.commit()
+                    self._commit(db)
 
             except SQLAlchemyError as e:
                 logger.error(e)
-                db.rollback()
+                self._rollback(db)
                 raise ApiException("Error deleting all objects")
 
     def get_all(self, query_params=None):
         query_params = MultiDict(query_params)
 
-        with Session() as db:
+        with self.session_scope() as db:
             try:
                 query_set = db.query(self.base_class)
                 query_set = self.apply_query_params(
@@ -114,16 +147,65 @@ class Repository(ABC):
 
     def get(self, object_id):
 
-        with Session() as db:
-            match = db.query(self.base_class).filter_by(id=object_id) \
-                .first()
+        with self.session_scope() as db:
+            return self._get(db, object_id)
 
-            if not match:
-                raise ApiException(
-                    self.DEFAULT_NOT_FOUND_MESSAGE, status_code=404
-                )
+    def _get(self, db, object_id):
+        match = db.query(self.base_class).filter_by(id=object_id).first()
+
+        if not match:
+            raise ApiException(
+                self.DEFAULT_NOT_FOUND_MESSAGE, status_code=404
+            )
+
+        return match
+
+    def unit_of_work(self):
+        """
+        Function to start a unit of work. All repository operations of
+        the current thread within the unit of work share one transaction,
+        that is committed once when the outermost unit of work exits.
+        """
+        return unit_of_work()
+
+    @contextmanager
+    def session_scope(self):
+        """
+        Function to get the session of the active unit of work, or a new
+        session that is closed afterwards if there is no unit of work.
+        """
+        active_unit_of_work = get_unit_of_work()
+
+        if active_unit_of_work is not None:
+            yield active_unit_of_work.session
+        else:
+            with Session() as db:
+                yield db
+
+    @staticmethod
+    def _commit(db):
+        """
+        Function to commit the changes of a repository operation. Within
+        a unit of work the changes are only flushed, the unit of work
+        commits them.
+        """
+
+        if get_unit_of_work() is None:
+            db.commit()
+        else:
+            db.flush()
+
+    @staticmethod
+    def _rollback(db):
+        """
+        Function to roll back the changes of a failed repository
+        operation. Within a unit of work nothing is rolled back here,
+        the unit of work rolls back its whole transaction once the
+        exception leaves it.
+        """
 
-            return match
+        if get_unit_of_work() is None:
+            db.rollback()
 
     def _apply_query_params(self, db, query, query_params):
         return query
@@ -138,7 +220,7 @@ class Repository(ABC):
 
     def exists(self, query_params):
 
-        with Session() as db:
+        with self.session_scope() as db:
             try:
                 query = db.query(self.base_class)
                 query = self.apply_query_params(db, query, query_params)
@@ -149,7 +231,7 @@ class Repository(ABC):
 
     def find(self, query_params):
 
-        with Session() as db:
+        with self.session_scope() as db:
             try:
                 query = db.query(self.base_class)
                 query = self.apply_query_params(db, query, query_params)
@@ -165,7 +247,7 @@ class Repository(ABC):
 
     def count(self, query_params=None):
 
-        with Session() as db:
+        with self.session_scope() as db:
             try:
                 query = db.query(self.base_class)
                 query = self.apply_query_params(db, query, query_params)
@@ -1,7 +1,10 @@
-from .market_service import CCXTMarketService
+from .market_service import CCXTMarketService, AsyncCCXTMarketService, \
+    SyncCCXTMarketService
 from .performance_service import PerformanceService
 
 __all__ = [
     "PerformanceService",
-    "CCXTMarketService"
+    "CCXTMarketService",
+    "AsyncCCXTMarketService",
+    "SyncCCXTMarketService",
 ]
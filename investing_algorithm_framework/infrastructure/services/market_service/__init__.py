@@ -1,5 +1,12 @@
 from .ccxt_market_service import CCXTMarketService
+from .ccxt_async_market_service import AsyncCCXTMarketService, \
+    SyncCCXTMarketService
+from .rate_limiter import TokenBucketRateLimiter, get_rate_limiter
 
 __all__ = [
     "CCXTMarketService",
+    "AsyncCCXTMarketService",
+    "SyncCCXTMarketService",
+    "TokenBucketRateLimiter",
+    "get_rate_limiter",
 ]
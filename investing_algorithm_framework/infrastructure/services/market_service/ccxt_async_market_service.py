@@ -0,0 +1,342 @@
+import asyncio
+import logging
+from collections import defaultdict
+from datetime import timezone
+from threading import Lock, Thread, local
+
+import ccxt.async_support as ccxt_async
+
+from investing_algorithm_framework.domain import OperationalException, Order
+from .ccxt_market_service import CCXTMarketService
+
+logger = logging.getLogger(__name__)
+
+
+def _get_exchange_key(market, market_credential):
+
+    if market_credential is None:
+        return market.lower(), None
+
+    return market.lower(), market_credential.api_key
+
+
+class AsyncCCXTMarketService:
+    """
+    Market service on top of the async api of ccxt. Exchange instances
+    are pooled per market and credential, so the markets of an exchange
+    are only loaded once and connections are reused between calls.
+    Calls for multiple symbols or orders are sent concurrently, or with
+    a single batch request when the exchange supports it.
+    """
+
+    def __init__(self, market_credential_service):
+        self._market_credential_service = market_credential_service
+        self._exchanges = {}
+
+    def get_market_credential(self, market):
+
+        if self._market_credential_service is None:
+            return None
+
+        for market_credential in self._market_credential_service.get_all():
+            if market_credential.market.lower() == market.lower():
+                return market_credential
+
+        return None
+
+    def get_exchange(self, market):
+        market_credential = self.get_market_credential(market)
+        key = _get_exchange_key(market, market_credential)
+
+        if key not in self._exchanges:
+            market = market.lower()
+
+            if not hasattr(ccxt_async, market):
+                raise OperationalException(
+                    f"No market service found for market id {market}"
+                )
+
+            exchange_class = getattr(ccxt_async, market)
+
+            if market_credential is not None:
+                exchange = exchange_class({
+                    'apiKey': market_credential.api_key,
+                    'secret': market_credential.secret_key,
+                })
+            else:
+                exchange = exchange_class({})
+
+            self._exchanges[key] = exchange
+
+        return self._exchanges[key]
+
+    @staticmethod
+    def _check_support(exchange, market, functionality, method):
+
+        if not exchange.has[method]:
+            raise OperationalException(
+                f"Market service {market} does not support "
+                f"functionality {functionality}"
+            )
+
+    async def get_ticker(self, symbol, market):
+        exchange = self.get_exchange(market)
+        self._check_support(exchange, market, "get_ticker", "fetchTicker")
+
+        try:
+            return await exchange.fetchTicker(symbol)
+        except Exception as e:
+            logger.exception(e)
+            raise OperationalException(
+                f"Could not retrieve ticker for symbol {symbol}"
+            )
+
+    async def get_tickers(self, symbols, market):
+        exchange = self.get_exchange(market)
+
+        if exchange.has['fetchTickers']:
+
+            try:
+                return await exchange.fetchTickers(symbols)
+            except Exception as e:
+                logger.exception(e)
+                raise OperationalException(
+                    "Could not retrieve selection of tickers"
+                )
+
+        tickers = await asyncio.gather(
+            *[self.get_ticker(symbol, market) for symbol in symbols]
+        )
+        return dict(zip(symbols, tickers))
+
+    async def get_order_book(self, symbol, market):
+        exchange = self.get_exchange(market)
+        self._check_support(
+            exchange, market, "get_order_book", "fetchOrderBook"
+        )
+
+        try:
+            return await exchange.fetchOrderBook(symbol)
+        except Exception as e:
+            logger.exception(e)
+            raise OperationalException("Could not retrieve order book")
+
+    async def get_order_books(self, symbols, market):
+        order_books = await asyncio.gather(
+            *[self.get_order_book(symbol, market) for symbol in symbols],
+            return_exceptions=True
+        )
+        data = {}
+
+        for symbol, order_book in zip(symbols, order_books):
+
+            if isinstance(order_book, Exception):
+                logger.error(order_book)
+                continue
+
+            del order_book['symbol']
+            data[symbol] = order_book
+
+        return data
+
+    async def get_order(self, order, market):
+        exchange = self.get_exchange(market)
+        self._check_support(exchange, market, "get_order", "fetchOrder")
+        symbol = f"{order.target_symbol.upper()}/" \
+                 f"{order.trading_symbol.upper()}"
+
+        try:
+            return Order.from_ccxt_order(
+                await exchange.fetchOrder(order.external_id, symbol)
+            )
+        except Exception as e:
+            logger.exception(e)
+            raise OperationalException("Could not retrieve order")
+
+    async def get_order_updates(self, orders, market):
+        """
+        Function to retrieve the current state of the given orders from
+        the exchange. When the exchange supports fetchOrders, the orders
+        of a symbol are retrieved with one request from the creation date
+        of the oldest order. Orders that are not part of that response are
+        retrieved one by one, concurrently.
+
+        :param orders: list of orders with an external id
+        :param market: the market of the orders
+        :return: list of orders in the same order as the given orders
+        """
+        exchange = self.get_exchange(market)
+        ccxt_orders = {}
+
+        if exchange.has['fetchOrders']:
+            orders_per_symbol = defaultdict(list)
+
+            for order in orders:
+                symbol = f"{order.target_symbol.upper()}/" \
+                         f"{order.trading_symbol.upper()}"
+                orders_per_symbol[symbol].append(order)
+
+            responses = await asyncio.gather(
+                *[
+                    self._fetch_orders(exchange, symbol, symbol_orders)
+                    for symbol, symbol_orders in orders_per_symbol.items()
+                ],
+                return_exceptions=True
+            )
+
+            for response in responses:
+
+                if isinstance(response, Exception):
+                    logger.error(response)
+                    continue
+
+                for ccxt_order in response:
+                    ccxt_orders[ccxt_order["id"]] = ccxt_order
+
+        missing_orders = [
+            order for order in orders if order.external_id not in ccxt_orders
+        ]
+        missing_order_updates = await asyncio.gather(
+            *[self.get_order(order, market) for order in missing_orders]
+        )
+        order_updates = {
+            order.external_id: order_update for order, order_update
+            in zip(missing_orders, missing_order_updates)
+        }
+        return [
+            order_updates[order.external_id]
+            if order.external_id in order_updates
+            else Order.from_ccxt_order(ccxt_orders[order.external_id])
+            for order in orders
+        ]
+
+    @staticmethod
+    async def _fetch_orders(exchange, symbol, orders):
+        created_at = [
+            order.created_at for order in orders
+            if order.created_at is not None
+        ]
+        since = None
+
+        if len(created_at) == len(orders):
+            since = int(
+                min(created_at).replace(tzinfo=timezone.utc).timestamp()
+                * 1000
+            )
+
+        return await exchange.fetchOrders(symbol, since=since)
+
+    async def get_balance(self, market):
+
+        if self.get_market_credential(market) is None:
+            raise OperationalException(
+                f"You don't have a market credential for market {market}"
+            )
+
+        exchange = self.get_exchange(market)
+        self._check_support(exchange, market, "get_balance", "fetchBalance")
+
+        try:
+            return await exchange.fetchBalance()
+        except Exception as e:
+            logger.exception(e)
+            raise OperationalException(str(e))
+
+    async def close(self):
+        """
+        Function to close the connections of all pooled exchanges.
+        """
+        exchanges = list(self._exchanges.values())
+        self._exchanges = {}
+        await asyncio.gather(*[exchange.close() for exchange in exchanges])
+
+
+class SyncCCXTMarketService(CCXTMarketService):
+    """
+    Synchronous MarketService on top of the AsyncCCXTMarketService.
+
+    The read calls that benefit from pooling and concurrency are run
+    on an event loop in a background thread. All other calls use the
+    CCXTMarketService implementation with pooled synchronous exchanges.
+    Synchronous ccxt exchanges are not thread safe, so every thread gets
+    its own pool of exchanges.
+    """
+
+    def __init__(self, market_credential_service):
+        super().__init__(market_credential_service)
+        self.async_market_service = AsyncCCXTMarketService(
+            market_credential_service
+        )
+        self._local = local()
+        self._loop = None
+        self._lock = Lock()
+
+    def initialize_exchange(self, market, market_credential):
+        key = _get_exchange_key(market, market_credential)
+        exchanges = getattr(self._local, "exchanges", None)
+
+        if exchanges is None:
+            exchanges = {}
+            self._local.exchanges = exchanges
+
+        if key not in exchanges:
+            exchanges[key] = super()\
+                .initialize_exchange(market, market_credential)
+
+        return exchanges[key]
+
+    def _run(self, coroutine):
+
+        with self._lock:
+
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                Thread(target=self._loop.run_forever, daemon=True).start()
+
+        return asyncio.run_coroutine_threadsafe(coroutine, self._loop)\
+            .result()
+
+    def get_ticker(self, symbol, market):
+        return self._run(self.async_market_service.get_ticker(symbol, market))
+
+    def get_tickers(self, symbols, market):
+        return self._run(
+            self.async_market_service.get_tickers(symbols, market)
+        )
+
+    def get_order_book(self, symbol, market):
+        return self._run(
+            self.async_market_service.get_order_book(symbol, market)
+        )
+
+    def get_order_books(self, symbols, market):
+        return self._run(
+            self.async_market_service.get_order_books(symbols, market)
+        )
+
+    def get_order(self, order, market):
+        return self._run(self.async_market_service.get_order(order, market))
+
+    def get_order_updates(self, orders, market):
+        return self._run(
+            self.async_market_service.get_order_updates(orders, market)
+        )
+
+    def get_balance(self, market):
+        return self._run(self.async_market_service.get_balance(market))
+
+    def close(self):
+        """
+        Function to close the pooled exchanges and stop the event loop.
+        """
+
+        with self._lock:
+            loop = self._loop
+            self._loop = None
+            self._local = local()
+
+        if loop is not None:
+            asyncio.run_coroutine_threadsafe(
+                self.async_market_service.close(), loop
+            ).result()
+            loop.call_soon_threadsafe(loop.stop)
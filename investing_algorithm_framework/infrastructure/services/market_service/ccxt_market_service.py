@@ -1,11 +1,12 @@
 import logging
 from datetime import datetime
-from time import sleep
 
 import ccxt
+import numpy as np
 
 from investing_algorithm_framework.domain import OperationalException, Order, \
-    CCXT_DATETIME_FORMAT, MarketService
+    CCXT_DATETIME_FORMAT, MarketService, create_ohlcv_data_frame
+from .rate_limiter import get_rate_limiter
 
 logger = logging.getLogger(__name__)
 
@@ -352,31 +353,35 @@ class CCXTMarketService(MarketService):
             to_timestamp = exchange.parse8601(
                 to_timestamp.strftime(CCXT_DATETIME_FORMAT)
             )
-        data = []
+        timestamps = []
+        values = []
+        rate_limiter = get_rate_limiter(market, exchange.rateLimit)
 
         while from_time_stamp < to_timestamp:
+            rate_limiter.acquire()
             ohlcv = exchange.fetch_ohlcv(symbol, time_frame, from_time_stamp)
 
-            if len(ohlcv) > 0:
-                from_time_stamp = \
-                    ohlcv[-1][0] + exchange.parse_timeframe(time_frame) * 1000
-            else:
-                from_time_stamp = to_timestamp
+            if len(ohlcv) == 0:
+                break
 
-            for candle in ohlcv:
-                datetime_stamp = datetime.strptime(
-                    exchange.iso8601(candle[0]), CCXT_DATETIME_FORMAT
-                )
-                to_timestamp_datetime = datetime.strptime(
-                    exchange.iso8601(to_timestamp), CCXT_DATETIME_FORMAT
-                )
+            from_time_stamp = \
+                ohlcv[-1][0] + exchange.parse_timeframe(time_frame) * 1000
 
-                if datetime_stamp <= to_timestamp_datetime:
-                    data.append([datetime_stamp] + candle[1:])
+            # Pages are kept as raw arrays and only converted to a
+            # dataframe once all pages are downloaded
+            page = np.array(ohlcv, dtype=np.float64).reshape(-1, 6)
+            page = page[page[:, 0] <= to_timestamp]
+            timestamps.append(page[:, 0].astype(np.int64))
+            values.append(page[:, 1:])
 
-            sleep(exchange.rateLimit / 1000)
+        if len(timestamps) == 0:
+            return create_ohlcv_data_frame(
+                np.empty(0, dtype=np.int64), np.empty((0, 5))
+            )
 
-        return data
+        return create_ohlcv_data_frame(
+            np.concatenate(timestamps), np.concatenate(values)
+        )
 
     def get_ohlcvs(
         self,
@@ -0,0 +1,63 @@
+from threading import Lock
+from time import monotonic, sleep
+
+_rate_limiters = {}
+_rate_limiters_lock = Lock()
+
+
+class TokenBucketRateLimiter:
+    """
+    Thread safe token bucket rate limiter. The bucket is refilled with
+    `rate` tokens per second up to `capacity` tokens, and every request
+    takes one token. Requests only wait when the bucket is empty, so a
+    single caller is paced instead of slept after every request.
+    """
+
+    def __init__(self, rate, capacity=1):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated_at = monotonic()
+        self._lock = Lock()
+
+    def acquire(self):
+        """
+        Function to take a token from the bucket, waiting until a token
+        is available.
+        """
+
+        with self._lock:
+            now = monotonic()
+            self._tokens = min(
+                self.capacity,
+                self._tokens + (now - self._updated_at) * self.rate
+            )
+            self._updated_at = now
+            self._tokens -= 1
+            wait_time = -self._tokens / self.rate
+
+        # Tokens are reserved before waiting, so concurrent callers queue
+        # up behind each other instead of waking at the same time
+        if wait_time > 0:
+            sleep(wait_time)
+
+
+def get_rate_limiter(market, rate_limit):
+    """
+    Function to get the rate limiter of a market. Rate limits are per
+    market, so all market services share one limiter per market.
+
+    :param market: the id of the market
+    :param rate_limit: the minimum time between two requests in milliseconds
+    :return: a TokenBucketRateLimiter
+    """
+    market = market.lower()
+
+    with _rate_limiters_lock:
+
+        if market not in _rate_limiters:
+            _rate_limiters[market] = TokenBucketRateLimiter(
+                rate=1000 / max(rate_limit, 1)
+            )
+
+        return _rate_limiters[market]
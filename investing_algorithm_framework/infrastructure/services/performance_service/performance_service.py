@@ -90,62 +90,25 @@ class PerformanceService:
         return total_number_of_negative_orders / total_number_of_orders * 100
 
     def get_growth_rate_of_backtest(self, portfolio_id, tickers, backtest_profile):
-        portfolio = self.portfolio_repository.find({"id": portfolio_id})
-        positions = self.position_repository.get_all(
-            {"portfolio_id": portfolio.id}
+        gain = self.get_growth_of_backtest(
+            portfolio_id, tickers, backtest_profile
         )
-        allocated = 0
-
-        for position in positions:
-
-            if position.symbol == portfolio.trading_symbol:
-                continue
-
-            pending_orders = self.order_repository.get_all(
-                {
-                    "position_id": position.id,
-                    "status": OrderStatus.OPEN.value,
-                }
-            )
-            pending_value = 0
-
-            for order in pending_orders:
-                pending_value += order.amount * order.price
-
-            allocated += position.amount * tickers[position.symbol]["bid"]
-            allocated += pending_value
-
-        current_total_value = allocated + portfolio.unallocated
-        gain = current_total_value - backtest_profile.initial_unallocated
         return gain / backtest_profile.initial_unallocated * 100
 
     def get_growth_of_backtest(self, portfolio_id, tickers, backtest_profile):
         portfolio = self.portfolio_repository.find({"id": portfolio_id})
         positions = self.position_repository.get_all(
-            {"portfolio_id": portfolio.id}
+            {"portfolio": portfolio.id}
         )
-        allocated = 0
-
-        for position in positions:
-
-            if position.symbol == portfolio.trading_symbol:
-                continue
-
-            pending_orders = self.order_repository.get_all(
-                {
-                    "position_id": position.id,
-                    "status": OrderStatus.OPEN.value,
-                }
-            )
-            pending_value = 0
-
-            for order in pending_orders:
-                pending_value += order.amount * order.price
-
-            allocated += position.amount * tickers[position.symbol]["bid"]
-            allocated += pending_value
-
-        current_total_value = allocated + portfolio.unallocated
+        pending_orders = self.order_repository.get_all(
+            {
+                "portfolio_id": portfolio.id,
+                "status": OrderStatus.OPEN.value,
+            }
+        )
+        current_total_value = self._get_total_value(
+            portfolio, positions, tickers
+        ) + self._get_pending_value(portfolio, positions, pending_orders)
         return current_total_value - backtest_profile.initial_unallocated
 
     def get_total_net_gain_percentage_of_backtest(self, portfolio_id, backtest_profile):
@@ -156,18 +119,9 @@ class PerformanceService:
     def get_total_value(self, portfolio_id, tickers, backtest_profile):
         portfolio = self.portfolio_repository.find({"id": portfolio_id})
         positions = self.position_repository.get_all(
-            {"portfolio_id": portfolio.id}
+            {"portfolio": portfolio.id}
         )
-        allocated = 0
-
-        for position in positions:
-
-            if position.symbol == portfolio.trading_symbol:
-                continue
-
-            allocated += position.amount * tickers[position.symbol]["bid"]
-
-        return allocated + portfolio.unallocated
+        return self._get_total_value(portfolio, positions, tickers)
 
     def get_average_trade_duration(self, portfolio_id):
         portfolio = self.portfolio_repository.find({"id": portfolio_id})
@@ -213,4 +167,118 @@ class PerformanceService:
         for order in closed_buy_orders:
             total_size += order.get_amount() * order.get_price()
 
-        return total_size / len(closed_buy_orders)
\ No newline at end of file
+        return total_size / len(closed_buy_orders)
+
+    def get_backtest_report_metrics(
+        self, portfolio_id, tickers, backtest_profile
+    ):
+        """
+        Function to calculate all metrics of a backtest report. The
+        portfolio, its orders and its positions are retrieved once, and
+        the metrics are calculated in a single pass over the orders.
+
+        :return: dict with the metrics, keyed on the attribute names of
+            the BacktestProfile, and the amount in pending orders per
+            symbol under amount_pending
+        """
+        portfolio = self.portfolio_repository.find({"id": portfolio_id})
+        orders = self.order_repository.get_all({"portfolio_id": portfolio.id})
+        positions = self.position_repository.get_all(
+            {"portfolio": portfolio.id}
+        )
+        number_of_closed_orders = 0
+        number_of_positive_orders = 0
+        number_of_negative_orders = 0
+        number_of_trades_closed = 0
+        number_of_trades_open = 0
+        total_trade_duration = 0
+        total_trade_size = 0
+        pending_orders = []
+        amount_pending = {}
+
+        for order in orders:
+
+            if OrderStatus.CLOSED.equals(order.status):
+                number_of_closed_orders += 1
+
+                if order.get_net_gain() > 0:
+                    number_of_positive_orders += 1
+                elif order.get_net_gain() < 0:
+                    number_of_negative_orders += 1
+
+            elif OrderStatus.OPEN.equals(order.status):
+                pending_orders.append(order)
+                amount_pending[order.target_symbol] = \
+                    amount_pending.get(order.target_symbol, 0) + order.amount
+
+            if not OrderSide.BUY.equals(order.order_side):
+                continue
+
+            if order.get_trade_closed_at() is None:
+                number_of_trades_open += 1
+            else:
+                number_of_trades_closed += 1
+                duration = order.get_trade_closed_at() - order.get_created_at()
+                total_trade_duration += duration.total_seconds() / 3600
+                total_trade_size += order.get_amount() * order.get_price()
+
+        total_value = self._get_total_value(portfolio, positions, tickers)
+        growth = total_value \
+            + self._get_pending_value(portfolio, positions, pending_orders) \
+            - backtest_profile.initial_unallocated
+        metrics = {
+            "number_of_orders": len(orders),
+            "number_of_positions": len(
+                [position for position in positions if position.amount > 0]
+            ),
+            "number_of_trades_closed": number_of_trades_closed,
+            "number_of_trades_open": number_of_trades_open,
+            "percentage_positive_trades": 0.0,
+            "percentage_negative_trades": 0.0,
+            "total_net_gain_percentage": portfolio.total_net_gain
+            / backtest_profile.initial_unallocated * 100,
+            "growth": growth,
+            "growth_rate": growth / backtest_profile.initial_unallocated * 100,
+            "total_value": total_value,
+            "average_trade_duration": 0,
+            "average_trade_size": 0,
+            "amount_pending": amount_pending,
+        }
+
+        if number_of_closed_orders > 0:
+            metrics["percentage_positive_trades"] = \
+                number_of_positive_orders / number_of_closed_orders * 100
+            metrics["percentage_negative_trades"] = \
+                number_of_negative_orders / number_of_closed_orders * 100
+
+        if number_of_trades_closed > 0:
+            metrics["average_trade_duration"] = \
+                total_trade_duration / number_of_trades_closed
+            metrics["average_trade_size"] = \
+                total_trade_size / number_of_trades_closed
+
+        return metrics
+
+    @staticmethod
+    def _get_total_value(portfolio, positions, tickers):
+        allocated = 0
+
+        for position in positions:
+
+            if position.symbol == portfolio.trading_symbol:
+                continue
+
+            allocated += position.amount * tickers[position.symbol]["bid"]
+
+        return allocated + portfolio.unallocated
+
+    @staticmethod
+    def _get_pending_value(portfolio, positions, pending_orders):
+        position_ids = [
+            position.id for position in positions
+            if position.symbol != portfolio.trading_symbol
+        ]
+        return sum(
+            order.amount * order.price for order in pending_orders
+            if order.position_id in position_ids
+        )
@@ -7,8 +7,9 @@ from .repository_service import RepositoryService
 from .strategy_orchestrator_service import StrategyOrchestratorService
 from .portfolio_configuration_service import PortfolioConfigurationService
 from .market_data_source_service import MarketDataSourceService, \
-    BacktestMarketDataSourceService
+    BacktestMarketDataSourceService, MarketDataContext
 from .backtest_service import BackTestService
+from .vector_backtest_service import VectorBacktestService
 from .configuration_service import ConfigurationService
 from .market_credential_service import MarketCredentialService
 
@@ -22,11 +23,13 @@ __all__ = [
     "PortfolioConfigurationService",
     "MarketDataSourceService",
     "BackTestService",
+    "VectorBacktestService",
     "OrderBacktestService",
     "ConfigurationService",
     "PortfolioSnapshotService",
     "PositionSnapshotService",
     "MarketCredentialService",
     "BacktestMarketDataSourceService",
-    "BacktestPortfolioService"
+    "BacktestPortfolioService",
+    "MarketDataContext",
 ]
@@ -1,13 +1,15 @@
 from datetime import datetime, timedelta
 
+import numpy as np
 import pandas as pd
 from tqdm import tqdm
 
 from investing_algorithm_framework.domain import BacktestProfile, \
     BACKTESTING_INDEX_DATETIME, TimeUnit, BacktestPosition, \
-    TradingDataType, OrderStatus, OperationalException, MarketDataSource, \
-    MarketService
-from .market_data_source_service import MarketDataSourceService
+    TradingDataType, OperationalException, MarketService, OrderStatus, \
+    OrderSide, EquityCurve
+from .market_data_source_service import MarketDataSourceService, \
+    MarketDataContext
 
 
 class BackTestService:
@@ -32,6 +34,9 @@ class BackTestService:
         self._market_data_source_service: MarketDataSourceService \
             = market_data_source_service
         self._backtest_market_data_sources = []
+        self._last_prices = {}
+        self._holdings = None
+        self._holdings_version = None
 
     @property
     def resource_directory(self):
@@ -41,7 +46,20 @@ class BackTestService:
     def resource_directory(self, resource_directory):
         self._resource_directory = resource_directory
 
-    def backtest(self, algorithm, start_date, end_date=None):
+    def backtest(
+        self, algorithm, start_date, end_date=None, sparse_schedule=False
+    ):
+        """
+        Function to run the strategies of the algorithm at every time of
+        the backtest schedule.
+
+        With a sparse schedule, a run is skipped when the data of the
+        market data sources of its strategy did not change since its
+        previous run and there are no pending orders. The equity is still
+        recorded for skipped runs, so the risk metrics are the same as
+        with the complete schedule. The number of skipped runs is
+        reported in the backtest profile.
+        """
         strategy_profiles = []
         portfolios = self._portfolio_repository.get_all()
         initial_unallocated = 0
@@ -66,39 +84,186 @@ class BackTestService:
             start_date=start_date,
             end_date=end_date
         )
-
-        for index, row in tqdm(schedule.iterrows(), total=len(schedule),
-                               desc="Running backtests", colour="GREEN"):
-            strategy_profile = self.get_strategy_from_strategy_profiles(
-                strategy_profiles, row['id']
-            )
-            self.run_backtest_for_profile(
-                algorithm=algorithm,
-                strategy=algorithm.get_strategy(strategy_profile.strategy_id),
-                index_date=index,
+        strategies = {
+            strategy_profile.strategy_id: algorithm.get_strategy(
+                strategy_profile.strategy_id
             )
+            for strategy_profile in strategy_profiles
+        }
+        run_times = schedule.index.to_pydatetime()
+        # The equity is recorded once per run time, after the last
+        # strategy that runs at that time
+        schedule_run_times = schedule.index.to_numpy()
+        last_runs = np.append(
+            schedule_run_times[1:] != schedule_run_times[:-1], True
+        )
+        strategy_ids = schedule["id"].to_numpy()
+        equity_curves = {
+            portfolio.id: EquityCurve(capacity=int(last_runs.sum()))
+            for portfolio in portfolios
+        }
+        self._last_prices = {}
+        self._holdings = None
+        market_data_context = None
+        changed_runs = None
+        number_of_skipped_runs = 0
+
+        if sparse_schedule:
+            changed_runs = self.get_changed_runs(schedule, strategies)
+
+        for index, (run_time, strategy_id) in enumerate(tqdm(
+            zip(run_times, strategy_ids),
+            total=len(schedule),
+            desc="Running backtests",
+            colour="GREEN"
+        )):
+
+            if changed_runs is not None and not changed_runs[index] \
+                    and not self._order_service.exists(
+                        {"status": OrderStatus.OPEN.value}
+                    ):
+                number_of_skipped_runs += 1
+                algorithm.config[BACKTESTING_INDEX_DATETIME] = run_time
+            else:
+                # Strategies that run at the same time share their
+                # market data
+                if market_data_context is None \
+                        or market_data_context.timestamp != run_time:
+                    market_data_context = MarketDataContext(
+                        self._market_data_source_service, timestamp=run_time
+                    )
 
+                self.run_backtest_for_profile(
+                    algorithm=algorithm,
+                    strategy=strategies[strategy_id],
+                    index_date=run_time,
+                    market_data_context=market_data_context
+                )
+
+            # A skipped run did not change the state, but the equity is
+            # still recorded at the prices of the run, like with the
+            # complete schedule
+            if last_runs[index]:
+                self.record_equity(equity_curves, run_time)
+
+        self._order_service.create_pending_snapshots(flush=True)
         return self.create_backtest_report(
-            algorithm, len(schedule), start_date, end_date, initial_unallocated
+            algorithm,
+            len(schedule) - number_of_skipped_runs,
+            start_date,
+            end_date,
+            initial_unallocated,
+            equity_curves=equity_curves,
+            number_of_skipped_runs=number_of_skipped_runs
         )
 
-    def run_backtest_for_profile(self, algorithm, strategy, index_date):
+    def run_backtest_for_profile(
+        self, algorithm, strategy, index_date, market_data_context=None
+    ):
         algorithm.config[BACKTESTING_INDEX_DATETIME] = index_date
-        market_data = {}
 
-        for data_id in strategy.strategy_profile.market_data_sources:
+        if market_data_context is None:
+            market_data_context = MarketDataContext(
+                self._market_data_source_service, timestamp=index_date
+            )
 
-            if isinstance(data_id, MarketDataSource):
-                market_data[data_id.get_identifier()] = \
-                    self._market_data_source_service.get_data(
-                        data_id.get_identifier()
-                    )
-            else:
-                market_data[data_id] = \
-                    self._market_data_source_service.get_data(data_id)
+        market_data = market_data_context.get_market_data(
+            strategy.strategy_profile.market_data_sources
+        )
 
         self._order_service.check_pending_orders()
         strategy.run_strategy(algorithm=algorithm, market_data=market_data)
+        self._order_service.create_pending_snapshots()
+
+    def record_equity(self, equity_curves, run_time):
+        """
+        Function to record the equity, cash and exposure of every
+        portfolio after a run in its equity curve.
+
+        The cash, positions and open orders of the portfolios are only
+        read from the repositories after orders were created or updated,
+        so a run without order changes only prices the held positions.
+        Nothing is written to the database.
+        """
+
+        if self._holdings is None or self._holdings_version \
+                != self._order_service.number_of_changes:
+            self._holdings = self._get_holdings()
+            self._holdings_version = self._order_service.number_of_changes
+
+        for portfolio_id, holdings in self._holdings.items():
+            portfolio = holdings["portfolio"]
+            allocated = holdings["open_sell_value"]
+
+            for position in holdings["positions"]:
+                allocated += position.amount \
+                    * self._get_price(position, portfolio)
+
+            cash = holdings["cash"]
+            equity = cash + allocated + holdings["pending_buy_value"]
+            equity_curves[portfolio_id].record(
+                run_time,
+                equity=equity,
+                cash=cash,
+                exposure=allocated / equity if equity > 0 else 0
+            )
+
+    def _get_holdings(self):
+        """
+        Function to read the cash, the positions that are not the
+        trading symbol and the value of the open orders of every
+        portfolio from the repositories.
+        """
+        holdings = {
+            portfolio.id: {
+                "portfolio": portfolio,
+                "cash": portfolio.unallocated,
+                "positions": [],
+                "pending_buy_value": 0,
+                "open_sell_value": 0,
+            }
+            for portfolio in self._portfolio_repository.get_all()
+        }
+        position_portfolio_ids = {}
+
+        for position in self._position_repository.get_all():
+            portfolio_holdings = holdings[position.portfolio_id]
+            position_portfolio_ids[position.id] = position.portfolio_id
+
+            if position.symbol != portfolio_holdings["portfolio"]\
+                    .trading_symbol and position.amount != 0:
+                portfolio_holdings["positions"].append(position)
+
+        # The amount of open sell orders is no longer part of the position,
+        # but is still exposed to the market until the order is filled
+        for order in self._order_service\
+                .get_all({"status": OrderStatus.OPEN.value}):
+            portfolio_holdings = holdings[
+                position_portfolio_ids[order.position_id]
+            ]
+
+            if OrderSide.BUY.equals(order.order_side):
+                portfolio_holdings["pending_buy_value"] += \
+                    order.amount * order.price
+            else:
+                portfolio_holdings["open_sell_value"] += \
+                    order.amount * order.price
+
+        return holdings
+
+    def _get_price(self, position, portfolio):
+        symbol = f"{position.symbol}/{portfolio.trading_symbol}"
+
+        try:
+            self._last_prices[symbol] = self._market_data_source_service\
+                .get_ticker(symbol, market=portfolio.market)["bid"]
+        except OperationalException:
+
+            # Without a ticker for this run, the last known price is used
+            if symbol not in self._last_prices:
+                return position.cost / position.amount
+
+        return self._last_prices[symbol]
 
     def generate_schedule(
         self,
@@ -106,48 +271,130 @@ class BackTestService:
         start_date,
         end_date
     ):
-        data = []
+        """
+        Function to generate the backtest schedule of all strategies.
+
+        The run times of every strategy are generated as a vectorized date
+        range. Because each of these ranges is already sorted, they are
+        merged with a stable sort over the concatenated runs, which keeps
+        the order of the strategies for equal run times.
+
+        :return: a DataFrame indexed on run_time with the strategy id
+            as column.
+        """
+        run_times = []
+        strategy_ids = []
 
         for strategy in strategies:
-            id = strategy.strategy_profile.strategy_id
-            time_unit = strategy.strategy_profile.time_unit
-            interval = strategy.strategy_profile.interval
-            current_time = start_date
-            # ohlcv_data_index_date = strategy.strategy_profile.backtest_data_index_date
-
-            while current_time <= end_date:
-                data.append({
-                    "id": id,
-                    'run_time': current_time,
-                    # 'ohlcv_data_index_date': ohlcv_data_index_date
-                })
-
-                if TimeUnit.SECOND.equals(time_unit):
-                    current_time += timedelta(seconds=interval)
-                    # ohlcv_data_index_date += timedelta(seconds=interval)
-                elif TimeUnit.MINUTE.equals(time_unit):
-                    current_time += timedelta(minutes=interval)
-                    # ohlcv_data_index_date += timedelta(minutes=interval)
-                elif TimeUnit.HOUR.equals(time_unit):
-                    current_time += timedelta(hours=interval)
-                    # ohlcv_data_index_date += timedelta(hours=interval)
-                elif TimeUnit.DAY.equals(time_unit):
-                    current_time += timedelta(days=interval)
-                    # ohlcv_data_index_date += timedelta(days=interval)
-                else:
-                    raise ValueError(f"Unsupported time unit: {time_unit}")
+            strategy_profile = strategy.strategy_profile
+            strategy_run_times = pd.date_range(
+                start=start_date,
+                end=end_date,
+                freq=self._get_run_interval(
+                    strategy_profile.time_unit, strategy_profile.interval
+                )
+            ).to_numpy()
+            run_times.append(strategy_run_times)
+            strategy_ids.append(
+                np.full(
+                    len(strategy_run_times),
+                    strategy_profile.strategy_id,
+                    dtype=object
+                )
+            )
 
-        schedule_df = pd.DataFrame(data)
-        if schedule_df.empty:
+        if len(run_times) == 0:
             raise OperationalException(
                 "Could not generate schedule "
                 "for backtest, do you have a strategy "
                 "registered for your algorithm?"
             )
 
-        schedule_df.sort_values(by='run_time', inplace=True)
-        schedule_df.set_index('run_time', inplace=True)
-        return schedule_df
+        run_times = np.concatenate(run_times)
+        strategy_ids = np.concatenate(strategy_ids)
+        order = np.argsort(run_times, kind="stable")
+        return pd.DataFrame(
+            {"id": strategy_ids[order]},
+            index=pd.DatetimeIndex(run_times[order], name="run_time")
+        )
+
+    def get_changed_runs(self, schedule, strategies):
+        """
+        Function to check for every run of the schedule if the data of
+        the market data sources of its strategy changed since the
+        previous run of the strategy.
+
+        The update timestamps of the market data sources of a strategy
+        are merged, after which the number of updates up to every run
+        time is found with a binary search. A run changed when that
+        number is larger than for the previous run. The first run of a
+        strategy, and all runs of a strategy of which a market data
+        source does not have update timestamps, are always changed.
+
+        :return: boolean numpy array with an element for every run
+        """
+        update_timestamps = {
+            market_data_source.get_identifier():
+                market_data_source.get_update_timestamps()
+            for market_data_source in self._market_data_source_service
+            .get_market_data_sources()
+            if market_data_source is not None
+        }
+        run_times = schedule.index.to_numpy().astype("datetime64[us]")
+        strategy_ids = schedule["id"].to_numpy()
+        changed_runs = np.ones(len(schedule), dtype=bool)
+
+        for strategy_id, strategy in strategies.items():
+            timestamps = self._get_strategy_update_timestamps(
+                strategy, update_timestamps
+            )
+
+            if timestamps is None:
+                continue
+
+            indexes = np.flatnonzero(strategy_ids == strategy_id)
+            number_of_updates = np.searchsorted(
+                timestamps, run_times[indexes], side="right"
+            )
+            changed_runs[indexes[1:]] = np.diff(number_of_updates) > 0
+
+        return changed_runs
+
+    @staticmethod
+    def _get_strategy_update_timestamps(strategy, update_timestamps):
+        identifiers = [
+            market_data_source
+            if isinstance(market_data_source, str)
+            else market_data_source.get_identifier()
+            for market_data_source in strategy.market_data_sources or []
+        ]
+        timestamps = [
+            update_timestamps.get(identifier) for identifier in identifiers
+        ]
+
+        if len(timestamps) == 0 \
+                or any(timestamp is None for timestamp in timestamps):
+            return None
+
+        return np.unique(
+            np.concatenate([
+                timestamp.astype("datetime64[us]") for timestamp in timestamps
+            ])
+        )
+
+    @staticmethod
+    def _get_run_interval(time_unit, interval):
+
+        if TimeUnit.SECOND.equals(time_unit):
+            return timedelta(seconds=interval)
+        elif TimeUnit.MINUTE.equals(time_unit):
+            return timedelta(minutes=interval)
+        elif TimeUnit.HOUR.equals(time_unit):
+            return timedelta(hours=interval)
+        elif TimeUnit.DAY.equals(time_unit):
+            return timedelta(days=interval)
+
+        raise ValueError(f"Unsupported time unit: {time_unit}")
 
     def get_strategy_from_strategy_profiles(self, strategy_profiles, id):
 
@@ -164,7 +411,9 @@ class BackTestService:
         number_of_runs,
         start_date,
         end_date,
-        initial_unallocated=0
+        initial_unallocated=0,
+        equity_curves=None,
+        number_of_skipped_runs=0
     ):
         for portfolio in self._portfolio_repository.get_all():
 
@@ -176,29 +425,10 @@ class BackTestService:
                 trading_symbol=portfolio.trading_symbol,
             )
             backtest_profile.number_of_runs = number_of_runs
+            backtest_profile.number_of_skipped_runs = number_of_skipped_runs
             backtest_profile.number_of_days = (end_date - start_date).days
-            backtest_profile.number_of_orders = self._order_service.count({
-                "portfolio": portfolio.id
-            })
-            backtest_profile.number_of_positions = self._position_repository.count(
-                {
-                    "portfolio": portfolio.id,
-                    "amount_gt": 0
-                })
-            backtest_profile.percentage_negative_trades = self._performance_service \
-                .get_percentage_negative_trades(portfolio.id)
-            backtest_profile.percentage_positive_trades = self._performance_service \
-                .get_percentage_positive_trades(portfolio.id)
-            backtest_profile.number_of_trades_closed = self._performance_service \
-                .get_number_of_trades_closed(portfolio.id)
-            backtest_profile.number_of_trades_open = self._performance_service \
-                .get_number_of_trades_open(portfolio.id)
             backtest_profile.total_cost = portfolio.total_cost
             backtest_profile.total_net_gain = portfolio.total_net_gain
-            backtest_profile.total_net_gain_percentage = self._performance_service \
-                .get_total_net_gain_percentage_of_backtest(
-                portfolio.id, backtest_profile
-            )
             positions = self._position_repository.get_all({
                 "portfolio": portfolio.id
             })
@@ -213,21 +443,23 @@ class BackTestService:
                             market=portfolio.market
                         )
 
-            backtest_profile.growth_rate = self._performance_service \
-                .get_growth_rate_of_backtest(
+            metrics = self._performance_service.get_backtest_report_metrics(
                 portfolio.id, tickers, backtest_profile
             )
-            backtest_profile.growth = self._performance_service \
-                .get_growth_of_backtest(portfolio.id, tickers, backtest_profile)
-            backtest_profile.total_value = self._performance_service \
-                .get_total_value(portfolio.id, tickers, backtest_profile)
-            backtest_profile.average_trade_duration = \
-                self._performance_service.get_average_trade_duration(portfolio.id)
-            backtest_profile.average_trade_size = \
-                self._performance_service.get_average_trade_size(portfolio.id)
-            positions = self._position_repository.get_all({
-                "portfolio": portfolio.id
-            })
+            amount_pending = metrics.pop("amount_pending")
+
+            for name, value in metrics.items():
+                setattr(backtest_profile, name, value)
+
+            equity_curve = None if equity_curves is None \
+                else equity_curves.get(portfolio.id)
+
+            if equity_curve is not None:
+                backtest_profile.equity_curve = equity_curve
+
+                for name, value in equity_curve.get_risk_metrics().items():
+                    setattr(backtest_profile, name, value)
+
             backtest_positions = []
 
             for position in positions:
@@ -240,30 +472,12 @@ class BackTestService:
                     )
                     backtest_position.price = 1
                 else:
-                    pending_orders = self._order_service.get_all({
-                        "portfolio": portfolio.id,
-                        "target_symbol": position.symbol,
-                        "status": OrderStatus.OPEN.value
-                    })
-
-                    amount_in_pending_orders = 0
-
-                    for order in pending_orders:
-                        amount_in_pending_orders += order.amount
-
                     backtest_position = BacktestPosition(
                         position,
-                        amount_pending=amount_in_pending_orders,
+                        amount_pending=amount_pending.get(position.symbol, 0),
                         total_value_portfolio=backtest_profile.total_value
                     )
-                    # Probably not needed
-                    ticker = self._market_data_source_service \
-                        .get_ticker(
-                            symbol=f"{position.symbol}"
-                                   f"/{portfolio.trading_symbol}",
-                            market=portfolio.market
-                        )
-                    backtest_position.price = ticker["bid"]
+                    backtest_position.price = tickers[position.symbol]["bid"]
                 backtest_positions.append(backtest_position)
             backtest_profile.positions = backtest_positions
             backtest_profile.trades = algorithm.get_trades()
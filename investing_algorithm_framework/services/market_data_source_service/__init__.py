@@ -1,8 +1,10 @@
 from .market_data_source_service import MarketDataSourceService
 from .backtest_market_data_source_service import \
     BacktestMarketDataSourceService
+from .market_data_context import MarketDataContext
 
 __all__ = [
     "MarketDataSourceService",
-    "BacktestMarketDataSourceService"
-]
\ No newline at end of file
+    "BacktestMarketDataSourceService",
+    "MarketDataContext",
+]
@@ -1,4 +1,6 @@
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import List
+
 from tqdm import tqdm
 
 from investing_algorithm_framework.domain import MarketService, \
@@ -20,7 +22,7 @@ class BacktestMarketDataSourceService(MarketDataSourceService):
     These objects are used to prepare the data for backtesting.
 
     The prepare_data method of BacktestMarketDataSource is called in the
-    constructor.
+    constructor, for all data sources concurrently.
     """
     def __init__(
         self,
@@ -39,23 +41,56 @@ class BacktestMarketDataSourceService(MarketDataSourceService):
         self._configuration_service: ConfigurationService = \
             configuration_service
 
-        for backtest_market_data_source in tqdm(
-                market_data_sources,
-                total=len(self._market_data_sources),
-                desc="Preparing backtest market data",
-                colour="GREEN"
-        ):
+        self.prepare_market_data_sources(
+            market_data_sources=market_data_sources,
+            config=configuration_service.get_config(),
+            backtest_start_date=configuration_service
+            .get_config()[BACKTESTING_START_DATE],
+            backtest_end_date=configuration_service
+            .get_config()[BACKTESTING_END_DATE],
+            market_credential_service=self._market_credential_service,
+        )
+
+    @staticmethod
+    def prepare_market_data_sources(
+        market_data_sources: List[BacktestMarketDataSource],
+        config,
+        backtest_start_date,
+        backtest_end_date,
+        market_credential_service: MarketCredentialService,
+        max_workers=None
+    ):
+        """
+        Function to prepare the data of the given backtest market data
+        sources concurrently. Downloads are paced by the rate limiter of
+        their market, so data sources of different markets are prepared
+        in parallel while the requests to one market are spread out.
+        """
+
+        def prepare_data(backtest_market_data_source):
             backtest_market_data_source.market_credentials_service = \
-                self._market_credential_service
+                market_credential_service
             backtest_market_data_source.prepare_data(
-                config=configuration_service.get_config(),
-                backtest_start_date=configuration_service
-                .get_config()[BACKTESTING_START_DATE],
-                backtest_end_date=configuration_service
-                .get_config()[BACKTESTING_END_DATE],
-                market_credential_service=self._market_credential_service
+                config=config,
+                backtest_start_date=backtest_start_date,
+                backtest_end_date=backtest_end_date,
+                market_credential_service=market_credential_service
             )
 
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(prepare_data, backtest_market_data_source)
+                for backtest_market_data_source in market_data_sources
+            ]
+
+            for future in tqdm(
+                as_completed(futures),
+                total=len(futures),
+                desc="Preparing backtest market data",
+                colour="GREEN"
+            ):
+                future.result()
+
     def get_data(self, identifier):
         """
         This method is used to get the data for backtesting. It loops
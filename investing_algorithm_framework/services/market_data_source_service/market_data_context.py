@@ -0,0 +1,86 @@
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+
+from investing_algorithm_framework.domain import MarketDataSource
+
+
+class MarketDataContext:
+    """
+    Market data of a single tick, shared by all strategies that run at
+    that tick. Every market data source identifier is resolved at most
+    once, and the strategies get the same data objects. Dicts, like
+    tickers and order books, are handed out as read only mappings so a
+    strategy can't change the data of the other strategies.
+
+    With concurrent, the missing identifiers of a prefetch are resolved
+    in parallel, which is used in live mode where every identifier is a
+    request to an exchange.
+    """
+
+    def __init__(
+        self,
+        market_data_source_service,
+        timestamp=None,
+        concurrent=False,
+        max_workers=None
+    ):
+        self._market_data_source_service = market_data_source_service
+        self._timestamp = timestamp
+        self._concurrent = concurrent
+        self._max_workers = max_workers
+        self._data = {}
+
+    @property
+    def timestamp(self):
+        return self._timestamp
+
+    @staticmethod
+    def get_identifier(market_data_source):
+
+        if isinstance(market_data_source, MarketDataSource):
+            return market_data_source.get_identifier()
+
+        return market_data_source
+
+    def prefetch(self, market_data_sources):
+        """
+        Function to resolve the data of all given market data sources
+        that are not yet in the context.
+        """
+        identifiers = [
+            identifier for identifier in dict.fromkeys(
+                self.get_identifier(market_data_source)
+                for market_data_source in market_data_sources or []
+            )
+            if identifier not in self._data
+        ]
+
+        if self._concurrent and len(identifiers) > 1:
+
+            with ThreadPoolExecutor(max_workers=self._max_workers) \
+                    as executor:
+                data = list(executor.map(self._get_data, identifiers))
+        else:
+            data = [self._get_data(identifier) for identifier in identifiers]
+
+        self._data.update(zip(identifiers, data))
+
+    def get_market_data(self, market_data_sources):
+        """
+        Function to get the market data dict that is passed to a strategy
+        with the given market data sources.
+        """
+        self.prefetch(market_data_sources)
+        return {
+            self.get_identifier(market_data_source):
+                self._data[self.get_identifier(market_data_source)]
+            for market_data_source in market_data_sources or []
+        }
+
+    def _get_data(self, identifier):
+        data = self._market_data_source_service.get_data(identifier=identifier)
+
+        if isinstance(data, dict):
+            return MappingProxyType(data)
+
+        return data
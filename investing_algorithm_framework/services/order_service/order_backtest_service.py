@@ -2,7 +2,7 @@ import logging
 
 from investing_algorithm_framework.domain import BACKTESTING_INDEX_DATETIME, \
     OrderStatus, BACKTESTING_PENDING_ORDER_CHECK_INTERVAL, \
-    OperationalException, DATETIME_FORMAT
+    OperationalException
 from investing_algorithm_framework.services.market_data_source_service \
     import BacktestMarketDataSourceService
 from .order_service import OrderService
@@ -33,6 +33,8 @@ class OrderBacktestService(OrderService):
         self.configuration_service = configuration_service
         self._market_data_source_service: BacktestMarketDataSourceService = \
             market_data_source_service
+        self._order_price_ranges = {}
+        self.number_of_changes = 0
 
     def execute_order(self, order_id, portfolio):
         order = self.get(order_id)
@@ -48,62 +50,84 @@ class OrderBacktestService(OrderService):
         return order
 
     def check_pending_orders(self):
+        """
+        Function to check if the open orders are filled at the current
+        backtest index date.
+
+        Open orders are grouped by symbol and market, so one slice of
+        ohlcv data serves all orders of a symbol. For every order the
+        lowest and highest price since its creation are tracked together
+        with the last checked candle, so each check only requests and
+        scans the candles that are new since the previous check.
+        """
         pending_orders = self.get_all({"status": OrderStatus.OPEN.value})
         logger.info(f"Checking {len(pending_orders)} open orders")
         config = self.configuration_service.get_config()
+        orders_by_symbol = {}
+
+        # Forget the price ranges of orders that are no longer open
+        pending_order_ids = set(order.id for order in pending_orders)
+        self._order_price_ranges = {
+            order_id: price_range for order_id, price_range
+            in self._order_price_ranges.items()
+            if order_id in pending_order_ids
+        }
 
         for order in pending_orders:
             symbol = f"{order.target_symbol.upper()}" \
                      f"/{order.trading_symbol.upper()}"
             position = self.position_repository.get(order.position_id)
             portfolio = self.portfolio_repository.get(position.portfolio_id)
+            orders_by_symbol.setdefault((symbol, portfolio.market), [])\
+                .append(order)
+
+        for (symbol, market), orders in orders_by_symbol.items():
 
             if not self._market_data_source_service\
                     .is_ohlcv_data_source_present(
                         symbol=symbol,
-                        market=portfolio.market,
+                        market=market,
                         time_frame=self.configuration_service
                         .config[BACKTESTING_PENDING_ORDER_CHECK_INTERVAL]
                     ):
                 raise OperationalException(
                     f"OHLCV data source not found for {symbol} "
-                    f"and market {portfolio.market} for order check "
+                    f"and market {market} for order check "
                     f"time frame "
                     f"{config[BACKTESTING_PENDING_ORDER_CHECK_INTERVAL]}. "
                     f"Cannot check pending orders for symbol {symbol} "
-                    f"with market {portfolio.market}. Please add a ohlcv data"
-                    f"source for {symbol} and market {portfolio.market} with "
+                    f"with market {market}. Please add a ohlcv data"
+                    f"source for {symbol} and market {market} with "
                     f"time frame {config[BACKTESTING_PENDING_ORDER_CHECK_INTERVAL]} "
                 )
 
             df = self._market_data_source_service.get_ohlcv(
                 symbol=symbol,
-                market=portfolio.market,
+                market=market,
                 to_timestamp=self.configuration_service.config.get(
                     BACKTESTING_INDEX_DATETIME
                 ),
-                from_timestamp=order.get_created_at(),
+                from_timestamp=min(
+                    (self._get_check_start(order) for order in orders),
+                    key=lambda timestamp: timestamp.replace(tzinfo=None)
+                ),
                 time_frame=self.configuration_service
                 .config[BACKTESTING_PENDING_ORDER_CHECK_INTERVAL]
             )
 
-            filtered_df = df.filter(
-                (df['Datetime'] >= order.get_created_at()
-                 .strftime(DATETIME_FORMAT))
-            )
+            for order in orders:
 
-            if self.has_executed(order, filtered_df):
-                self.update(
-                    order.id,
-                    {
-                        "status": OrderStatus.CLOSED.value,
-                        "filled": order.get_amount(),
-                        "remaining": 0,
-                        "updated_at": self.configuration_service
-                        .config[BACKTESTING_INDEX_DATETIME]
-                    }
-                )
-                break
+                if self.has_executed(order, df):
+                    self.update(
+                        order.id,
+                        {
+                            "status": OrderStatus.CLOSED.value,
+                            "filled": order.get_amount(),
+                            "remaining": 0,
+                            "updated_at": self.configuration_service
+                            .config[BACKTESTING_INDEX_DATETIME]
+                        }
+                    )
 
     def cancel_order(self, order):
         self.check_pending_orders()
@@ -122,23 +146,57 @@ class OrderBacktestService(OrderService):
                     }
                 )
 
+    def _get_check_start(self, order):
+        """
+        Function to get the date of the first candle that is needed to
+        check an order, which is the last checked candle of the order,
+        or its creation date when it was not checked before.
+        """
+        price_range = self._order_price_ranges.get(order.id)
+
+        if price_range is None:
+            return order.get_created_at()
+
+        return price_range["checked_until"]
+
     def check_ohclv(self, order, data):
+        """
+        Function to check if the price of an order lies within the
+        lowest and highest price of the ohlcv data since the creation of
+        the order. Only the candles after the last checked candle of the
+        order are scanned, the price range of earlier candles is kept in
+        memory.
+        """
+        price_range = self._order_price_ranges.get(order.id)
 
         if len(data) == 0:
-            return False
+            new_data = data
+        elif price_range is None:
+            new_data = data.filter(data['Datetime'] >= order.get_created_at())
+        else:
+            new_data = data.filter(
+                data['Datetime'] > price_range["checked_until"]
+            )
 
-        # Find the row with the lowest 'Low' value
-        lowest_price_row = data.filter(data['Low'] == data['Low'].min())
-        lowest_price = lowest_price_row["Low"][0]
+        if len(new_data) > 0:
+            lowest_price = new_data["Low"].min()
+            highest_price = new_data["High"].max()
 
-        # Find the row with the highest 'High' value
-        highest_price_row = data.filter(data['High'] == data['High'].max())
-        highest_price = highest_price_row["High"][0]
+            if price_range is not None:
+                lowest_price = min(lowest_price, price_range["low"])
+                highest_price = max(highest_price, price_range["high"])
 
-        if highest_price >= order.get_price() >= lowest_price:
-            return True
+            price_range = {
+                "checked_until": new_data["Datetime"][-1],
+                "low": lowest_price,
+                "high": highest_price,
+            }
+            self._order_price_ranges[order.id] = price_range
+
+        if price_range is None:
+            return False
 
-        return False
+        return price_range["high"] >= order.get_price() >= price_range["low"]
 
     def has_executed(self, order, ohclv):
         return self.check_ohclv(order, ohclv)
@@ -33,6 +33,10 @@ class OrderService(RepositoryService):
         self.portfolio_snapshot_service = portfolio_snapshot_service
         self.market_credential_service = market_credential_service
 
+        # Counts the created and updated orders, so other services can
+        # detect that the portfolios and positions changed
+        self.number_of_changes = 0
+
     def create(self, data, execute=True, validate=True, sync=True):
         portfolio_id = data["portfolio_id"]
         portfolio = self.portfolio_repository.get(portfolio_id)
@@ -51,24 +55,29 @@ class OrderService(RepositoryService):
         if validate:
             self.validate_order(data, portfolio)
 
-        position = self._create_position_if_not_exists(symbol, portfolio)
-        data["position_id"] = position.id
-        data["remaining"] = data["amount"]
-        data["status"] = OrderStatus.CREATED.value
-        order = self.order_repository.create(data)
-        order_id = order.id
-
-        if order_fee:
-            order_fee["order_id"] = order_id
-            self.order_fee_repository.create(order_fee)
+        # The order is stored, synced and snapshotted in one transaction,
+        # before it is sent to the market
+        with self.unit_of_work():
+            position = self._create_position_if_not_exists(symbol, portfolio)
+            data["position_id"] = position.id
+            data["remaining"] = data["amount"]
+            data["status"] = OrderStatus.CREATED.value
+            order = self.order_repository.create(data)
+            order_id = order.id
+
+            if order_fee:
+                order_fee["order_id"] = order_id
+                self.order_fee_repository.create(order_fee)
+
+            if sync:
+                if OrderSide.BUY.equals(order.get_order_side()):
+                    self._sync_portfolio_with_created_buy_order(order)
+                else:
+                    self._sync_portfolio_with_created_sell_order(order)
 
-        if sync:
-            if OrderSide.BUY.equals(order.get_order_side()):
-                self._sync_portfolio_with_created_buy_order(order)
-            else:
-                self._sync_portfolio_with_created_sell_order(order)
+            self.create_snapshot(portfolio.id, created_at=order.created_at)
 
-        self.create_snapshot(portfolio.id, created_at=order.created_at)
+        self.number_of_changes += 1
 
         if execute:
             portfolio.configuration = self.portfolio_configuration_service\
@@ -78,7 +87,20 @@ class OrderService(RepositoryService):
         return order
 
     def update(self, object_id, data):
+        """
+        Function to update an order and sync its portfolio and positions.
+        All changes are made in one transaction.
+        """
+
+        with self.unit_of_work():
+            return self._update(object_id, data)
+
+    def _update(self, object_id, data):
         previous_order = self.order_repository.get(object_id)
+
+        # Within a unit of work the repository returns the same model for
+        # the order before and after the update
+        previous_filled = previous_order.get_filled()
         trading_symbol_position = self.position_repository.find(
             {
                 "id": previous_order.position_id,
@@ -103,14 +125,16 @@ class OrderService(RepositoryService):
                     self.order_fee_repository.create(order_fee_data)
 
         new_order = self.order_repository.update(object_id, data)
-        filled_difference = new_order.get_filled() - previous_order.get_filled()
+        filled_difference = new_order.get_filled() - previous_filled
 
         if filled_difference:
 
             if OrderSide.BUY.equals(new_order.get_order_side()):
-                self._sync_with_buy_order_filled(previous_order, new_order)
+                self._sync_with_buy_order_filled(filled_difference, new_order)
             else:
-                self._sync_with_sell_order_filled(previous_order, new_order)
+                self._sync_with_sell_order_filled(
+                    filled_difference, new_order
+                )
 
         if "status" in data:
 
@@ -141,6 +165,7 @@ class OrderService(RepositoryService):
             created_at = datetime.now()
 
         self.create_snapshot(portfolio.id, created_at=created_at)
+        self.number_of_changes += 1
         return new_order
 
     def get_order_fee(self, order_id):
@@ -324,12 +349,20 @@ class OrderService(RepositoryService):
         pending_orders = self.get_all({"status": OrderStatus.OPEN.value})
         logger.info(f"Checking {len(pending_orders)} open orders")
 
+        orders_per_market = {}
+
         for order in pending_orders:
             position = self.position_repository.get(order.position_id)
             portfolio = self.portfolio_repository.get(position.portfolio_id)
-            external_order = self.market_service\
-                .get_order(order, market=portfolio.get_market())
-            self.update(order.id, external_order.to_dict())
+            orders_per_market.setdefault(portfolio.get_market(), [])\
+                .append(order)
+
+        for market, orders in orders_per_market.items():
+            external_orders = self.market_service\
+                .get_order_updates(orders, market=market)
+
+            for order, external_order in zip(orders, external_orders):
+                self.update(order.id, external_order.to_dict())
 
     def _create_position_if_not_exists(self, symbol, portfolio):
         if not self.position_repository.exists(
@@ -387,9 +420,7 @@ class OrderService(RepositoryService):
                     order, market=portfolio.get_market()
                 )
 
-    def _sync_with_buy_order_filled(self, previous_order, current_order):
-        filled_difference = current_order.get_filled() - \
-                            previous_order.get_filled()
+    def _sync_with_buy_order_filled(self, filled_difference, current_order):
         filled_size = filled_difference * current_order.get_price()
 
         if filled_difference <= 0:
@@ -416,9 +447,7 @@ class OrderService(RepositoryService):
             }
         )
 
-    def _sync_with_sell_order_filled(self, previous_order, current_order):
-        filled_difference = current_order.get_filled() - \
-                            previous_order.get_filled()
+    def _sync_with_sell_order_filled(self, filled_difference, current_order):
         filled_size = filled_difference * current_order.get_price()
 
         if filled_difference <= 0:
@@ -725,6 +754,25 @@ class OrderService(RepositoryService):
         if created_at is None:
             created_at = datetime.utcnow()
 
+        if not self.portfolio_snapshot_service\
+                .is_snapshot_due(portfolio_id, created_at):
+            return None
+
+        return self._create_snapshot(portfolio_id, created_at)
+
+    def create_pending_snapshots(self, flush=False):
+        """
+        Function to write the snapshots that were postponed by the
+        snapshot policy and are due, or all of them when flushing.
+        """
+
+        with self.unit_of_work():
+
+            for portfolio_id, created_at in self.portfolio_snapshot_service\
+                    .pop_due_snapshots(flush=flush):
+                self._create_snapshot(portfolio_id, created_at)
+
+    def _create_snapshot(self, portfolio_id, created_at):
         portfolio = self.portfolio_repository.get(portfolio_id)
         pending_orders = self.get_all(
             {
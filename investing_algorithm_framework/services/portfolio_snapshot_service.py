@@ -1,22 +1,127 @@
-from datetime import datetime
+from datetime import datetime, timedelta
+from threading import Lock
 
 from investing_algorithm_framework.services.repository_service import \
     RepositoryService
-from investing_algorithm_framework.domain import parse_decimal_to_string
+from investing_algorithm_framework.domain import SnapshotPolicy, \
+    SNAPSHOT_POLICY, SNAPSHOT_INTERVAL, BACKTESTING_FLAG, \
+    BACKTESTING_INDEX_DATETIME
 
 
 class PortfolioSnapshotService(RepositoryService):
+    """
+    Service for the snapshots of portfolios.
+
+    How often snapshots are written is controlled by the SNAPSHOT_POLICY
+    config. With the TICK and INTERVAL policies, snapshot requests are
+    only registered, and written for the latest request of a portfolio
+    by pop_due_snapshots at the end of a run of the algorithm, and all
+    registered requests are written when the algorithm stops. Backtests
+    always use the TICK policy, so at most one snapshot is written per
+    scheduled run.
+    """
 
     def __init__(
         self,
         repository,
         position_repository,
-        position_snapshot_service
+        position_snapshot_service,
+        configuration_service=None
     ):
         self.position_snapshot_service = position_snapshot_service
         self.position_repository = position_repository
+        self.configuration_service = configuration_service
+        self._pending_snapshots = {}
+        self._last_snapshots = {}
+        self._lock = Lock()
         super(PortfolioSnapshotService, self).__init__(repository)
 
+    @property
+    def snapshot_policy(self):
+
+        if self.configuration_service is None:
+            return SnapshotPolicy.ORDER
+
+        config = self.configuration_service.config
+
+        if config.get(BACKTESTING_FLAG, False):
+            return SnapshotPolicy.TICK
+
+        return SnapshotPolicy.from_value(
+            config.get(SNAPSHOT_POLICY, SnapshotPolicy.ORDER.value)
+        )
+
+    @property
+    def snapshot_interval(self):
+        return timedelta(
+            seconds=self.configuration_service.config.get(
+                SNAPSHOT_INTERVAL, 3600
+            )
+        )
+
+    def is_snapshot_due(self, portfolio_id, created_at):
+        """
+        Function to check if a snapshot of a portfolio should be written
+        right away. If not, the request is registered and the snapshot
+        is returned by pop_due_snapshots once it is due.
+        """
+
+        if SnapshotPolicy.ORDER.equals(self.snapshot_policy):
+            return True
+
+        with self._lock:
+            self._pending_snapshots[portfolio_id] = created_at
+
+        return False
+
+    def pop_due_snapshots(self, now=None, flush=False):
+        """
+        Function to take the registered snapshot requests that are due.
+
+        With the INTERVAL policy a request is due once the interval has
+        passed since the last snapshot of the portfolio, measured at the
+        current time, or the backtest index date when backtesting.
+
+        :param now: the current time, defaults to the current time of
+            the run
+        :param flush: take all registered requests, e.g. when the
+            algorithm stops, so the last state is always written
+        :return: list of (portfolio_id, created_at) tuples
+        """
+        due_snapshots = []
+        interval_policy = not flush \
+            and SnapshotPolicy.INTERVAL.equals(self.snapshot_policy)
+
+        if now is None:
+            now = self._get_current_time()
+
+        with self._lock:
+
+            for portfolio_id, created_at \
+                    in list(self._pending_snapshots.items()):
+                last_snapshot = self._last_snapshots.get(portfolio_id)
+
+                if interval_policy and last_snapshot is not None \
+                        and now - last_snapshot < self.snapshot_interval:
+                    continue
+
+                due_snapshots.append((portfolio_id, created_at))
+                self._last_snapshots[portfolio_id] = created_at
+                del self._pending_snapshots[portfolio_id]
+
+        return due_snapshots
+
+    def _get_current_time(self):
+
+        if self.configuration_service is not None:
+            config = self.configuration_service.config
+
+            if config.get(BACKTESTING_FLAG, False) \
+                    and config.get(BACKTESTING_INDEX_DATETIME) is not None:
+                return config[BACKTESTING_INDEX_DATETIME]
+
+        return datetime.utcnow()
+
     def create_snapshot(
         self,
         portfolio,
@@ -54,10 +159,9 @@ class PortfolioSnapshotService(RepositoryService):
             {"portfolio": portfolio.id}
         )
 
-        for position in positions:
-            self.position_snapshot_service.create_snapshot(
-                snapshot.id, position
-            )
+        self.position_snapshot_service.create_snapshots(
+            snapshot.id, positions
+        )
 
         return snapshot
 
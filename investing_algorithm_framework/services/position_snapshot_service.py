@@ -14,5 +14,22 @@ class PositionSnapshotService(RepositoryService):
             }
         )
 
+    def create_snapshots(self, portfolio_snapshot_id, positions):
+        """
+        Function to create the snapshots of multiple positions with a
+        single insert.
+        """
+        self.create_all(
+            [
+                {
+                    "portfolio_snapshot_id": portfolio_snapshot_id,
+                    "symbol": position.symbol,
+                    "amount": position.amount,
+                    "cost": position.cost,
+                }
+                for position in positions
+            ]
+        )
+
     def get_snapshots(self, portfolio_snapshot_id):
         pass
@@ -6,6 +6,9 @@ class RepositoryService:
     def create(self, data):
         return self.repository.create(data)
 
+    def create_all(self, data):
+        return self.repository.create_all(data)
+
     def get(self, object_id):
         return self.repository.get(object_id)
 
@@ -32,3 +35,6 @@ class RepositoryService:
 
     def exists(self, query_params):
         return self.repository.exists(query_params)
+
+    def unit_of_work(self):
+        return self.repository.unit_of_work()
@@ -1,62 +1,87 @@
+import heapq
+import itertools
 import logging
-import schedule
-from datetime import datetime
-from investing_algorithm_framework.domain import StoppableThread, TimeUnit, \
-    OperationalException, MarketDataSource
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+from investing_algorithm_framework.domain import TimeUnit, \
+    OperationalException
 from investing_algorithm_framework.services.market_data_source_service \
-    import MarketDataSourceService
+    import MarketDataSourceService, MarketDataContext
 
 logger = logging.getLogger("investing_algorithm_framework")
 
 
-class StrategyOrchestratorService:
+class ScheduledJob:
+    """
+    Strategy or task that is run by the scheduler every interval seconds.
+    """
+
+    def __init__(self, worker, interval, is_strategy):
+        self.worker = worker
+        self.interval = interval
+        self.is_strategy = is_strategy
+
+    @property
+    def worker_id(self):
+        return self.worker.worker_id
+
 
-    def __init__(self, market_data_source_service: MarketDataSourceService):
+class StrategyOrchestratorService:
+    """
+    Service that schedules the strategies and tasks of an algorithm.
+
+    The scheduled jobs are kept in a min heap of their next run times, so
+    the caller can sleep until the next deadline with
+    time_until_next_run. Runs are dispatched on a fixed size thread pool,
+    and a strategy or task that is still running when it is due again is
+    skipped. The history of a worker keeps its number of runs, the
+    latency of its last and slowest dispatch, its missed deadlines and the
+    duration of its last run in seconds.
+
+    The strategies that are due at the same time share one
+    MarketDataContext, so every market data source is fetched once per
+    tick, and the distinct sources are fetched concurrently.
+    """
+
+    def __init__(
+        self,
+        market_data_source_service: MarketDataSourceService,
+        max_workers=None
+    ):
         self.history = {}
         self._strategies = []
         self._tasks = []
-        self.threads = []
+        self._jobs = []
+        self._sequence = itertools.count()
+        self._futures = {}
+        self._executor = None
+        self._algorithm = None
+        self.max_workers = max_workers
         self.iterations = 0
         self.max_iterations = -1
         self.clear()
         self.market_data_source_service: MarketDataSourceService \
             = market_data_source_service
 
-    def cleanup_threads(self):
-
-        for stoppable in self.threads:
-            if not stoppable.is_alive():
-                # get results from thread
-                stoppable.done = True
-        self.threads = [t for t in self.threads if not t.done]
+    def is_worker_running(self, worker_id):
+        future = self._futures.get(worker_id)
+        return future is not None and not future.done()
 
-    def run_strategy(self, strategy, algorithm, sync=False):
-        self.cleanup_threads()
-        matching_thread = next(
-            (t for t in self.threads if t.name == strategy.worker_id),
-            None
-        )
+    def run_strategy(
+        self, strategy, algorithm, sync=False, market_data_context=None
+    ):
 
         # Don't run a strategy that is already running
-        if matching_thread:
+        if self.is_worker_running(strategy.worker_id):
             return
 
-        market_data = {}
-
-        if strategy.market_data_sources is not None \
-                and len(strategy.market_data_sources) > 0:
-
-            for data_id in strategy.market_data_sources:
-
-                if isinstance(data_id, MarketDataSource):
-                    market_data[data_id.get_identifier()] = \
-                        self.market_data_source_service\
-                            .get_data(identifier=data_id.get_identifier())
-                else:
-                    market_data[data_id] = \
-                        self.market_data_source_service \
-                            .get_data(identifier=data_id)
+        if market_data_context is None:
+            market_data_context = self.create_market_data_context()
 
+        market_data = market_data_context\
+            .get_market_data(strategy.market_data_sources)
         logger.info(f"Running strategy {strategy.worker_id}")
 
         if sync:
@@ -65,29 +90,19 @@ class StrategyOrchestratorService:
             )
         else:
             self.iterations += 1
-            thread = StoppableThread(
-                target=strategy.run_strategy,
-                kwargs={
-                    "market_data": market_data,
-                    "algorithm": algorithm
-                }
+            self._submit(
+                strategy.worker_id,
+                strategy.run_strategy,
+                market_data=market_data,
+                algorithm=algorithm
             )
-            thread.name = strategy.worker_id
-            thread.start()
-            self.threads.append(thread)
 
-        self.history[strategy.worker_id] = {"last_run": datetime.utcnow()}
+        self._get_history(strategy.worker_id)["last_run"] = datetime.utcnow()
 
     def run_task(self, task, algorithm, sync=False):
-        self.cleanup_threads()
-
-        matching_thread = next(
-            (t for t in self.threads if t.name == task.worker_id),
-            None
-        )
 
-        # Don't run a strategy that is already running
-        if matching_thread:
+        # Don't run a task that is already running
+        if self.is_worker_running(task.worker_id):
             return
 
         logger.info(f"Running task {task.worker_id}")
@@ -96,52 +111,91 @@ class StrategyOrchestratorService:
             task.run(algorithm=algorithm)
         else:
             self.iterations += 1
-            thread = StoppableThread(
-                target=task.run,
-                kwargs={"algorithm": algorithm}
+            self._submit(task.worker_id, task.run, algorithm=algorithm)
+
+        self._get_history(task.worker_id)["last_run"] = datetime.utcnow()
+
+    def create_market_data_context(self):
+        return MarketDataContext(
+            self.market_data_source_service,
+            timestamp=datetime.utcnow(),
+            concurrent=True
+        )
+
+    def _submit(self, worker_id, function, **kwargs):
+
+        if self._executor is None:
+            max_workers = self.max_workers
+
+            if max_workers is None:
+                max_workers = max(len(self.strategies) + len(self.tasks), 1)
+
+            self._executor = ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix="worker"
             )
-            thread.name = task.worker_id
-            thread.start()
-            self.threads.append(thread)
 
-        self.history[task.worker_id] = {"last_run": datetime.utcnow()}
+        self._futures[worker_id] = self._executor.submit(
+            self._run_worker, worker_id, function, kwargs
+        )
+
+    def _run_worker(self, worker_id, function, kwargs):
+        started_at = time.monotonic()
+
+        try:
+            function(**kwargs)
+        except Exception as e:
+            logger.exception(f"Error running {worker_id}: {e}")
+        finally:
+            self._get_history(worker_id)["duration"] = \
+                time.monotonic() - started_at
+
+    def _get_history(self, worker_id):
+        return self.history.setdefault(
+            worker_id,
+            {
+                "last_run": None,
+                "runs": 0,
+                "latency": 0.0,
+                "max_latency": 0.0,
+                "missed_deadlines": 0,
+                "duration": None,
+            }
+        )
 
     def start(self, algorithm, number_of_iterations=None):
         self.max_iterations = number_of_iterations
+        self._algorithm = algorithm
+        now = time.monotonic()
 
         for strategy in self.strategies:
-
-            if TimeUnit.SECOND.equals(strategy.time_unit):
-                schedule.every(strategy.interval)\
-                    .seconds.do(self.run_strategy, strategy, algorithm)
-            elif TimeUnit.MINUTE.equals(strategy.time_unit):
-                schedule.every(strategy.interval)\
-                    .minutes.do(self.run_strategy, strategy, algorithm)
-            elif TimeUnit.HOUR.equals(strategy.time_unit):
-                schedule.every(strategy.interval)\
-                    .hours.do(self.run_strategy, strategy, algorithm)
+            self._schedule(strategy, True, now)
 
         for task in self.tasks:
-            
-            if TimeUnit.SECOND.equals(task.time_unit):
-                schedule.every(task.interval)\
-                    .seconds.do(self.run_task, task, algorithm)
-            elif TimeUnit.MINUTE.equals(task.time_unit):
-                schedule.every(task.interval)\
-                    .minutes.do(self.run_task, task, algorithm)
-            elif TimeUnit.HOUR.equals(task.time_unit):
-                schedule.every(task.interval)\
-                    .hours.do(self.run_task, task, algorithm)
-
-    def stop(self):
-        for thread in self.threads:
-            thread.stop()
-
-        schedule.clear()
+            self._schedule(task, False, now)
+
+    def _schedule(self, worker, is_strategy, now):
+        time_unit = TimeUnit.from_value(worker.time_unit)
+        interval = timedelta(
+            **{time_unit.plural_name: worker.interval}
+        ).total_seconds()
+        job = ScheduledJob(worker, interval, is_strategy)
+        heapq.heappush(
+            self._jobs, (now + interval, next(self._sequence), job)
+        )
+
+    def stop(self, wait=False):
+        """
+        Function to stop scheduling jobs. With wait, the runs that are in
+        progress are finished first.
+        """
+        self._jobs = []
+
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait, cancel_futures=True)
+            self._executor = None
 
     def clear(self):
-        self.threads = []
-        schedule.clear()
+        self._jobs = []
 
     def get_strategies(self, identifiers=None):
         if identifiers is None:
@@ -158,15 +212,85 @@ class StrategyOrchestratorService:
         return self._tasks
 
     def get_jobs(self):
-        return schedule.jobs
+        return [job for _, _, job in sorted(self._jobs)]
+
+    def time_until_next_run(self):
+        """
+        Function to get the number of seconds until the next scheduled
+        run, or None if there are no scheduled jobs.
+        """
+
+        if len(self._jobs) == 0:
+            return None
+
+        return max(self._jobs[0][0] - time.monotonic(), 0)
 
     def run_pending_jobs(self):
         if self.max_iterations is not None and \
                 self.max_iterations != -1 and \
                 self.iterations >= self.max_iterations:
             self.clear()
-        else:
-            schedule.run_pending()
+            return
+
+        now = time.monotonic()
+        due_jobs = []
+
+        while len(self._jobs) > 0 and self._jobs[0][0] <= now:
+            due_jobs.append(heapq.heappop(self._jobs))
+
+        if len(due_jobs) == 0:
+            return
+
+        # Fetch the market data of all strategies of this tick at once
+        market_data_context = self.create_market_data_context()
+        market_data_context.prefetch(
+            [
+                market_data_source
+                for _, _, job in due_jobs
+                if job.is_strategy
+                and not self.is_worker_running(job.worker_id)
+                for market_data_source
+                in job.worker.market_data_sources or []
+            ]
+        )
+
+        for deadline, _, job in due_jobs:
+            history = self._get_history(job.worker_id)
+
+            if self.is_worker_running(job.worker_id):
+                history["missed_deadlines"] += 1
+                logger.warning(
+                    f"Skipping run of {job.worker_id}, "
+                    "the previous run has not finished"
+                )
+            else:
+                latency = now - deadline
+                history["runs"] += 1
+                history["latency"] = latency
+                history["max_latency"] = max(history["max_latency"], latency)
+
+                if job.is_strategy:
+                    self.run_strategy(
+                        job.worker,
+                        self._algorithm,
+                        market_data_context=market_data_context
+                    )
+                else:
+                    self.run_task(job.worker, self._algorithm)
+
+            # Runs stay on the grid of the first deadline. Deadlines that
+            # have already passed are skipped and counted as missed.
+            next_run = deadline + job.interval
+
+            if next_run <= now:
+                missed_deadlines = int((now - next_run) // job.interval) + 1
+                next_run += missed_deadlines * job.interval
+                history["missed_deadlines"] += missed_deadlines
+                logger.warning(
+                    f"{job.worker_id} missed {missed_deadlines} deadlines"
+                )
+
+            heapq.heappush(self._jobs, (next_run, next(self._sequence), job))
 
     def add_strategy(self, strategy):
 
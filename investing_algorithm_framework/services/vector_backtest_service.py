@@ -0,0 +1,474 @@
+import decimal
+
+import numpy as np
+import polars
+
+from investing_algorithm_framework.domain import BacktestProfile, \
+    BacktestPosition, EquityCurve, OperationalException, OrderType, \
+    Position, Trade
+
+# Number of candles of the first block that is searched for the fill of a
+# limit order, every next block is twice as large
+FILL_SEARCH_BLOCK_SIZE = 64
+
+
+class VectorBacktestService:
+    """
+    Service to backtest entry and exit signals over the complete OHLCV
+    data of a symbol at once, instead of running the strategies at every
+    scheduled time.
+
+    The portfolio holds at most one position, an entry signal opens a
+    position when there is none and an exit signal sells the complete
+    position. Market orders fill at the close of the candle of the
+    signal. Limit orders are placed at that close and fill at the first
+    later candle of which the range contains the price.
+
+    Everything that is calculated per candle, like the next signal
+    after a fill and the equity curve, is done with numpy array
+    operations. Only the orders themselves are visited one by one.
+    """
+
+    def backtest(
+        self,
+        data,
+        entries,
+        exits,
+        start_date,
+        end_date,
+        initial_balance,
+        target_symbol,
+        trading_symbol,
+        order_type="MARKET",
+        percentage_of_portfolio=100,
+        fee_percentage=0.0,
+        precision=None,
+    ):
+        """
+        Function to backtest the entry and exit signals of the given
+        OHLCV data between the start and end date.
+
+        :param data: polars DataFrame with the OHLCV data
+        :param entries: boolean array with the entry signal per candle
+        :param exits: boolean array with the exit signal per candle
+        :param start_date: the start date of the backtest
+        :param end_date: the end date of the backtest
+        :param initial_balance: the balance in the trading symbol at
+            the start of the backtest
+        :param target_symbol: the symbol that is traded
+        :param trading_symbol: the symbol of the balance
+        :param order_type: MARKET or LIMIT
+        :param percentage_of_portfolio: the percentage of the balance
+            that is used for an entry
+        :param fee_percentage: the fee of an order as a percentage of
+            its size
+        :param precision: number of decimals the amount of an entry is
+            rounded down to
+        :return: a BacktestProfile
+        """
+        order_type = OrderType.from_value(order_type)
+
+        if order_type not in [OrderType.MARKET, OrderType.LIMIT]:
+            raise OperationalException(
+                "Only market and limit orders are supported for "
+                "vector backtests"
+            )
+
+        if start_date > end_date:
+            raise OperationalException(
+                "Start date cannot be greater than end date for backtest"
+            )
+
+        entries, exits, data = self._select_range(
+            data, entries, exits, start_date, end_date
+        )
+        datetimes = data["Datetime"].to_numpy()
+        low = data["Low"].to_numpy()
+        high = data["High"].to_numpy()
+        close = data["Close"].to_numpy()
+        orders = self._simulate(
+            entries,
+            exits,
+            low,
+            high,
+            close,
+            limit=OrderType.LIMIT.equals(order_type),
+            initial_balance=initial_balance,
+            percentage_of_portfolio=percentage_of_portfolio,
+            fee=fee_percentage / 100,
+            precision=precision
+        )
+        equity_curve = self._create_equity_curve(
+            orders, datetimes, close, initial_balance
+        )
+        return self._create_backtest_report(
+            orders=orders,
+            datetimes=datetimes,
+            close=close,
+            equity_curve=equity_curve,
+            start_date=start_date,
+            end_date=end_date,
+            initial_balance=initial_balance,
+            target_symbol=target_symbol,
+            trading_symbol=trading_symbol,
+        )
+
+    @staticmethod
+    def _select_range(data, entries, exits, start_date, end_date):
+        """
+        Function to select the candles and signals between the start and
+        end date of the backtest.
+        """
+        entries = _to_signal_array(entries, len(data), "entries")
+        exits = _to_signal_array(exits, len(data), "exits")
+        in_range = (
+            (data["Datetime"] >= start_date) & (data["Datetime"] <= end_date)
+        ).to_numpy()
+        return entries[in_range], exits[in_range], data.filter(in_range)
+
+    def _simulate(
+        self,
+        entries,
+        exits,
+        low,
+        high,
+        close,
+        limit,
+        initial_balance,
+        percentage_of_portfolio,
+        fee,
+        precision
+    ):
+        """
+        Function to simulate the orders of the signals. Every order is a
+        dict with its side, amount, price, the index of the candle it
+        was created at and the index of the candle it filled at, which
+        is None when the order was still open at the end.
+        """
+        size = len(close)
+        next_entries = _get_next_signal_indexes(entries)
+        next_exits = _get_next_signal_indexes(exits)
+        cash = initial_balance
+        orders = []
+        index = next_entries[0]
+
+        while index < size:
+            price = close[index]
+            amount = cash * percentage_of_portfolio / 100 \
+                / (price * (1 + fee))
+
+            if precision is not None:
+                amount = _round_down(amount, precision)
+
+            if amount <= 0:
+                index = next_entries[index + 1]
+                continue
+
+            cost = amount * price * (1 + fee)
+            cash -= cost
+            buy_order = self._create_order(
+                "BUY", amount, price, index, low, high, limit
+            )
+            buy_order["cost"] = cost
+            orders.append(buy_order)
+
+            if buy_order["filled_at"] is None:
+                break
+
+            index = next_exits[max(buy_order["filled_at"], index + 1)]
+
+            if index >= size:
+                break
+
+            sell_order = self._create_order(
+                "SELL", amount, close[index], index, low, high, limit
+            )
+            orders.append(sell_order)
+
+            if sell_order["filled_at"] is None:
+                break
+
+            sell_order["proceeds"] = amount * sell_order["price"] * (1 - fee)
+            sell_order["net_gain"] = sell_order["proceeds"] - cost
+            cash += sell_order["proceeds"]
+            index = next_entries[max(sell_order["filled_at"], index + 1)]
+
+        return orders
+
+    @staticmethod
+    def _create_order(side, amount, price, index, low, high, limit):
+        filled_at = index
+
+        if limit:
+            filled_at = _find_limit_fill(low, high, price, index + 1)
+
+        return {
+            "side": side,
+            "amount": amount,
+            "price": price,
+            "created_at": index,
+            "filled_at": filled_at,
+        }
+
+    @staticmethod
+    def _create_equity_curve(orders, datetimes, close, initial_balance):
+        """
+        Function to create the equity curve of the orders, with the
+        changes of the cash and amount held placed at the candles of the
+        orders and accumulated over all candles.
+        """
+        size = len(close)
+
+        if size == 0:
+            return EquityCurve()
+
+        cash = np.zeros(size)
+        reserved = np.zeros(size)
+        held = np.zeros(size)
+        cash[0] = initial_balance
+
+        for order in orders:
+            filled_at = order["filled_at"]
+
+            if order["side"] == "BUY":
+                cash[order["created_at"]] -= order["cost"]
+                reserved[order["created_at"]] += order["cost"]
+
+                if filled_at is not None:
+                    reserved[filled_at] -= order["cost"]
+                    held[filled_at] += order["amount"]
+            elif filled_at is not None:
+                held[filled_at] -= order["amount"]
+                cash[filled_at] += order["proceeds"]
+
+        cash = np.cumsum(cash)
+        reserved = np.cumsum(reserved)
+        allocated = np.cumsum(held) * close
+        equity = cash + reserved + allocated
+        return EquityCurve.from_arrays(
+            datetimes,
+            equity=equity,
+            cash=cash,
+            exposure=np.divide(
+                allocated,
+                equity,
+                out=np.zeros(size),
+                where=equity > 0
+            )
+        )
+
+    @staticmethod
+    def _create_backtest_report(
+        orders,
+        datetimes,
+        close,
+        equity_curve,
+        start_date,
+        end_date,
+        initial_balance,
+        target_symbol,
+        trading_symbol,
+    ):
+        backtest_profile = BacktestProfile(
+            backtest_index_date=start_date,
+            backtest_start_date=start_date,
+            backtest_end_date=end_date,
+            initial_unallocated=initial_balance,
+            trading_symbol=trading_symbol,
+        )
+        times = datetimes.astype("datetime64[us]").tolist()
+        last_price = float(close[-1]) if len(close) > 0 else 0.0
+        trades = []
+        amount = 0
+        amount_pending = 0
+        cost = 0
+        total_cost = 0
+        total_net_gain = 0
+        number_of_closed_orders = 0
+        number_of_positive_orders = 0
+        number_of_negative_orders = 0
+
+        # Orders alternate between buys and sells, so the sell order of
+        # the trade of a buy order is the order after it
+        for index, order in enumerate(orders):
+
+            if order["filled_at"] is None:
+
+                # The amount of an open sell order is still held
+                if order["side"] == "BUY":
+                    amount_pending += order["amount"]
+
+                continue
+
+            number_of_closed_orders += 1
+
+            if order["side"] == "SELL":
+                amount -= order["amount"]
+                cost = 0
+                total_net_gain += order["net_gain"]
+
+                if order["net_gain"] > 0:
+                    number_of_positive_orders += 1
+                elif order["net_gain"] < 0:
+                    number_of_negative_orders += 1
+
+                continue
+
+            amount += order["amount"]
+            cost += order["cost"]
+            total_cost += order["cost"]
+            sell_order = orders[index + 1] if index + 1 < len(orders) \
+                else None
+
+            if sell_order is not None and sell_order["filled_at"] is None:
+                sell_order = None
+
+            trades.append(
+                Trade(
+                    buy_order_id=index + 1,
+                    target_symbol=target_symbol,
+                    trading_symbol=trading_symbol,
+                    amount=order["amount"],
+                    open_price=order["price"],
+                    opened_at=times[order["created_at"]],
+                    closed_price=None if sell_order is None
+                    else sell_order["price"],
+                    closed_at=None if sell_order is None
+                    else times[sell_order["filled_at"]],
+                    current_price=last_price,
+                    sell_order_id=None if sell_order is None else index + 2
+                )
+            )
+
+        closed_trades = [
+            trade for trade in trades if trade.closed_at is not None
+        ]
+        unallocated = float(equity_curve.cash[-1]) \
+            if len(equity_curve) > 0 else initial_balance
+        total_value = unallocated + amount * last_price
+        pending_value = sum(
+            order["amount"] * order["price"] for order in orders
+            if order["filled_at"] is None and order["side"] == "BUY"
+        )
+        growth = total_value + pending_value - initial_balance
+        backtest_profile.number_of_runs = len(close)
+        backtest_profile.number_of_days = (end_date - start_date).days
+        backtest_profile.number_of_orders = len(orders)
+        backtest_profile.number_of_positions = 1 if amount > 0 else 0
+        backtest_profile.number_of_trades_closed = len(closed_trades)
+        backtest_profile.number_of_trades_open = \
+            len(trades) - len(closed_trades)
+        backtest_profile.percentage_positive_trades = 0.0
+        backtest_profile.percentage_negative_trades = 0.0
+
+        if number_of_closed_orders > 0:
+            backtest_profile.percentage_positive_trades = \
+                number_of_positive_orders / number_of_closed_orders * 100
+            backtest_profile.percentage_negative_trades = \
+                number_of_negative_orders / number_of_closed_orders * 100
+
+        backtest_profile.total_cost = total_cost
+        backtest_profile.total_net_gain = total_net_gain
+        backtest_profile.total_net_gain_percentage = \
+            total_net_gain / initial_balance * 100
+        backtest_profile.growth = growth
+        backtest_profile.growth_rate = growth / initial_balance * 100
+        backtest_profile.total_value = total_value
+        backtest_profile.average_trade_duration = 0
+        backtest_profile.average_trade_size = 0
+
+        if len(closed_trades) > 0:
+            backtest_profile.average_trade_duration = sum(
+                trade.duration for trade in closed_trades
+            ) / len(closed_trades)
+            backtest_profile.average_trade_size = sum(
+                trade.size for trade in closed_trades
+            ) / len(closed_trades)
+
+        backtest_profile.equity_curve = equity_curve
+
+        for name, value in equity_curve.get_risk_metrics().items():
+            setattr(backtest_profile, name, value)
+
+        trading_symbol_position = BacktestPosition(
+            Position(
+                symbol=trading_symbol, amount=unallocated, cost=unallocated
+            ),
+            trading_symbol=True,
+            total_value_portfolio=total_value
+        )
+        trading_symbol_position.price = 1
+        position = BacktestPosition(
+            Position(symbol=target_symbol, amount=amount, cost=cost),
+            amount_pending=amount_pending,
+            total_value_portfolio=total_value
+        )
+        position.price = last_price
+        backtest_profile.positions = [trading_symbol_position, position]
+        backtest_profile.trades = trades
+        return backtest_profile
+
+
+def _to_signal_array(signals, size, name):
+
+    if isinstance(signals, polars.Series):
+        signals = signals.fill_null(False).to_numpy()
+
+    signals = np.asarray(signals)
+
+    if signals.dtype == object:
+        # Nan is not equal to itself, missing signals are no signal
+        signals = np.array(
+            [signal == signal and bool(signal) for signal in signals],
+            dtype=bool
+        )
+    else:
+        signals = np.nan_to_num(signals.astype(float)) != 0
+
+    if len(signals) != size:
+        raise OperationalException(
+            f"The {name} have {len(signals)} signals, but the data has "
+            f"{size} candles"
+        )
+
+    return signals
+
+
+def _get_next_signal_indexes(signals):
+    """
+    Function to get for every candle the index of the first signal at
+    or after that candle. The array has an extra element for the end of
+    the data, candles without a next signal get the number of candles.
+    """
+    size = len(signals)
+    indexes = np.where(signals, np.arange(size), size)
+    return np.append(np.minimum.accumulate(indexes[::-1])[::-1], size)
+
+
+def _find_limit_fill(low, high, price, start):
+    """
+    Function to find the first candle at or after the start of which the
+    range contains the price. The candles are searched in blocks that
+    double in size, so an order that fills soon only compares a few
+    candles. Returns None when the order never fills.
+    """
+    block_size = FILL_SEARCH_BLOCK_SIZE
+
+    while start < len(low):
+        end = min(start + block_size, len(low))
+        fills = (low[start:end] <= price) & (high[start:end] >= price)
+
+        if fills.any():
+            return start + int(np.argmax(fills))
+
+        start = end
+        block_size *= 2
+
+    return None
+
+
+def _round_down(value, amount_of_decimals):
+
+    with decimal.localcontext() as ctx:
+        ctx.rounding = decimal.ROUND_DOWN
+        return float(round(decimal.Decimal(value), amount_of_decimals))
@@ -1,7 +1,11 @@
 import os
-from unittest import TestCase
+from datetime import datetime
+from unittest import TestCase, mock
 from investing_algorithm_framework import TradingStrategy, Algorithm, \
-    PortfolioConfiguration, create_app, RESOURCE_DIRECTORY
+    PortfolioConfiguration, create_app, RESOURCE_DIRECTORY, \
+    CCXTOHLCVMarketDataSource
+from investing_algorithm_framework.domain import OperationalException
+from investing_algorithm_framework.services import MarketDataSourceService
 
 
 class SimpleTradingStrategy(TradingStrategy):
@@ -21,6 +25,25 @@ class SimpleTradingStrategy(TradingStrategy):
         )
 
 
+class ConfiguredTradingStrategy(TradingStrategy):
+    interval = 2
+    time_unit = "hour"
+    market_data_sources = []
+
+    def apply_strategy(self, algorithm: Algorithm, market_data):
+        # Every run of a param grid gets its params in the config
+        assert algorithm.config["AMOUNT"] in [0.01, 0.02]
+
+
+class SecondConfiguredTradingStrategy(TradingStrategy):
+    interval = 2
+    time_unit = "hour"
+    market_data_sources = []
+
+    def apply_strategy(self, algorithm: Algorithm, market_data):
+        pass
+
+
 class Test(TestCase):
 
     def setUp(self) -> None:
@@ -44,3 +67,78 @@ class Test(TestCase):
             )
         )
         self.app.add_strategy(SimpleTradingStrategy)
+
+    def set_initial_balance(self, initial_balance):
+        portfolio_configuration_service = self.app.container\
+            .portfolio_configuration_service()
+        portfolio_configuration_service.clear()
+        portfolio_configuration_service.add(
+            PortfolioConfiguration(
+                market="BITVAVO",
+                trading_symbol="USDT",
+                initial_balance=initial_balance
+            )
+        )
+
+    # Market data sources are shared between app instances of a process
+    @mock.patch.object(MarketDataSourceService, "_market_data_sources", [])
+    def test_backtest_many(self):
+        self.set_initial_balance(1000)
+        self.app.strategies.clear()
+        self.app.add_strategy(ConfiguredTradingStrategy)
+        reports = self.app.backtest_many(
+            param_grid={"AMOUNT": [0.01, 0.02]},
+            start_date=datetime(2023, 12, 1),
+            end_date=datetime(2023, 12, 2),
+            workers=2
+        )
+        self.assertEqual(2, len(reports))
+
+        for report in reports:
+            self.assertEqual(13, report.number_of_runs)
+
+        self.assertFalse(
+            os.path.isfile(
+                os.path.join(
+                    self.resource_dir,
+                    "databases",
+                    "backtest-database-0.sqlite3"
+                )
+            )
+        )
+
+    @mock.patch.object(MarketDataSourceService, "_market_data_sources", [])
+    def test_backtest_records_equity_once_per_run_time(self):
+        self.set_initial_balance(1000)
+        self.app.strategies.clear()
+        self.app.add_strategies(
+            [ConfiguredTradingStrategy, SecondConfiguredTradingStrategy]
+        )
+        self.app.container.configuration_service()\
+            .add_value("AMOUNT", 0.01)
+        report = self.app.backtest(
+            start_date=datetime(2023, 12, 1),
+            end_date=datetime(2023, 12, 2)
+        )
+        self.assertEqual(26, report.number_of_runs)
+        self.assertEqual(13, len(report.equity_curve))
+        self.assertEqual(
+            13, len(set(report.equity_curve.timestamps.tolist()))
+        )
+
+    def test_vector_backtest_without_portfolio_of_market(self):
+        market_data_source = CCXTOHLCVMarketDataSource(
+            identifier="BTC/EUR-ohlcv",
+            market="BINANCE",
+            symbol="BTC/EUR",
+            timeframe="2h",
+            window_size=10
+        )
+
+        with self.assertRaises(OperationalException):
+            self.app.vector_backtest(
+                start_date=datetime(2023, 12, 1),
+                end_date=datetime(2023, 12, 2),
+                signals=([], []),
+                market_data_source=market_data_source
+            )
@@ -0,0 +1,51 @@
+from unittest import TestCase
+
+from investing_algorithm_framework import TradingStrategy, TimeUnit, SMA, \
+    RollingMax
+from tests.resources import create_ohlcv_data_frame
+
+
+class StrategyWithIndicators(TradingStrategy):
+    time_unit = TimeUnit.HOUR
+    interval = 1
+    market_data_sources = ["BTC/EUR-ticker"]
+    indicators = [
+        SMA("BTC/EUR-ohlcv", 2),
+        RollingMax("BTC/EUR-ohlcv", 3, name="high"),
+    ]
+
+    def __init__(self):
+        super().__init__()
+        self.values = []
+
+    def apply_strategy(self, algorithm, market_data):
+        sma = self.get_indicator("sma_2", "BTC/EUR-ohlcv")
+        self.values.append((sma.value, self.get_indicator("high").value))
+
+
+class Test(TestCase):
+
+    def test_indicators_are_updated_before_apply_strategy(self):
+        strategy = StrategyWithIndicators()
+        self.assertEqual(
+            ["BTC/EUR-ticker", "BTC/EUR-ohlcv"], strategy.market_data_sources
+        )
+
+        for end in range(2, 5):
+            data = create_ohlcv_data_frame([1, 4, 2, 3][:end])
+            strategy.run_strategy(
+                algorithm=None, market_data={"BTC/EUR-ohlcv": data}
+            )
+
+        self.assertEqual([(2.5, None), (3, 4), (2.5, 4)], strategy.values)
+
+    def test_indicator_state_is_not_shared(self):
+        strategy = StrategyWithIndicators()
+        strategy.run_strategy(
+            algorithm=None,
+            market_data={"BTC/EUR-ohlcv": create_ohlcv_data_frame([1, 2])}
+        )
+        self.assertIsNone(
+            StrategyWithIndicators().get_indicator("sma_2").value
+        )
+        self.assertIsNone(StrategyWithIndicators.indicators[0].value)
@@ -0,0 +1,58 @@
+from datetime import datetime, timedelta
+from unittest import TestCase
+
+import numpy as np
+
+from investing_algorithm_framework.domain import EquityCurve
+
+
+class Test(TestCase):
+
+    def create_equity_curve(self, equity, exposure=0.5):
+        equity_curve = EquityCurve(capacity=2)
+        start = datetime(2023, 1, 1)
+
+        for index, value in enumerate(equity):
+            equity_curve.record(
+                start + timedelta(days=index),
+                equity=value,
+                cash=value * (1 - exposure),
+                exposure=exposure
+            )
+
+        return equity_curve
+
+    def test_record(self):
+        equity_curve = self.create_equity_curve([100, 110, 120, 130, 140])
+        self.assertEqual(5, len(equity_curve))
+        self.assertEqual([100, 110, 120, 130, 140], list(equity_curve.equity))
+        self.assertEqual(
+            np.datetime64("2023-01-05"), equity_curve.timestamps[-1]
+        )
+
+    def test_drawdown(self):
+        equity_curve = self.create_equity_curve(
+            [100, 120, 90, 100, 130, 117, 140]
+        )
+        metrics = equity_curve.get_risk_metrics()
+        self.assertAlmostEqual(25, metrics["max_drawdown"])
+        self.assertEqual(48, metrics["max_drawdown_duration"])
+        self.assertEqual(50, metrics["exposure"])
+        self.assertGreater(metrics["sharpe_ratio"], 0)
+        self.assertGreater(metrics["sortino_ratio"], metrics["sharpe_ratio"])
+        self.assertGreater(metrics["calmar_ratio"], 0)
+        self.assertGreater(metrics["volatility"], 0)
+
+    def test_sharpe_ratio(self):
+        equity = [100, 102, 101, 104, 103]
+        equity_curve = self.create_equity_curve(equity)
+        returns = np.diff(equity) / np.array(equity[:-1])
+        self.assertAlmostEqual(
+            returns.mean() / returns.std() * np.sqrt(365),
+            equity_curve.get_risk_metrics()["sharpe_ratio"]
+        )
+
+    def test_without_samples(self):
+        metrics = EquityCurve().get_risk_metrics()
+        self.assertEqual(0, metrics["max_drawdown"])
+        self.assertEqual(0, metrics["sharpe_ratio"])
@@ -0,0 +1,117 @@
+from unittest import TestCase
+
+import numpy as np
+
+from investing_algorithm_framework.domain import SMA, EMA, RSI, MACD, ATR, \
+    BollingerBands, RollingMin, RollingMax
+from tests.resources import create_ohlcv_data_frame
+
+
+class Test(TestCase):
+
+    def setUp(self) -> None:
+        self.close = list(
+            100 + np.cumsum(np.random.default_rng(1).normal(size=60))
+        )
+        self.data = create_ohlcv_data_frame(
+            [[value, value + 1, value - 1, value] for value in self.close]
+        )
+
+    def update_with_windows(self, indicator, window_size=20):
+        """
+        Updates the indicator with a sliding window, like a strategy
+        that runs every candle
+        """
+        for end in range(1, len(self.data) + 1):
+            indicator.update(self.data[max(0, end - window_size):end])
+
+        return indicator
+
+    def test_sma(self):
+        sma = self.update_with_windows(SMA("BTC/EUR-ohlcv", 9))
+        self.assertAlmostEqual(np.mean(self.close[-9:]), sma.value)
+        self.assertAlmostEqual(np.mean(self.close[-10:-1]), sma.previous_value)
+        self.assertEqual("sma_9", sma.name)
+
+    def test_ema(self):
+        ema = self.update_with_windows(EMA("BTC/EUR-ohlcv", 9))
+        expected = self.close[0]
+
+        for value in self.close[1:]:
+            expected += 0.2 * (value - expected)
+
+        self.assertAlmostEqual(expected, ema.value)
+
+    def test_rsi(self):
+        rsi = self.update_with_windows(RSI("BTC/EUR-ohlcv", 14))
+        changes = np.diff(self.close)
+        gain = np.maximum(changes, 0)[:14].mean()
+        loss = np.maximum(-changes, 0)[:14].mean()
+
+        for change in changes[14:]:
+            gain = (gain * 13 + max(change, 0)) / 14
+            loss = (loss * 13 + max(-change, 0)) / 14
+
+        self.assertAlmostEqual(100 * gain / (gain + loss), rsi.value)
+
+    def test_macd(self):
+        macd = self.update_with_windows(MACD("BTC/EUR-ohlcv"))
+        fast = EMA("BTC/EUR-ohlcv", 12)
+        slow = EMA("BTC/EUR-ohlcv", 26)
+        fast.update(self.data)
+        slow.update(self.data)
+        self.assertAlmostEqual(fast.value - slow.value, macd.value["macd"])
+        self.assertAlmostEqual(
+            macd.value["macd"] - macd.value["signal"],
+            macd.value["histogram"]
+        )
+
+    def test_atr(self):
+        atr = self.update_with_windows(ATR("BTC/EUR-ohlcv", 14))
+        true_ranges = [2.0] + [
+            max(2.0, abs(value + 1 - previous), abs(value - 1 - previous))
+            for previous, value in zip(self.close, self.close[1:])
+        ]
+        expected = np.mean(true_ranges[:14])
+
+        for true_range in true_ranges[14:]:
+            expected = (expected * 13 + true_range) / 14
+
+        self.assertAlmostEqual(expected, atr.value)
+
+    def test_bollinger_bands(self):
+        bollinger_bands = self.update_with_windows(
+            BollingerBands("BTC/EUR-ohlcv", 20)
+        )
+        window = self.close[-20:]
+        self.assertAlmostEqual(
+            np.mean(window) + 2 * np.std(window),
+            bollinger_bands.value["upper"]
+        )
+
+    def test_rolling_min_and_max(self):
+        rolling_min = self.update_with_windows(RollingMin("BTC/EUR-ohlcv", 7))
+        rolling_max = self.update_with_windows(RollingMax("BTC/EUR-ohlcv", 7))
+        self.assertEqual(min(self.close[-7:]), rolling_min.value)
+        self.assertEqual(max(self.close[-7:]), rolling_max.value)
+        self.assertEqual(max(self.close[-8:-1]), rolling_max.previous_value)
+
+    def test_open_candle_is_refreshed(self):
+        sma = SMA("BTC/EUR-ohlcv", 3)
+        sma.update(create_ohlcv_data_frame([1, 2, 3]))
+        self.assertEqual(2, sma.value)
+        sma.update(create_ohlcv_data_frame([1, 2, 6]))
+        self.assertEqual(3, sma.value)
+        sma.update(create_ohlcv_data_frame([1, 2, 6, 7]))
+        self.assertEqual(5, sma.value)
+        self.assertEqual(3, sma.previous_value)
+
+    def test_warm_up_and_reset(self):
+        rolling_max = RollingMax("BTC/EUR-ohlcv", 3)
+        self.assertIsNone(rolling_max.update(create_ohlcv_data_frame([1, 2])))
+        self.assertEqual(
+            3, rolling_max.update(create_ohlcv_data_frame([1, 2, 3]))
+        )
+
+        # Older data, e.g. from a new backtest, resets the indicator
+        self.assertIsNone(rolling_max.update(create_ohlcv_data_frame([5])))
@@ -0,0 +1,64 @@
+import os
+import tempfile
+from unittest import TestCase
+
+from sqlalchemy import QueuePool, StaticPool, text
+
+from investing_algorithm_framework.domain import Config, \
+    SQLALCHEMY_DATABASE_URI, SQLITE_PRAGMAS
+from investing_algorithm_framework.infrastructure import Session, \
+    setup_sqlalchemy, remove_sqlite_database
+
+
+class AppStub:
+
+    def __init__(self, database_uri, pragmas=None):
+        self.config = Config()
+        self.config[SQLALCHEMY_DATABASE_URI] = database_uri
+
+        if pragmas is not None:
+            self.config[SQLITE_PRAGMAS] = pragmas
+
+
+class Test(TestCase):
+
+    def setUp(self) -> None:
+        self.directory = tempfile.mkdtemp()
+        self.database_path = os.path.join(self.directory, "test.sqlite3")
+
+    def tearDown(self) -> None:
+        remove_sqlite_database(self.database_path)
+        os.rmdir(self.directory)
+
+    def execute(self, statement):
+
+        with Session() as db:
+            return db.execute(text(statement)).scalar()
+
+    def test_sqlite_pragmas(self):
+        setup_sqlalchemy(AppStub(f"sqlite:///{self.database_path}"))
+        self.assertIsInstance(Session.kw["bind"].pool, QueuePool)
+        self.assertEqual("wal", self.execute("PRAGMA journal_mode"))
+        # synchronous NORMAL
+        self.assertEqual(1, self.execute("PRAGMA synchronous"))
+        self.assertEqual(-64000, self.execute("PRAGMA cache_size"))
+        self.assertEqual(5000, self.execute("PRAGMA busy_timeout"))
+
+    def test_disable_sqlite_pragmas(self):
+        setup_sqlalchemy(AppStub(f"sqlite:///{self.database_path}", {}))
+        self.assertEqual("delete", self.execute("PRAGMA journal_mode"))
+
+    def test_in_memory_database(self):
+        setup_sqlalchemy(AppStub("sqlite://"))
+        self.assertIsInstance(Session.kw["bind"].pool, StaticPool)
+
+    def test_remove_sqlite_database(self):
+        setup_sqlalchemy(AppStub(f"sqlite:///{self.database_path}"))
+
+        with Session() as db:
+            db.execute(text("CREATE TABLE test (id INTEGER)"))
+            db.commit()
+
+        self.assertTrue(os.path.exists(f"{self.database_path}-wal"))
+        remove_sqlite_database(self.database_path)
+        self.assertEqual([], os.listdir(self.directory))
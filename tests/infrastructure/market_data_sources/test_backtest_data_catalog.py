@@ -0,0 +1,137 @@
+import os
+import shutil
+import tempfile
+from datetime import datetime
+from unittest import TestCase, mock
+
+import polars
+
+from investing_algorithm_framework.domain import RESOURCE_DIRECTORY, \
+    BACKTEST_DATA_DIRECTORY_NAME, OHLCV_COLUMN_NAMES
+from investing_algorithm_framework.infrastructure import \
+    CCXTOHLCVBacktestMarketDataSource
+from investing_algorithm_framework.infrastructure.models\
+    .market_data_sources.backtest_data_catalog import BacktestDataCatalog
+
+FILE_NAME = "OHLCV_BTC-EUR_BINANCE_15m_2023-12-14:22:00_2023-12-25:00:00.csv"
+
+
+class Test(TestCase):
+
+    def setUp(self) -> None:
+        self.resource_dir = tempfile.mkdtemp()
+        self.backtest_data_dir = os.path.join(
+            self.resource_dir, "backtest_data"
+        )
+        os.mkdir(self.backtest_data_dir)
+        shutil.copy(
+            os.path.abspath(
+                os.path.join(
+                    os.path.realpath(__file__),
+                    os.pardir,
+                    os.pardir,
+                    os.pardir,
+                    "resources",
+                    "market_data_sources",
+                    FILE_NAME
+                )
+            ),
+            self.backtest_data_dir
+        )
+        self.data_source = CCXTOHLCVBacktestMarketDataSource(
+            identifier="OHLCV_BTC_EUR_BINANCE_15m",
+            market="BINANCE",
+            symbol="BTC/EUR",
+            timeframe="15m",
+            window_size=200,
+        )
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.resource_dir)
+
+    def prepare_data(self, backtest_start_date, backtest_end_date):
+        self.data_source.prepare_data(
+            config={
+                RESOURCE_DIRECTORY: self.resource_dir,
+                BACKTEST_DATA_DIRECTORY_NAME: "backtest_data"
+            },
+            backtest_start_date=backtest_start_date,
+            backtest_end_date=backtest_end_date,
+        )
+
+    def test_find_ohlcv_entry(self):
+        catalog = BacktestDataCatalog(self.backtest_data_dir)
+        entry = catalog.find_ohlcv_entry(
+            symbol="BTC/EUR",
+            market="BINANCE",
+            timeframe="15m",
+            extension="csv",
+            start_date=datetime(2023, 12, 20),
+            end_date=datetime(2023, 12, 26)
+        )
+        self.assertEqual(datetime(2023, 12, 14, 22), entry.start_date)
+        self.assertEqual(datetime(2023, 12, 25), entry.end_date)
+        self.assertFalse(
+            entry.covers(datetime(2023, 12, 20), datetime(2023, 12, 26))
+        )
+        self.assertIsNone(
+            catalog.find_ohlcv_entry(
+                symbol="BTC/EUR",
+                market="BINANCE",
+                timeframe="1h",
+                extension="csv",
+                start_date=datetime(2023, 12, 20),
+                end_date=datetime(2023, 12, 26)
+            )
+        )
+
+    @mock.patch(
+        "investing_algorithm_framework.infrastructure.models"
+        ".market_data_sources.ccxt.CCXTMarketService"
+    )
+    def test_prepare_data_from_covering_file(self, market_service):
+        self.prepare_data(datetime(2023, 12, 18), datetime(2023, 12, 24))
+        market_service.return_value.get_ohlcv.assert_not_called()
+        self.assertEqual(
+            os.path.join(self.backtest_data_dir, FILE_NAME),
+            self.data_source.data_file_path
+        )
+        data = self.data_source.get_data(
+            backtest_index_date=datetime(2023, 12, 20)
+        )
+        self.assertEqual(datetime(2023, 12, 20), data["Datetime"][-1])
+
+    @mock.patch(
+        "investing_algorithm_framework.infrastructure.models"
+        ".market_data_sources.ccxt.CCXTMarketService"
+    )
+    def test_prepare_data_downloads_missing_tail(self, market_service):
+        market_service.return_value.get_ohlcv.return_value = \
+            polars.DataFrame(
+                [
+                    [datetime(2023, 12, 25, 0, 0), 1.0, 1.0, 1.0, 1.0, 1.0],
+                    [datetime(2023, 12, 25, 0, 15), 2.0, 2.0, 2.0, 2.0, 2.0],
+                ],
+                schema=OHLCV_COLUMN_NAMES,
+                orient="row"
+            )
+        self.prepare_data(datetime(2023, 12, 17), datetime(2023, 12, 26))
+        market_service.return_value.get_ohlcv.assert_called_once_with(
+            symbol="BTC/EUR",
+            time_frame="15m",
+            from_timestamp=datetime(2023, 12, 25),
+            to_timestamp=datetime(2023, 12, 26),
+            market="BINANCE"
+        )
+        self.assertEqual(
+            [
+                "OHLCV_BTC-EUR_BINANCE_15m_2023-12-14:22:00_"
+                "2023-12-26:00:00.csv"
+            ],
+            os.listdir(self.backtest_data_dir)
+        )
+        data = self.data_source.data
+        self.assertEqual(datetime(2023, 12, 25, 0, 15), data["Datetime"][-1])
+        self.assertEqual(
+            1, len(data.filter(data["Datetime"] == datetime(2023, 12, 25)))
+        )
@@ -1,9 +1,13 @@
 import os
+import tempfile
 from datetime import datetime, timedelta
 from unittest import TestCase
 
+import polars
+
 from investing_algorithm_framework.domain import RESOURCE_DIRECTORY, \
-    BACKTEST_DATA_DIRECTORY_NAME
+    BACKTEST_DATA_DIRECTORY_NAME, BACKTEST_DATA_STORAGE_FORMAT, \
+    BacktestDataStorageFormat
 from investing_algorithm_framework.infrastructure import \
     CCXTOHLCVBacktestMarketDataSource
 
@@ -108,6 +112,86 @@ class Test(TestCase):
         self.assertEqual(200, data_source.window_size)
         self.assertEqual(csv_file_path, data_source._create_file_path())
 
+    def test_get_data(self):
+        data_source = CCXTOHLCVBacktestMarketDataSource(
+            identifier="OHLCV_BTC_EUR_BINANCE_15m",
+            market="BINANCE",
+            symbol="BTC/EUR",
+            timeframe="15m",
+            window_size=200
+        )
+        data_source.prepare_data(
+            config={
+                RESOURCE_DIRECTORY: self.resource_dir,
+                BACKTEST_DATA_DIRECTORY_NAME: "market_data_sources"
+            },
+            backtest_start_date=datetime(2023, 12, 17, 00, 00),
+            backtest_end_date=datetime(2023, 12, 25, 00, 00),
+        )
+        index_date = datetime(2023, 12, 20, 00, 00)
+        data = data_source.get_data(backtest_index_date=index_date)
+        self.assertTrue(0 < len(data) <= 201)
+        self.assertTrue(
+            data["Datetime"][0] >= index_date - timedelta(minutes=200 * 15)
+        )
+        self.assertEqual(index_date, data["Datetime"][-1])
+
+        # Moving the index date should move the window
+        index_date = datetime(2023, 12, 20, 00, 15)
+        data = data_source.get_data(backtest_index_date=index_date)
+        self.assertTrue(0 < len(data) <= 201)
+        self.assertEqual(index_date, data["Datetime"][-1])
+
+    def test_arrow_storage_format(self):
+        file_name = \
+            "OHLCV_BTC-EUR_BINANCE_15m_2023-12-14:22:00_2023-12-25:00:00"
+        data_source = CCXTOHLCVBacktestMarketDataSource(
+            identifier="OHLCV_BTC_EUR_BINANCE_15m",
+            market="BINANCE",
+            symbol="BTC/EUR",
+            timeframe="15m",
+            window_size=200
+        )
+        csv_data = data_source.read_data_from_file_path(
+            f"{self.resource_dir}/market_data_sources/{file_name}.csv"
+        )
+
+        with tempfile.TemporaryDirectory() as resource_dir:
+            os.mkdir(os.path.join(resource_dir, "backtest_data"))
+            arrow_file_path = os.path.join(
+                resource_dir, "backtest_data", f"{file_name}.arrow"
+            )
+            data_source.storage_format = BacktestDataStorageFormat.ARROW
+            data_source.write_data_to_file_path(
+                arrow_file_path, csv_data.rows()
+            )
+            data_source.storage_format = BacktestDataStorageFormat.CSV
+            data_source.prepare_data(
+                config={
+                    RESOURCE_DIRECTORY: resource_dir,
+                    BACKTEST_DATA_DIRECTORY_NAME: "backtest_data",
+                    BACKTEST_DATA_STORAGE_FORMAT: "arrow"
+                },
+                backtest_start_date=datetime(2023, 12, 17, 00, 00),
+                backtest_end_date=datetime(2023, 12, 25, 00, 00),
+            )
+            self.assertEqual(f"{file_name}.arrow", data_source.file_name)
+            self.assertTrue(data_source._data_source_exists(arrow_file_path))
+            self.assertEqual(
+                polars.Datetime, data_source.data["Datetime"].dtype
+            )
+            self.assertTrue(csv_data.equals(data_source.data))
+
+            # Csv remains available as export format
+            csv_file_path = os.path.join(resource_dir, f"{file_name}.csv")
+            data_source.export_data_to_csv(arrow_file_path, csv_file_path)
+            data_source.storage_format = BacktestDataStorageFormat.CSV
+            self.assertTrue(
+                csv_data.equals(
+                    data_source.read_data_from_file_path(csv_file_path)
+                )
+            )
+
 
 # def test_start_date(self):
     #     start_date = datetime(2023, 12, 1)
@@ -1,7 +1,11 @@
 import os
 from datetime import datetime, timedelta
 from unittest import TestCase
+from unittest.mock import patch
 
+import polars
+
+from investing_algorithm_framework.domain import OHLCV_COLUMN_NAMES
 from investing_algorithm_framework.infrastructure import \
     CCXTOHLCVMarketDataSource
 
@@ -93,3 +97,108 @@ class Test(TestCase):
             symbol="BTC/EUR",
         )
         self.assertEqual("15m", ccxt_ohlcv_market_data_source.timeframe)
+
+    @patch(
+        "investing_algorithm_framework.infrastructure.models"
+        ".market_data_sources.ccxt.CCXTMarketService"
+    )
+    def test_get_data_downloads_new_candles(self, market_service_class):
+        end_date = datetime(2023, 12, 1, 10)
+        candles = [
+            [datetime(2023, 12, 1, hour), 1.0, 2.0, 0.5, float(hour), 10.0]
+            for hour in range(11)
+        ]
+        calls = []
+
+        def get_ohlcv(symbol, time_frame, from_timestamp, to_timestamp,
+                      market):
+            calls.append(from_timestamp)
+            return polars.DataFrame(
+                [
+                    candle for candle in candles
+                    if from_timestamp <= candle[0] <= to_timestamp
+                ],
+                schema=OHLCV_COLUMN_NAMES,
+                orient="row"
+            )
+
+        market_service_class.return_value.get_ohlcv = get_ohlcv
+        ccxt_ohlcv_market_data_source = CCXTOHLCVMarketDataSource(
+            identifier="BTC/EUR",
+            window_size=4,
+            timeframe="1h",
+            market="BITVAVO",
+            symbol="GET_DATA/EUR",
+            end_date=end_date,
+        )
+        df = ccxt_ohlcv_market_data_source.get_data()
+        self.assertEqual([6, 7, 8, 9, 10], df["Close"].to_list())
+        self.assertEqual(OHLCV_COLUMN_NAMES, df.columns)
+
+        # The open candle is refreshed and the next candle is added
+        candles[10][4] = 10.5
+        candles.append([datetime(2023, 12, 1, 11), 1.0, 2.0, 0.5, 11.0, 10.0])
+        ccxt_ohlcv_market_data_source.end_date = datetime(2023, 12, 1, 11)
+        df = ccxt_ohlcv_market_data_source.get_data()
+        self.assertEqual([7, 8, 9, 10.5, 11], df["Close"].to_list())
+        self.assertEqual([datetime(2023, 12, 1, 6), end_date], calls)
+
+    @patch(
+        "investing_algorithm_framework.infrastructure.models"
+        ".market_data_sources.ccxt.CCXTMarketService"
+    )
+    def test_get_data_with_larger_window_downloads_missing_candles(
+        self, market_service_class
+    ):
+        end_date = datetime(2023, 12, 2, 10)
+        candles = [
+            [
+                datetime(2023, 12, 1) + timedelta(hours=hour),
+                1.0, 2.0, 0.5, float(hour), 10.0
+            ]
+            for hour in range(35)
+        ]
+        calls = []
+
+        def get_ohlcv(symbol, time_frame, from_timestamp, to_timestamp,
+                      market):
+            calls.append(from_timestamp)
+            return polars.DataFrame(
+                [
+                    candle for candle in candles
+                    if from_timestamp <= candle[0] <= to_timestamp
+                ],
+                schema=OHLCV_COLUMN_NAMES,
+                orient="row"
+            )
+
+        market_service_class.return_value.get_ohlcv = get_ohlcv
+        small_data_source = CCXTOHLCVMarketDataSource(
+            identifier="BTC/EUR-small",
+            window_size=4,
+            timeframe="1h",
+            market="BITVAVO",
+            symbol="WINDOW/EUR",
+            end_date=end_date,
+        )
+        large_data_source = CCXTOHLCVMarketDataSource(
+            identifier="BTC/EUR-large",
+            window_size=20,
+            timeframe="1h",
+            market="BITVAVO",
+            symbol="WINDOW/EUR",
+            end_date=end_date,
+        )
+        self.assertEqual(5, len(small_data_source.get_data()))
+        self.assertEqual(21, len(large_data_source.get_data()))
+        self.assertEqual(21, len(large_data_source.get_data()))
+        self.assertEqual(5, len(small_data_source.get_data()))
+        self.assertEqual(
+            [
+                datetime(2023, 12, 2, 6),
+                datetime(2023, 12, 1, 14),
+                end_date,
+                end_date
+            ],
+            calls
+        )
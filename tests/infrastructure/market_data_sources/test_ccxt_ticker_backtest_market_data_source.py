@@ -0,0 +1,72 @@
+import os
+from datetime import datetime
+from unittest import TestCase
+
+from investing_algorithm_framework.domain import RESOURCE_DIRECTORY, \
+    BACKTEST_DATA_DIRECTORY_NAME, OperationalException
+from investing_algorithm_framework.infrastructure.models.market_data_sources\
+    .ccxt import CCXTTickerBacktestMarketDataSource
+
+
+class Test(TestCase):
+
+    def setUp(self) -> None:
+        self.resource_dir = os.path.abspath(
+            os.path.join(
+                os.path.join(
+                    os.path.join(
+                        os.path.join(
+                            os.path.realpath(__file__),
+                            os.pardir
+                        ),
+                        os.pardir
+                    ),
+                    os.pardir
+                ),
+                "resources"
+            )
+        )
+        self.data_source = CCXTTickerBacktestMarketDataSource(
+            identifier="TICKER_BTC_EUR_BITVAVO",
+            market="BITVAVO",
+            symbol="BTC/EUR",
+        )
+        self.data_source.prepare_data(
+            config={
+                RESOURCE_DIRECTORY: self.resource_dir,
+                BACKTEST_DATA_DIRECTORY_NAME: "market_data_sources"
+            },
+            backtest_start_date=datetime(2021, 6, 2, 0, 15),
+            backtest_end_date=datetime(2021, 6, 26),
+        )
+
+    def test_get_data(self):
+        ticker = self.data_source.get_data(
+            backtest_index_date=datetime(2021, 6, 2, 0, 15)
+        )
+        self.assertEqual("BTC/EUR", ticker["symbol"])
+        self.assertEqual("2021-06-02 00:15:00", ticker["datetime"])
+        self.assertEqual((29656.0 + 29994.0) / 2, ticker["bid"])
+        self.assertEqual(ticker["bid"], ticker["ask"])
+
+        # Index dates between two candles take the next candle
+        ticker = self.data_source.get_data(
+            backtest_index_date=datetime(2021, 6, 2, 0, 20)
+        )
+        self.assertEqual("2021-06-02 00:30:00", ticker["datetime"])
+        self.assertEqual((29677.0 + 29813.0) / 2, ticker["bid"])
+
+    def test_get_data_returns_copies(self):
+        index_date = datetime(2021, 6, 2, 0, 15)
+        ticker = self.data_source.get_data(backtest_index_date=index_date)
+        ticker["bid"] = 0
+        self.assertNotEqual(
+            0, self.data_source.get_data(backtest_index_date=index_date)["bid"]
+        )
+
+    def test_get_data_without_ticker(self):
+
+        with self.assertRaises(OperationalException):
+            self.data_source.get_data(
+                backtest_index_date=datetime(2021, 7, 1)
+            )
@@ -0,0 +1,94 @@
+import os
+import shutil
+import tempfile
+from datetime import datetime
+from unittest import TestCase, mock
+
+from investing_algorithm_framework.domain import RESOURCE_DIRECTORY, \
+    BACKTEST_DATA_DIRECTORY_NAME, SMA, MACD
+from investing_algorithm_framework.infrastructure import \
+    CCXTOHLCVBacktestMarketDataSource
+from investing_algorithm_framework.infrastructure.models\
+    .market_data_sources.indicator_columns import \
+    get_indicator_columns_directory
+
+FILE_NAME = "OHLCV_BTC-EUR_BINANCE_15m_2023-12-14:22:00_2023-12-25:00:00.csv"
+
+
+class Test(TestCase):
+
+    def setUp(self) -> None:
+        self.resource_dir = tempfile.mkdtemp()
+        self.backtest_data_dir = os.path.join(
+            self.resource_dir, "backtest_data"
+        )
+        os.mkdir(self.backtest_data_dir)
+        shutil.copy(
+            os.path.join(
+                os.path.dirname(os.path.realpath(__file__)),
+                os.pardir,
+                os.pardir,
+                "resources",
+                "market_data_sources",
+                FILE_NAME
+            ),
+            self.backtest_data_dir
+        )
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.resource_dir)
+
+    def prepare_data(self, indicators):
+        data_source = CCXTOHLCVBacktestMarketDataSource(
+            identifier="BTC/EUR-ohlcv",
+            market="BINANCE",
+            symbol="BTC/EUR",
+            timeframe="15m",
+            window_size=200,
+        )
+        data_source.indicators = indicators
+        data_source.prepare_data(
+            config={
+                RESOURCE_DIRECTORY: self.resource_dir,
+                BACKTEST_DATA_DIRECTORY_NAME: "backtest_data"
+            },
+            backtest_start_date=datetime(2023, 12, 17),
+            backtest_end_date=datetime(2023, 12, 25),
+        )
+        return data_source
+
+    def test_window_contains_indicator_columns(self):
+        indicators = [SMA("BTC/EUR-ohlcv", 9), MACD("BTC/EUR-ohlcv")]
+        data_source = self.prepare_data(indicators)
+        window = data_source.get_data(
+            backtest_index_date=datetime(2023, 12, 20)
+        )
+        self.assertIn("sma_9", window.columns)
+        self.assertIn("macd_12_26_9_signal", window.columns)
+
+        # The precomputed columns match the streaming indicators
+        sma = SMA("BTC/EUR-ohlcv", 9)
+        sma.update(window.drop(["sma_9"]))
+        self.assertAlmostEqual(sma.value, window["sma_9"][-1])
+        self.assertEqual(window["sma_9"][-1], indicators[0].update(window))
+        self.assertEqual(
+            window["macd_12_26_9_histogram"][-2],
+            indicators[1].update(window[:-1])["histogram"]
+        )
+
+    def test_indicator_columns_are_cached(self):
+        self.prepare_data([SMA("BTC/EUR-ohlcv", 9)])
+        self.assertEqual(
+            ["sma_9.arrow"],
+            os.listdir(
+                get_indicator_columns_directory(
+                    os.path.join(self.backtest_data_dir, FILE_NAME)
+                )
+            )
+        )
+
+        with mock.patch.object(SMA, "create_columns") as create_columns:
+            data_source = self.prepare_data([SMA("BTC/EUR-ohlcv", 9)])
+            create_columns.assert_not_called()
+
+        self.assertIn("sma_9", data_source.data.columns)
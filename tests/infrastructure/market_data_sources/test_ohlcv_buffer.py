@@ -0,0 +1,51 @@
+from datetime import datetime
+from unittest import TestCase
+
+import numpy as np
+
+from investing_algorithm_framework.infrastructure.models\
+    .market_data_sources.ohlcv_buffer import OHLCVBuffer, get_ohlcv_buffer
+
+
+def create_candles(timestamps, close=1):
+    timestamps = np.array(timestamps, dtype=np.int64)
+    values = np.full((len(timestamps), 5), close, dtype=np.float64)
+    return timestamps, values
+
+
+class Test(TestCase):
+
+    def test_update_evicts_oldest_candles(self):
+        buffer = OHLCVBuffer(capacity=3)
+
+        for timestamp in range(10):
+            buffer.update(*create_candles([timestamp], close=timestamp))
+
+        self.assertEqual(3, len(buffer))
+        self.assertEqual([7, 8, 9], list(buffer.timestamps))
+        self.assertEqual([7, 8, 9], list(buffer.values[:, 3]))
+
+    def test_update_refreshes_open_candle(self):
+        buffer = OHLCVBuffer(capacity=5)
+        buffer.update(*create_candles([1, 2, 3]))
+        buffer.update(*create_candles([2, 3, 4], close=2))
+        self.assertEqual([1, 2, 3, 4], list(buffer.timestamps))
+        self.assertEqual([1, 1, 2, 2], list(buffer.values[:, 3]))
+
+    def test_frame_is_not_changed_by_updates(self):
+        buffer = OHLCVBuffer(capacity=2)
+        buffer.update(*create_candles([60000, 120000]))
+        df = buffer.to_frame(from_timestamp=100000)
+        buffer.update(*create_candles([120000, 180000], close=5))
+        self.assertEqual(1, len(df))
+        self.assertEqual([1], df["Close"].to_list())
+        self.assertEqual(datetime(1970, 1, 1, 0, 2), df["Datetime"][0])
+        self.assertEqual([5, 5], buffer.to_frame()["Close"].to_list())
+
+    def test_buffers_are_shared(self):
+        buffer = get_ohlcv_buffer("binance", "BUFFER/EUR", "1h", 2)
+        buffer.update(*create_candles([1, 2]))
+        shared_buffer = get_ohlcv_buffer("BINANCE", "BUFFER/EUR", "1h", 3.5)
+        self.assertIs(buffer, shared_buffer)
+        self.assertEqual(4, shared_buffer.capacity)
+        self.assertEqual([1, 2], list(shared_buffer.timestamps))
@@ -0,0 +1,113 @@
+import os
+from datetime import datetime, timedelta
+from unittest import TestCase
+
+from investing_algorithm_framework.domain import RESOURCE_DIRECTORY, \
+    BACKTEST_DATA_DIRECTORY_NAME, OHLCV_COLUMN_NAMES, \
+    resample_ohlcv_data_frame
+from investing_algorithm_framework.infrastructure import \
+    CCXTOHLCVBacktestMarketDataSource, set_base_timeframes
+from tests.resources import create_ohlcv_data_frame
+
+
+class Test(TestCase):
+
+    def setUp(self) -> None:
+        self.resource_dir = os.path.abspath(
+            os.path.join(
+                os.path.dirname(os.path.realpath(__file__)),
+                os.pardir,
+                os.pardir,
+                "resources"
+            )
+        )
+
+    def test_resample_ohlcv_data_frame(self):
+        # The first 15m candle starts at 00:45, so the candle of 00:00
+        # is incomplete and dropped
+        data = create_ohlcv_data_frame(
+            [
+                [index, index + 10, index - 10, index + 1]
+                for index in range(9)
+            ],
+            start_date=datetime(2023, 1, 1, 0, 45),
+            interval=timedelta(minutes=15)
+        )
+        data = resample_ohlcv_data_frame(data, "1h")
+        self.assertEqual(OHLCV_COLUMN_NAMES, data.columns)
+        self.assertEqual(2, len(data))
+        self.assertEqual(
+            [datetime(2023, 1, 1, 1), datetime(2023, 1, 1, 2)],
+            data["Datetime"].to_list()
+        )
+        self.assertEqual([1, 5], data["Open"].to_list())
+        self.assertEqual([14, 18], data["High"].to_list())
+        self.assertEqual([-9, -5], data["Low"].to_list())
+        self.assertEqual([5, 9], data["Close"].to_list())
+        self.assertEqual([4, 4], data["Volume"].to_list())
+
+    def test_set_base_timeframes(self):
+        market_data_sources = [
+            CCXTOHLCVBacktestMarketDataSource(
+                identifier=timeframe,
+                market="BINANCE",
+                symbol=symbol,
+                timeframe=timeframe,
+                window_size=10,
+            )
+            for symbol, timeframe in [
+                ("BTC/EUR", "2h"),
+                ("BTC/EUR", "15m"),
+                ("BTC/EUR", "1D"),
+                ("ETH/EUR", "1h"),
+            ]
+        ]
+        set_base_timeframes(market_data_sources)
+        self.assertEqual(
+            ["15m", None, "15m", None],
+            [
+                market_data_source.base_timeframe
+                for market_data_source in market_data_sources
+            ]
+        )
+
+    def test_prepare_data_with_base_timeframe(self):
+        files = os.listdir(
+            os.path.join(self.resource_dir, "market_data_sources")
+        )
+        data_source = CCXTOHLCVBacktestMarketDataSource(
+            identifier="OHLCV_BTC_EUR_BINANCE_2h",
+            market="BINANCE",
+            symbol="BTC/EUR",
+            timeframe="2h",
+            window_size=10,
+        )
+        data_source.base_timeframe = "15m"
+        data_source.prepare_data(
+            config={
+                RESOURCE_DIRECTORY: self.resource_dir,
+                BACKTEST_DATA_DIRECTORY_NAME: "market_data_sources"
+            },
+            backtest_start_date=datetime(2023, 12, 17, 00, 00),
+            backtest_end_date=datetime(2023, 12, 24, 00, 00),
+        )
+
+        # The data is resampled from an existing 15m file
+        self.assertEqual(
+            files,
+            os.listdir(os.path.join(self.resource_dir, "market_data_sources"))
+        )
+        self.assertIn("_15m_", data_source.data_file_path)
+        datetimes = data_source.data["Datetime"].to_list()
+        self.assertTrue(
+            all(
+                second - first == timedelta(hours=2)
+                for first, second in zip(datetimes, datetimes[1:])
+            )
+        )
+
+        data = data_source.get_data(
+            backtest_index_date=datetime(2023, 12, 20, 12, 00)
+        )
+        self.assertEqual(datetime(2023, 12, 20, 12), data["Datetime"][-1])
+        self.assertEqual(10, len(data))
@@ -0,0 +1,109 @@
+from datetime import datetime
+from unittest import TestCase
+
+from investing_algorithm_framework.domain import ApiException
+from investing_algorithm_framework.infrastructure import InMemoryDatabase, \
+    InMemoryOrderRepository, InMemoryPositionRepository, \
+    InMemoryPortfolioRepository
+
+
+class Test(TestCase):
+
+    def setUp(self) -> None:
+        self.database = InMemoryDatabase()
+        self.portfolio_repository = InMemoryPortfolioRepository(
+            database=self.database
+        )
+        self.position_repository = InMemoryPositionRepository(
+            database=self.database
+        )
+        self.order_repository = InMemoryOrderRepository(
+            database=self.database
+        )
+        self.portfolio = self.portfolio_repository.create(
+            {
+                "trading_symbol": "EUR",
+                "market": "BINANCE",
+                "unallocated": 1000,
+            }
+        )
+        self.position = self.position_repository.create(
+            {
+                "symbol": "BTC",
+                "amount": 0,
+                "portfolio_id": self.portfolio.id,
+            }
+        )
+
+    def create_order(self, created_at, status="OPEN"):
+        return self.order_repository.create(
+            {
+                "target_symbol": "BTC",
+                "trading_symbol": "EUR",
+                "amount": 1,
+                "price": 10,
+                "order_side": "BUY",
+                "order_type": "LIMIT",
+                "status": status,
+                "position_id": self.position.id,
+                "created_at": created_at,
+            }
+        )
+
+    def test_create(self):
+        self.assertEqual(1, self.portfolio.id)
+        self.assertEqual(1, self.position.id)
+        self.assertEqual("BINANCE", self.portfolio.identifier)
+        order = self.create_order(datetime(2023, 12, 1))
+        self.assertEqual(1, order.id)
+        self.assertEqual(0, order.net_gain)
+        self.assertIsNotNone(order.updated_at)
+        self.assertEqual(2, self.create_order(datetime(2023, 12, 2)).id)
+
+    def test_get_returns_copies(self):
+        order = self.create_order(datetime(2023, 12, 1))
+        order.status = "CLOSED"
+        self.assertEqual("OPEN", self.order_repository.get(order.id).status)
+
+        updated_order = self.order_repository.update(
+            order.id, {"status": "CLOSED"}
+        )
+        self.assertEqual("CLOSED", updated_order.status)
+        self.assertEqual("CLOSED", self.order_repository.get(order.id).status)
+
+    def test_get_not_found(self):
+
+        with self.assertRaises(ApiException):
+            self.order_repository.get(1)
+
+        with self.assertRaises(ApiException):
+            self.position_repository.find({"symbol": "ETH"})
+
+    def test_query_params(self):
+        self.create_order(datetime(2023, 12, 1))
+        self.create_order(datetime(2023, 12, 3), status="CLOSED")
+        self.create_order(datetime(2023, 12, 2))
+        orders = self.order_repository.get_all(
+            {"portfolio_id": self.portfolio.id}
+        )
+        self.assertEqual(
+            [datetime(2023, 12, 3), datetime(2023, 12, 2),
+             datetime(2023, 12, 1)],
+            [order.created_at for order in orders]
+        )
+        self.assertEqual(2, self.order_repository.count({"status": "OPEN"}))
+        self.assertEqual(0, self.order_repository.count({"portfolio_id": 2}))
+        self.assertTrue(
+            self.position_repository.exists(
+                {"portfolio": self.portfolio.id, "symbol": "BTC"}
+            )
+        )
+        self.assertEqual(
+            0, self.position_repository.count({"amount_gt": 0})
+        )
+        self.assertEqual(
+            self.portfolio.id,
+            self.portfolio_repository.find(
+                {"position": self.position.id}
+            ).id
+        )
@@ -1,7 +1,12 @@
 import os
 
+from sqlalchemy import inspect
+
 from investing_algorithm_framework import create_app, RESOURCE_DIRECTORY, \
     PortfolioConfiguration
+from investing_algorithm_framework.infrastructure import Session, \
+    create_all_tables
+from investing_algorithm_framework.infrastructure.models import SQLOrder
 from tests.resources import TestBase, MarketServiceStub
 
 
@@ -59,3 +64,24 @@ class Test(TestBase):
                 {"portfolio_id": f"{portfolio.id}aeokgopge"}
             )
         )
+
+    def test_create_missing_indexes(self):
+        self.app.run(number_of_iterations=1, sync=False)
+        bind = Session().bind
+        index_names = [
+            index["name"] for index in inspect(bind).get_indexes("orders")
+        ]
+        self.assertIn("ix_orders_position_id_status_order_side", index_names)
+
+        # Databases created before the index was added to the model
+        for index in SQLOrder.__table__.indexes:
+            index.drop(bind=bind)
+
+        self.assertEqual([], inspect(bind).get_indexes("orders"))
+        create_all_tables()
+        self.assertEqual(
+            sorted(index_names),
+            sorted(
+                index["name"] for index in inspect(bind).get_indexes("orders")
+            )
+        )
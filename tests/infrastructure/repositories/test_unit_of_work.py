@@ -0,0 +1,120 @@
+from unittest import TestCase
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.exc import SQLAlchemyError
+
+from investing_algorithm_framework.domain import ApiException
+from investing_algorithm_framework.infrastructure import Session, \
+    SQLPortfolioRepository, SQLPositionRepository, create_all_tables, \
+    unit_of_work
+
+
+class Test(TestCase):
+
+    def setUp(self) -> None:
+        Session.configure(bind=create_engine("sqlite:///:memory:"))
+        create_all_tables()
+        self.portfolio_repository = SQLPortfolioRepository()
+        self.position_repository = SQLPositionRepository()
+        self.portfolio = self.portfolio_repository.create(
+            {
+                "identifier": "binance",
+                "trading_symbol": "EUR",
+                "market": "BINANCE",
+                "unallocated": 1000,
+            }
+        )
+        self.commits = []
+        event.listen(Session, "after_commit", self.on_commit)
+
+    def tearDown(self) -> None:
+        event.remove(Session, "after_commit", self.on_commit)
+
+    def on_commit(self, session):
+        self.commits.append(session)
+
+    def test_single_commit(self):
+
+        with self.position_repository.unit_of_work():
+            position = self.position_repository.create(
+                {"symbol": "BTC", "portfolio_id": self.portfolio.id}
+            )
+            self.position_repository.update(position.id, {"amount": 2})
+
+            # Nested units of work join the outer transaction
+            with unit_of_work():
+                self.portfolio_repository.update(
+                    self.portfolio.id, {"unallocated": 900}
+                )
+
+            self.assertEqual(0, len(self.commits))
+            self.assertEqual(
+                2,
+                self.position_repository.find(
+                    {"portfolio": self.portfolio.id, "symbol": "BTC"}
+                ).amount
+            )
+
+        self.assertEqual(1, len(self.commits))
+        self.assertEqual(2, self.position_repository.get(position.id).amount)
+        self.assertEqual(
+            900, self.portfolio_repository.get(self.portfolio.id).unallocated
+        )
+
+    def test_rollback(self):
+
+        with self.assertRaises(ApiException):
+
+            with self.position_repository.unit_of_work():
+                self.position_repository.create(
+                    {"symbol": "BTC", "portfolio_id": self.portfolio.id}
+                )
+                self.portfolio_repository.update(
+                    self.portfolio.id, {"unallocated": 900}
+                )
+                self.position_repository.get(100)
+
+        self.assertEqual(0, len(self.commits))
+        self.assertEqual(0, self.position_repository.count())
+        self.assertEqual(
+            1000, self.portfolio_repository.get(self.portfolio.id).unallocated
+        )
+
+    def test_returned_models_are_bound_to_the_unit_of_work(self):
+
+        with self.position_repository.unit_of_work():
+            position = self.position_repository.create(
+                {"symbol": "BTC", "portfolio_id": self.portfolio.id}
+            )
+            self.assertEqual("BINANCE", position.portfolio.market)
+            self.position_repository.update(position.id, {"amount": 2})
+
+        # The models can still be read after the unit of work is committed
+        self.assertEqual(2, position.amount)
+        self.assertEqual(1, len(self.commits))
+
+    def test_failed_operation_fails_the_unit_of_work(self):
+        self.position_repository.create(
+            {"symbol": "BTC", "portfolio_id": self.portfolio.id}
+        )
+
+        with self.assertRaises(SQLAlchemyError):
+
+            with self.position_repository.unit_of_work():
+                self.portfolio_repository.update(
+                    self.portfolio.id, {"unallocated": 900}
+                )
+
+                # The repository does not roll back the transaction, so
+                # the unit of work can not commit part of its changes
+                try:
+                    self.position_repository.create(
+                        {"symbol": "BTC", "portfolio_id": self.portfolio.id}
+                    )
+                except ApiException:
+                    pass
+
+        self.assertEqual(1, len(self.commits))
+        self.assertEqual(
+            1000, self.portfolio_repository.get(self.portfolio.id).unallocated
+        )
@@ -0,0 +1,121 @@
+import asyncio
+from datetime import datetime
+from threading import Thread
+from unittest import TestCase
+
+from investing_algorithm_framework.domain import Order, MarketCredential
+from investing_algorithm_framework.infrastructure import \
+    AsyncCCXTMarketService, SyncCCXTMarketService
+from investing_algorithm_framework.services import MarketCredentialService
+
+
+def create_ccxt_order(external_id, symbol="BTC/EUR", status="closed"):
+    return {
+        "id": external_id,
+        "symbol": symbol,
+        "status": status,
+        "price": 10,
+        "amount": 1,
+        "type": "limit",
+        "side": "buy",
+        "datetime": "2023-12-01T00:00:00.000Z",
+        "fee": {"currency": "EUR", "cost": 0.01, "rate": 0.001},
+    }
+
+
+class ExchangeStub:
+
+    def __init__(self, has_fetch_orders=True):
+        self.has = {
+            "fetchOrders": has_fetch_orders,
+            "fetchOrder": True,
+        }
+        self.fetch_orders_calls = []
+        self.fetch_order_calls = []
+
+    async def fetchOrders(self, symbol, since=None):
+        self.fetch_orders_calls.append((symbol, since))
+        return [create_ccxt_order("1"), create_ccxt_order("2")]
+
+    async def fetchOrder(self, external_id, symbol):
+        self.fetch_order_calls.append(external_id)
+        return create_ccxt_order(external_id, symbol)
+
+
+class Test(TestCase):
+
+    def setUp(self) -> None:
+        self.orders = [
+            Order(
+                order_type="LIMIT",
+                order_side="BUY",
+                status="OPEN",
+                amount=1,
+                target_symbol="BTC",
+                trading_symbol="EUR",
+                external_id=external_id,
+                created_at=datetime(2023, 12, 1, index),
+            ) for index, external_id in enumerate(["1", "3", "2"])
+        ]
+
+    def get_order_updates(self, exchange):
+        market_service = AsyncCCXTMarketService(None)
+        market_service.get_exchange = lambda market: exchange
+        return asyncio.run(
+            market_service.get_order_updates(self.orders, "binance")
+        )
+
+    def test_get_order_updates_with_fetch_orders(self):
+        exchange = ExchangeStub()
+        orders = self.get_order_updates(exchange)
+        self.assertEqual(["1", "3", "2"], [o.external_id for o in orders])
+        self.assertEqual(
+            [("BTC/EUR", 1701388800000)], exchange.fetch_orders_calls
+        )
+        self.assertEqual(["3"], exchange.fetch_order_calls)
+
+    def test_get_order_updates_without_fetch_orders(self):
+        exchange = ExchangeStub(has_fetch_orders=False)
+        orders = self.get_order_updates(exchange)
+        self.assertEqual(["1", "3", "2"], [o.external_id for o in orders])
+        self.assertEqual([], exchange.fetch_orders_calls)
+        self.assertEqual(["1", "3", "2"], exchange.fetch_order_calls)
+
+    def test_exchanges_are_pooled_per_credential(self):
+        market_credential_service = MarketCredentialService()
+        market_service = AsyncCCXTMarketService(market_credential_service)
+        exchange = market_service.get_exchange("binance")
+        self.assertIs(exchange, market_service.get_exchange("BINANCE"))
+        market_credential_service.add(
+            MarketCredential(
+                market="binance", api_key="api_key", secret_key="secret_key"
+            )
+        )
+        self.assertIsNot(exchange, market_service.get_exchange("binance"))
+        asyncio.run(market_service.close())
+
+    def test_sync_market_service(self):
+        market_service = SyncCCXTMarketService(None)
+        exchange = ExchangeStub()
+        market_service.async_market_service.get_exchange = \
+            lambda market: exchange
+        order = market_service.get_order(self.orders[1], "binance")
+        self.assertEqual("3", order.external_id)
+        self.assertIs(
+            market_service.initialize_exchange("binance", None),
+            market_service.initialize_exchange("binance", None)
+        )
+
+        # Synchronous exchanges are not shared between threads
+        exchanges = []
+        thread = Thread(
+            target=lambda: exchanges.append(
+                market_service.initialize_exchange("binance", None)
+            )
+        )
+        thread.start()
+        thread.join()
+        self.assertIsNot(
+            market_service.initialize_exchange("binance", None), exchanges[0]
+        )
+        market_service.close()
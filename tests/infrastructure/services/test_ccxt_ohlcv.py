@@ -0,0 +1,50 @@
+from datetime import datetime
+from unittest import TestCase
+
+import ccxt
+
+from investing_algorithm_framework.domain import OHLCV_COLUMN_NAMES
+from investing_algorithm_framework.infrastructure import CCXTMarketService
+from investing_algorithm_framework.services import MarketCredentialService
+
+
+class ExchangeStub:
+    has = {"fetchOHLCV": True}
+    rateLimit = 1
+    parse8601 = staticmethod(ccxt.Exchange.parse8601)
+    parse_timeframe = staticmethod(ccxt.Exchange.parse_timeframe)
+
+    def __init__(self, candles, page_size=2):
+        self.candles = candles
+        self.page_size = page_size
+
+    def fetch_ohlcv(self, symbol, time_frame, since):
+        candles = [candle for candle in self.candles if candle[0] >= since]
+        return candles[:self.page_size]
+
+
+class Test(TestCase):
+
+    def test_get_ohlcv(self):
+        start = 1701388800000
+        candles = [
+            [start + minute * 60000, 1, 2, 0.5, minute, None]
+            for minute in range(5)
+        ]
+        market_service = CCXTMarketService(MarketCredentialService())
+        market_service.initialize_exchange = \
+            lambda market, market_credential: ExchangeStub(candles)
+        df = market_service.get_ohlcv(
+            symbol="BTC/EUR",
+            time_frame="1m",
+            from_timestamp=datetime(2023, 12, 1),
+            to_timestamp=datetime(2023, 12, 1, 0, 3),
+            market="binance"
+        )
+        self.assertEqual(OHLCV_COLUMN_NAMES, df.columns)
+        self.assertEqual(
+            [datetime(2023, 12, 1, 0, minute) for minute in range(4)],
+            df["Datetime"].to_list()
+        )
+        self.assertEqual([0, 1, 2, 3], df["Close"].to_list())
+        self.assertEqual(4, df["Volume"].is_nan().sum())
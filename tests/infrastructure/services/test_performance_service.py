@@ -0,0 +1,117 @@
+from datetime import datetime
+from unittest import TestCase
+
+from investing_algorithm_framework.domain import BacktestProfile
+from investing_algorithm_framework.infrastructure import InMemoryDatabase, \
+    InMemoryOrderRepository, InMemoryPositionRepository, \
+    InMemoryPortfolioRepository, PerformanceService
+
+
+class Test(TestCase):
+
+    def setUp(self) -> None:
+        database = InMemoryDatabase()
+        self.order_repository = InMemoryOrderRepository(database)
+        self.position_repository = InMemoryPositionRepository(database)
+        portfolio_repository = InMemoryPortfolioRepository(database)
+        self.performance_service = PerformanceService(
+            order_repository=self.order_repository,
+            position_repository=self.position_repository,
+            portfolio_repository=portfolio_repository,
+        )
+        self.portfolio = portfolio_repository.create(
+            {
+                "trading_symbol": "EUR",
+                "market": "BINANCE",
+                "unallocated": 900,
+            }
+        )
+        self.portfolio = portfolio_repository.update(
+            self.portfolio.id, {"total_net_gain": 20}
+        )
+        self.position_repository.create(
+            {"symbol": "EUR", "amount": 900, "portfolio_id": 1}
+        )
+        self.btc_position = self.position_repository.create(
+            {"symbol": "BTC", "amount": 2, "portfolio_id": 1}
+        )
+        self.create_order(
+            "BUY", "CLOSED", 10, trade_closed_at=datetime(2023, 12, 1, 2)
+        )
+        self.create_order(
+            "BUY", "CLOSED", 20, trade_closed_at=datetime(2023, 12, 1, 4)
+        )
+        self.create_order("SELL", "CLOSED", 30, net_gain=25)
+        self.create_order("SELL", "CLOSED", 10, net_gain=-5)
+        self.create_order("BUY", "OPEN", 10, amount=3)
+        self.tickers = {"BTC": {"bid": 50}}
+        self.backtest_profile = BacktestProfile(initial_unallocated=1000)
+
+    def create_order(
+        self,
+        order_side,
+        status,
+        price,
+        amount=1,
+        net_gain=0,
+        trade_closed_at=None
+    ):
+        self.order_repository.create(
+            {
+                "target_symbol": "BTC",
+                "trading_symbol": "EUR",
+                "amount": amount,
+                "price": price,
+                "order_side": order_side,
+                "order_type": "LIMIT",
+                "status": status,
+                "net_gain": net_gain,
+                "position_id": self.btc_position.id,
+                "created_at": datetime(2023, 12, 1),
+                "trade_closed_at": trade_closed_at,
+            }
+        )
+
+    def test_get_backtest_report_metrics(self):
+        metrics = self.performance_service.get_backtest_report_metrics(
+            self.portfolio.id, self.tickers, self.backtest_profile
+        )
+        self.assertEqual(5, metrics["number_of_orders"])
+        self.assertEqual(2, metrics["number_of_positions"])
+        self.assertEqual(2, metrics["number_of_trades_closed"])
+        self.assertEqual(1, metrics["number_of_trades_open"])
+        self.assertEqual(25, metrics["percentage_positive_trades"])
+        self.assertEqual(25, metrics["percentage_negative_trades"])
+        self.assertEqual(2, metrics["total_net_gain_percentage"])
+        self.assertEqual(3, metrics["average_trade_duration"])
+        self.assertEqual(15, metrics["average_trade_size"])
+        self.assertEqual(1000, metrics["total_value"])
+        self.assertEqual(30, metrics["growth"])
+        self.assertEqual(3, metrics["growth_rate"])
+        self.assertEqual({"BTC": 3}, metrics["amount_pending"])
+
+    def test_metrics_match_single_metric_functions(self):
+        metrics = self.performance_service.get_backtest_report_metrics(
+            self.portfolio.id, self.tickers, self.backtest_profile
+        )
+        portfolio_id = self.portfolio.id
+        self.assertEqual(
+            self.performance_service.get_percentage_positive_trades(
+                portfolio_id
+            ),
+            metrics["percentage_positive_trades"]
+        )
+        self.assertEqual(
+            self.performance_service.get_number_of_trades_open(portfolio_id),
+            metrics["number_of_trades_open"]
+        )
+        self.assertEqual(
+            self.performance_service.get_average_trade_duration(portfolio_id),
+            metrics["average_trade_duration"]
+        )
+        self.assertEqual(
+            self.performance_service.get_growth_of_backtest(
+                portfolio_id, self.tickers, self.backtest_profile
+            ),
+            metrics["growth"]
+        )
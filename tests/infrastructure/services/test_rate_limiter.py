@@ -0,0 +1,42 @@
+from threading import Thread
+from time import monotonic
+from unittest import TestCase
+
+from investing_algorithm_framework.infrastructure.services.market_service \
+    import TokenBucketRateLimiter, get_rate_limiter
+
+
+class Test(TestCase):
+
+    def test_acquire_paces_requests(self):
+        rate_limiter = TokenBucketRateLimiter(rate=50)
+        start = monotonic()
+
+        for _ in range(6):
+            rate_limiter.acquire()
+
+        # The first token is available immediately
+        self.assertGreaterEqual(monotonic() - start, 5 / 50)
+
+    def test_acquire_from_multiple_threads(self):
+        rate_limiter = TokenBucketRateLimiter(rate=50)
+        threads = [
+            Thread(target=rate_limiter.acquire) for _ in range(6)
+        ]
+        start = monotonic()
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        self.assertGreaterEqual(monotonic() - start, 5 / 50)
+
+    def test_get_rate_limiter_per_market(self):
+        self.assertIs(
+            get_rate_limiter("BINANCE", 50), get_rate_limiter("binance", 50)
+        )
+        self.assertIsNot(
+            get_rate_limiter("binance", 50), get_rate_limiter("bitvavo", 50)
+        )
@@ -1,7 +1,8 @@
-from .utils import random_string
+from .utils import random_string, create_ohlcv_data_frame
 from .test_base import TestBase, FlaskTestBase
 from .stubs import MarketServiceStub
 
 __all__ = [
-    'random_string', "TestBase", "MarketServiceStub", "FlaskTestBase"
+    'random_string', "TestBase", "MarketServiceStub", "FlaskTestBase",
+    "create_ohlcv_data_frame"
 ]
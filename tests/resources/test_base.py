@@ -1,7 +1,8 @@
 from unittest import TestCase
 import os
 import logging
-from investing_algorithm_framework.infrastructure.database import Session
+from investing_algorithm_framework.infrastructure.database import Session, \
+    remove_sqlite_database
 from investing_algorithm_framework import create_app
 from investing_algorithm_framework.domain import RESOURCE_DIRECTORY
 from investing_algorithm_framework.app.web import create_flask_app
@@ -26,7 +27,7 @@ class TestBase(TestCase):
             session.close()
 
             try:
-                os.remove(database_path)
+                remove_sqlite_database(database_path)
             except Exception as e:
                 logger.error(e)
 
@@ -60,6 +61,6 @@ class FlaskTestBase(FlaskTestCase):
             session.close()
 
             try:
-                os.remove(database_path)
+                remove_sqlite_database(database_path)
             except Exception as e:
                 logger.error(e)
@@ -1,5 +1,10 @@
 import random
 import string
+from datetime import datetime, timedelta
+
+import polars
+
+from investing_algorithm_framework.domain import OHLCV_COLUMN_NAMES
 
 
 def random_string(n, spaces: bool = False):
@@ -9,3 +14,32 @@ def random_string(n, spaces: bool = False):
 
     return ''.join(random.choice(string.ascii_lowercase) for _ in range(n))
 
+
+def create_ohlcv_data_frame(
+    candles, start_date=datetime(2023, 12, 1), interval=timedelta(hours=1)
+):
+    """
+    Function to create an OHLCV data frame with a candle every interval
+    from the start date. A candle is either a list with the open, high,
+    low and close or a single close. The volume of every candle is 1.
+    """
+    rows = []
+
+    for index, candle in enumerate(candles):
+
+        if not isinstance(candle, (list, tuple)):
+            candle = [candle] * 4
+
+        rows.append(
+            [start_date + interval * index]
+            + [float(value) for value in candle]
+            + [1.0]
+        )
+
+    return polars.DataFrame(
+        rows,
+        schema=dict(
+            zip(OHLCV_COLUMN_NAMES, [polars.Datetime] + [polars.Float64] * 5)
+        ),
+        orient="row"
+    )
@@ -0,0 +1,63 @@
+from datetime import datetime
+from threading import Barrier
+from unittest import TestCase
+
+from investing_algorithm_framework.domain import BacktestMarketDataSource
+from investing_algorithm_framework.services import \
+    BacktestMarketDataSourceService
+
+
+class BarrierMarketDataSource(BacktestMarketDataSource):
+
+    def __init__(self, identifier, barrier):
+        super().__init__(
+            identifier=identifier,
+            market="BINANCE",
+            symbol="BTC/EUR",
+        )
+        self.barrier = barrier
+        self.prepared = False
+
+    def prepare_data(
+        self,
+        config,
+        backtest_start_date,
+        backtest_end_date,
+        **kwargs
+    ):
+        # Only passes when all data sources are prepared at the same time
+        self.barrier.wait(timeout=5)
+        self.prepared = True
+
+    def get_data(self, backtest_index_date, **kwargs):
+        pass
+
+    def to_backtest_market_data_source(self):
+        return self
+
+    def empty(self):
+        return False
+
+
+class TestBacktestMarketDataSourceService(TestCase):
+
+    def test_prepare_market_data_sources_concurrently(self):
+        barrier = Barrier(3)
+        market_data_sources = [
+            BarrierMarketDataSource(f"data_source_{index}", barrier)
+            for index in range(3)
+        ]
+        BacktestMarketDataSourceService.prepare_market_data_sources(
+            market_data_sources=market_data_sources,
+            config={},
+            backtest_start_date=datetime(2023, 12, 1),
+            backtest_end_date=datetime(2023, 12, 2),
+            market_credential_service=None,
+            max_workers=3
+        )
+        self.assertTrue(
+            all(
+                market_data_source.prepared
+                for market_data_source in market_data_sources
+            )
+        )
@@ -0,0 +1,198 @@
+from datetime import datetime
+from unittest import TestCase
+
+import numpy as np
+
+from investing_algorithm_framework import TradingStrategy, TimeUnit
+from investing_algorithm_framework.domain import OperationalException, \
+    EquityCurve
+from investing_algorithm_framework.infrastructure import InMemoryDatabase, \
+    InMemoryPortfolioRepository, InMemoryPositionRepository
+from investing_algorithm_framework.services import BackTestService
+
+
+class StrategyOne(TradingStrategy):
+    time_unit = TimeUnit.HOUR
+    interval = 2
+
+
+class StrategyTwo(TradingStrategy):
+    time_unit = TimeUnit.MINUTE
+    interval = 30
+
+
+class StrategyWithData(TradingStrategy):
+    time_unit = TimeUnit.MINUTE
+    interval = 30
+    market_data_sources = ["BTC/EUR-ohlcv", "ETH/EUR-ohlcv"]
+
+
+class StrategyWithoutUpdateTimestamps(TradingStrategy):
+    time_unit = TimeUnit.HOUR
+    interval = 1
+    market_data_sources = ["BTC/EUR-ticker"]
+
+
+class BacktestMarketDataSourceStub:
+
+    def __init__(self, identifier, timestamps):
+        self.identifier = identifier
+        self.timestamps = timestamps
+
+    def get_identifier(self):
+        return self.identifier
+
+    def get_update_timestamps(self):
+
+        if self.timestamps is None:
+            return None
+
+        return np.array(self.timestamps, dtype="datetime64[us]")
+
+
+class MarketDataSourceServiceStub:
+
+    def __init__(self, market_data_sources):
+        self.market_data_sources = market_data_sources
+
+    def get_market_data_sources(self):
+        return self.market_data_sources
+
+
+class OrderServiceStub:
+    number_of_changes = 0
+
+    def get_all(self, query_params=None):
+        return []
+
+
+class TickerMarketDataSourceServiceStub:
+
+    def get_ticker(self, symbol, market=None):
+        return {"bid": 20}
+
+
+class TestBacktestService(TestCase):
+
+    def setUp(self) -> None:
+        self.backtest_service = BackTestService(
+            market_data_source_service=None,
+            order_service=None,
+            portfolio_repository=None,
+            position_repository=None,
+            performance_service=None,
+        )
+
+    def test_generate_schedule(self):
+        schedule = self.backtest_service.generate_schedule(
+            strategies=[StrategyOne(), StrategyTwo()],
+            start_date=datetime(2023, 12, 1),
+            end_date=datetime(2023, 12, 2),
+        )
+        self.assertEqual(13 + 49, len(schedule))
+        self.assertTrue(schedule.index.is_monotonic_increasing)
+        self.assertEqual(
+            13, len(schedule[schedule["id"] == "StrategyOne"])
+        )
+        self.assertEqual(
+            49, len(schedule[schedule["id"] == "StrategyTwo"])
+        )
+
+        # Strategies that run at the same time keep their registration order
+        self.assertEqual(
+            ["StrategyOne", "StrategyTwo"],
+            list(schedule.loc[datetime(2023, 12, 1, 2)]["id"])
+        )
+
+    def test_generate_schedule_without_strategies(self):
+
+        with self.assertRaises(OperationalException):
+            self.backtest_service.generate_schedule(
+                strategies=[],
+                start_date=datetime(2023, 12, 1),
+                end_date=datetime(2023, 12, 2),
+            )
+
+    def test_get_changed_runs(self):
+        self.backtest_service._market_data_source_service = \
+            MarketDataSourceServiceStub([
+                BacktestMarketDataSourceStub(
+                    "BTC/EUR-ohlcv",
+                    [datetime(2023, 12, 1, 0), datetime(2023, 12, 1, 2)]
+                ),
+                BacktestMarketDataSourceStub(
+                    "ETH/EUR-ohlcv", [datetime(2023, 12, 1, 0, 45)]
+                ),
+                BacktestMarketDataSourceStub("BTC/EUR-ticker", None),
+            ])
+        strategies = [StrategyWithData(), StrategyWithoutUpdateTimestamps()]
+        schedule = self.backtest_service.generate_schedule(
+            strategies=strategies,
+            start_date=datetime(2023, 12, 1),
+            end_date=datetime(2023, 12, 1, 2),
+        )
+        changed_runs = self.backtest_service.get_changed_runs(
+            schedule,
+            {strategy.worker_id: strategy for strategy in strategies}
+        )
+        changed_run_times = schedule.index[changed_runs]
+        self.assertEqual(
+            [
+                datetime(2023, 12, 1, 0),
+                datetime(2023, 12, 1, 1),
+                datetime(2023, 12, 1, 2),
+            ],
+            list(changed_run_times[
+                schedule["id"][changed_runs] == "StrategyWithData"
+            ])
+        )
+
+        # Runs of strategies without update timestamps are never skipped
+        self.assertTrue(
+            changed_runs[
+                schedule["id"] == "StrategyWithoutUpdateTimestamps"
+            ].all()
+        )
+
+    def test_record_equity(self):
+        database = InMemoryDatabase()
+        portfolio_repository = InMemoryPortfolioRepository(database)
+        position_repository = InMemoryPositionRepository(database)
+
+        for market in ["BINANCE", "BITVAVO"]:
+            portfolio = portfolio_repository.create(
+                {
+                    "trading_symbol": "EUR",
+                    "market": market,
+                    "unallocated": 1000,
+                }
+            )
+            position_repository.create(
+                {
+                    "symbol": "BTC",
+                    "amount": 1 if market == "BINANCE" else 0,
+                    "cost": 10,
+                    "portfolio_id": portfolio.id
+                }
+            )
+
+        order_service = OrderServiceStub()
+        backtest_service = BackTestService(
+            market_data_source_service=TickerMarketDataSourceServiceStub(),
+            order_service=order_service,
+            portfolio_repository=portfolio_repository,
+            position_repository=position_repository,
+            performance_service=None,
+        )
+        equity_curves = {1: EquityCurve(), 2: EquityCurve()}
+        backtest_service.record_equity(equity_curves, datetime(2023, 1, 1))
+        self.assertEqual([1020], list(equity_curves[1].equity))
+        self.assertEqual([1000], list(equity_curves[2].equity))
+
+        # The holdings are only read again after the orders changed
+        position_repository.update(2, {"amount": 2})
+        backtest_service.record_equity(equity_curves, datetime(2023, 1, 2))
+        order_service.number_of_changes += 1
+        backtest_service.record_equity(equity_curves, datetime(2023, 1, 3))
+        self.assertEqual([1020, 1020, 1020], list(equity_curves[1].equity))
+        self.assertEqual([1000, 1000, 1040], list(equity_curves[2].equity))
@@ -0,0 +1,64 @@
+from collections import Counter
+from threading import Barrier
+from unittest import TestCase
+
+from investing_algorithm_framework.services import MarketDataContext
+
+
+class MarketDataSourceServiceStub:
+
+    def __init__(self, barrier=None):
+        self.calls = Counter()
+        self.barrier = barrier
+
+    def get_data(self, identifier):
+        self.calls[identifier] += 1
+
+        if self.barrier is not None:
+            self.barrier.wait(timeout=5)
+
+        return {"identifier": identifier}
+
+
+class Test(TestCase):
+
+    def test_identifiers_are_resolved_once(self):
+        market_data_source_service = MarketDataSourceServiceStub()
+        market_data_context = MarketDataContext(market_data_source_service)
+        first = market_data_context.get_market_data(
+            ["BTC/EUR-ohlcv", "BTC/EUR-ticker"]
+        )
+        second = market_data_context.get_market_data(
+            ["BTC/EUR-ticker", "ETH/EUR-ticker", "BTC/EUR-ticker"]
+        )
+        self.assertEqual(
+            {"BTC/EUR-ohlcv": 1, "BTC/EUR-ticker": 1, "ETH/EUR-ticker": 1},
+            market_data_source_service.calls
+        )
+        self.assertEqual(
+            ["BTC/EUR-ticker", "ETH/EUR-ticker"], list(second.keys())
+        )
+        self.assertIs(first["BTC/EUR-ticker"], second["BTC/EUR-ticker"])
+
+        with self.assertRaises(TypeError):
+            first["BTC/EUR-ticker"]["identifier"] = "ETH/EUR-ticker"
+
+    def test_concurrent_prefetch(self):
+        # Each call waits for the other, so the test only passes when
+        # both identifiers are fetched at the same time
+        market_data_source_service = MarketDataSourceServiceStub(Barrier(2))
+        market_data_context = MarketDataContext(
+            market_data_source_service, concurrent=True
+        )
+        market_data_context.prefetch(["BTC/EUR-ticker", "ETH/EUR-ticker"])
+        self.assertEqual(
+            {"identifier": "ETH/EUR-ticker"},
+            market_data_context.get_market_data(["ETH/EUR-ticker"])[
+                "ETH/EUR-ticker"
+            ]
+        )
+        self.assertEqual(2, sum(market_data_source_service.calls.values()))
+
+    def test_without_market_data_sources(self):
+        market_data_context = MarketDataContext(MarketDataSourceServiceStub())
+        self.assertEqual({}, market_data_context.get_market_data(None))
@@ -0,0 +1,72 @@
+from datetime import datetime
+from unittest import TestCase
+
+from investing_algorithm_framework.domain import Order
+from investing_algorithm_framework.services import OrderBacktestService
+from tests.resources import create_ohlcv_data_frame
+
+
+class TestOrderBacktestService(TestCase):
+
+    def setUp(self) -> None:
+        self.order_service = OrderBacktestService(
+            order_repository=None,
+            order_fee_repository=None,
+            position_repository=None,
+            portfolio_repository=None,
+            portfolio_configuration_service=None,
+            portfolio_snapshot_service=None,
+            configuration_service=None,
+            market_data_source_service=None,
+        )
+        self.order = Order(
+            order_type="LIMIT",
+            order_side="BUY",
+            status="OPEN",
+            amount=1,
+            target_symbol="BTC",
+            trading_symbol="EUR",
+            price=100,
+            created_at=datetime(2023, 12, 1, 1),
+        )
+        self.order.id = 1
+
+    def test_check_ohclv_ignores_data_before_order_creation(self):
+        data = create_ohlcv_data_frame(
+            [[100, 110, 90, 100], [103, 105, 102, 104]],
+            start_date=datetime(2023, 12, 1, 0)
+        )
+        self.assertFalse(self.order_service.check_ohclv(self.order, data))
+
+    def test_check_ohclv_keeps_price_range_between_checks(self):
+        data = create_ohlcv_data_frame(
+            [[92, 95, 90, 93], [93, 96, 91, 94]],
+            start_date=datetime(2023, 12, 1, 1)
+        )
+        self.assertFalse(self.order_service.check_ohclv(self.order, data))
+
+        # The window of the next check no longer holds the first candles
+        data = create_ohlcv_data_frame(
+            [[93, 96, 91, 94], [105, 110, 101, 108]],
+            start_date=datetime(2023, 12, 1, 2)
+        )
+        self.assertTrue(self.order_service.check_ohclv(self.order, data))
+
+    def test_check_ohclv_without_new_data(self):
+        data = create_ohlcv_data_frame([])
+        self.assertFalse(self.order_service.check_ohclv(self.order, data))
+
+    def test_check_start_is_last_checked_candle(self):
+        self.assertEqual(
+            datetime(2023, 12, 1, 1),
+            self.order_service._get_check_start(self.order)
+        )
+        data = create_ohlcv_data_frame(
+            [[103, 105, 102, 104], [104, 106, 103, 105]],
+            start_date=datetime(2023, 12, 1, 1)
+        )
+        self.order_service.check_ohclv(self.order, data)
+        self.assertEqual(
+            datetime(2023, 12, 1, 2),
+            self.order_service._get_check_start(self.order)
+        )
@@ -0,0 +1,116 @@
+from datetime import datetime
+from unittest import TestCase
+
+from investing_algorithm_framework.domain import SNAPSHOT_POLICY, \
+    SNAPSHOT_INTERVAL, BACKTESTING_FLAG
+from investing_algorithm_framework.infrastructure import InMemoryDatabase, \
+    InMemoryPortfolioRepository, InMemoryPositionRepository, \
+    InMemoryPortfolioSnapshotRepository, InMemoryPositionSnapshotRepository
+from investing_algorithm_framework.services import ConfigurationService, \
+    PortfolioSnapshotService, PositionSnapshotService
+
+
+class TestPortfolioSnapshotService(TestCase):
+
+    def setUp(self) -> None:
+        self.database = InMemoryDatabase()
+        self.configuration_service = ConfigurationService()
+        self.position_repository = InMemoryPositionRepository(self.database)
+        self.position_snapshot_repository = \
+            InMemoryPositionSnapshotRepository(self.database)
+        self.portfolio_snapshot_service = PortfolioSnapshotService(
+            repository=InMemoryPortfolioSnapshotRepository(self.database),
+            position_repository=self.position_repository,
+            position_snapshot_service=PositionSnapshotService(
+                self.position_snapshot_repository
+            ),
+            configuration_service=self.configuration_service,
+        )
+        self.portfolio = InMemoryPortfolioRepository(self.database).create(
+            {
+                "trading_symbol": "EUR",
+                "market": "BINANCE",
+                "unallocated": 1000,
+            }
+        )
+
+        for symbol in ["EUR", "BTC", "ETH"]:
+            self.position_repository.create(
+                {"symbol": symbol, "amount": 1, "portfolio_id": 1}
+            )
+
+    def test_create_snapshot(self):
+        snapshot = self.portfolio_snapshot_service.create_snapshot(
+            self.portfolio, created_at=datetime(2023, 12, 1)
+        )
+        self.assertEqual(
+            3,
+            self.position_snapshot_repository.count(
+                {"portfolio_snapshot": snapshot.id}
+            )
+        )
+
+    def test_order_policy(self):
+        self.assertTrue(
+            self.portfolio_snapshot_service
+            .is_snapshot_due(1, datetime(2023, 12, 1))
+        )
+        self.assertEqual(
+            [], self.portfolio_snapshot_service.pop_due_snapshots()
+        )
+
+    def test_tick_policy(self):
+        self.configuration_service.config[SNAPSHOT_POLICY] = "TICK"
+
+        for hour in range(3):
+            self.assertFalse(
+                self.portfolio_snapshot_service
+                .is_snapshot_due(1, datetime(2023, 12, 1, hour))
+            )
+
+        self.assertEqual(
+            [(1, datetime(2023, 12, 1, 2))],
+            self.portfolio_snapshot_service.pop_due_snapshots()
+        )
+        self.assertEqual(
+            [], self.portfolio_snapshot_service.pop_due_snapshots()
+        )
+
+    def test_interval_policy(self):
+        self.configuration_service.config[SNAPSHOT_POLICY] = "INTERVAL"
+        self.configuration_service.config[SNAPSHOT_INTERVAL] = 3600
+        self.portfolio_snapshot_service\
+            .is_snapshot_due(1, datetime(2023, 12, 1, 0))
+        self.assertEqual(
+            [(1, datetime(2023, 12, 1, 0))],
+            self.portfolio_snapshot_service.pop_due_snapshots()
+        )
+        self.portfolio_snapshot_service\
+            .is_snapshot_due(1, datetime(2023, 12, 1, 0, 30))
+        self.assertEqual(
+            [],
+            self.portfolio_snapshot_service
+            .pop_due_snapshots(now=datetime(2023, 12, 1, 0, 45))
+        )
+
+        # The request stays pending until the interval has passed
+        self.assertEqual(
+            [(1, datetime(2023, 12, 1, 0, 30))],
+            self.portfolio_snapshot_service
+            .pop_due_snapshots(now=datetime(2023, 12, 1, 1))
+        )
+        self.portfolio_snapshot_service\
+            .is_snapshot_due(1, datetime(2023, 12, 1, 1, 15))
+        self.assertEqual(
+            [(1, datetime(2023, 12, 1, 1, 15))],
+            self.portfolio_snapshot_service
+            .pop_due_snapshots(now=datetime(2023, 12, 1, 1, 30), flush=True)
+        )
+
+    def test_backtest_uses_tick_policy(self):
+        self.configuration_service.config[SNAPSHOT_POLICY] = "ORDER"
+        self.configuration_service.config[BACKTESTING_FLAG] = True
+        self.assertFalse(
+            self.portfolio_snapshot_service
+            .is_snapshot_due(1, datetime(2023, 12, 1))
+        )
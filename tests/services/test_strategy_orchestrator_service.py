@@ -0,0 +1,143 @@
+from collections import Counter
+from threading import Event
+from unittest import TestCase
+from unittest.mock import patch
+
+from investing_algorithm_framework.domain import TimeUnit
+from investing_algorithm_framework.services import \
+    StrategyOrchestratorService
+
+
+class TaskStub:
+
+    def __init__(self, worker_id, interval, time_unit=TimeUnit.SECOND):
+        self.worker_id = worker_id
+        self.interval = interval
+        self.time_unit = time_unit
+        self.runs = 0
+        self.finished = Event()
+        self.finished.set()
+
+    def run(self, algorithm):
+        self.runs += 1
+        self.finished.wait()
+
+
+class StrategyStub(TaskStub):
+
+    def __init__(self, worker_id, interval, market_data_sources):
+        super().__init__(worker_id, interval)
+        self.market_data_sources = market_data_sources
+        self.market_data = None
+
+    def run_strategy(self, market_data, algorithm):
+        self.market_data = market_data
+
+
+class MarketDataSourceServiceStub:
+
+    def __init__(self):
+        self.calls = Counter()
+
+    def get_data(self, identifier):
+        self.calls[identifier] += 1
+        return identifier
+
+
+class ClockStub:
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+
+class Test(TestCase):
+
+    def setUp(self) -> None:
+        self.clock = ClockStub()
+        patcher = patch(
+            "investing_algorithm_framework.services"
+            ".strategy_orchestrator_service.time",
+            self.clock
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.market_data_source_service = MarketDataSourceServiceStub()
+        self.service = StrategyOrchestratorService(
+            self.market_data_source_service
+        )
+        self.addCleanup(self.service.stop)
+        self.fast_task = TaskStub("fast", 10)
+        self.slow_task = TaskStub("slow", 1, TimeUnit.MINUTE)
+        self.service.add_tasks([self.slow_task, self.fast_task])
+        self.service.start(algorithm=None)
+
+    def run_pending_jobs(self):
+        self.service.run_pending_jobs()
+        self.service._executor.shutdown(wait=True)
+        self.service._executor = None
+
+    def test_next_run(self):
+        self.assertEqual(
+            ["fast", "slow"],
+            [job.worker_id for job in self.service.get_jobs()]
+        )
+        self.assertEqual(10, self.service.time_until_next_run())
+        self.clock.now += 4
+        self.assertEqual(6, self.service.time_until_next_run())
+
+    def test_run_pending_jobs(self):
+        self.clock.now += 9
+        self.service.run_pending_jobs()
+        self.assertEqual(0, self.fast_task.runs)
+
+        self.clock.now += 1.5
+        self.run_pending_jobs()
+        self.assertEqual(1, self.fast_task.runs)
+        self.assertEqual(0, self.slow_task.runs)
+        history = self.service.history["fast"]
+        self.assertEqual(0.5, history["latency"])
+        self.assertEqual(0, history["missed_deadlines"])
+
+        # The next run stays on the grid of the first deadline
+        self.assertEqual(9.5, self.service.time_until_next_run())
+
+    def test_missed_deadlines(self):
+        self.clock.now += 35
+        self.run_pending_jobs()
+        self.assertEqual(1, self.fast_task.runs)
+        self.assertEqual(2, self.service.history["fast"]["missed_deadlines"])
+        self.assertEqual(5, self.service.time_until_next_run())
+
+    def test_skip_running_worker(self):
+        self.fast_task.finished.clear()
+        self.clock.now += 10
+        self.service.run_pending_jobs()
+        self.clock.now += 10
+        self.service.run_pending_jobs()
+        self.fast_task.finished.set()
+        self.service._executor.shutdown(wait=True)
+        self.assertEqual(1, self.fast_task.runs)
+        self.assertEqual(1, self.service.history["fast"]["runs"])
+        self.assertEqual(1, self.service.history["fast"]["missed_deadlines"])
+        self.assertIsNotNone(self.service.history["fast"]["duration"])
+
+    def test_strategies_share_market_data(self):
+        strategies = [
+            StrategyStub("one", 10, ["BTC/EUR-ohlcv", "BTC/EUR-ticker"]),
+            StrategyStub("two", 10, ["BTC/EUR-ohlcv"]),
+        ]
+        self.service.clear()
+        self.service.add_strategies(strategies)
+        self.service.start(algorithm=None)
+        self.clock.now += 10
+        self.run_pending_jobs()
+        self.assertEqual(
+            {"BTC/EUR-ohlcv": 1, "BTC/EUR-ticker": 1},
+            self.market_data_source_service.calls
+        )
+        self.assertEqual(
+            {"BTC/EUR-ohlcv": "BTC/EUR-ohlcv"}, strategies[1].market_data
+        )
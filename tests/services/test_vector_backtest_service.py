@@ -0,0 +1,132 @@
+from datetime import datetime, timedelta
+from unittest import TestCase
+
+from investing_algorithm_framework.domain import OperationalException
+from investing_algorithm_framework.services import VectorBacktestService
+from tests.resources import create_ohlcv_data_frame
+
+START_DATE = datetime(2023, 1, 1)
+CANDLES = [
+    # Open, high, low, close
+    [100, 105, 95, 100],
+    [100, 112, 100, 110],
+    [110, 125, 108, 120],
+    [120, 122, 85, 90],
+    [90, 104, 88, 100],
+]
+
+
+class Test(TestCase):
+
+    def backtest(self, entries, exits, **kwargs):
+        return VectorBacktestService().backtest(
+            data=create_ohlcv_data_frame(CANDLES, START_DATE),
+            entries=entries,
+            exits=exits,
+            start_date=START_DATE,
+            end_date=START_DATE + timedelta(hours=4),
+            initial_balance=1000,
+            target_symbol="BTC",
+            trading_symbol="EUR",
+            **kwargs
+        )
+
+    def test_market_orders(self):
+        report = self.backtest([1, 0, 0, 1, 0], [0, 0, 1, 0, 0])
+        self.assertEqual(3, report.number_of_orders)
+        self.assertEqual(1, report.number_of_trades_closed)
+        self.assertEqual(1, report.number_of_trades_open)
+        self.assertAlmostEqual(200, report.total_net_gain)
+        self.assertAlmostEqual(1200 / 90 * 100, report.total_value)
+        self.assertAlmostEqual(100 / 3, report.percentage_positive_trades)
+        self.assertAlmostEqual(2, report.average_trade_duration)
+        self.assertAlmostEqual(1000, report.average_trade_size)
+        self.assertEqual(
+            [1000, 1100, 1200, 1200], list(report.equity_curve.equity[:4])
+        )
+
+        trade = report.trades[0]
+        self.assertEqual(10, trade.amount)
+        self.assertEqual(100, trade.open_price)
+        self.assertEqual(120, trade.closed_price)
+        self.assertEqual(START_DATE + timedelta(hours=2), trade.closed_at)
+        self.assertIsNone(report.trades[1].closed_at)
+
+    def test_limit_orders_fill_when_price_is_in_candle_range(self):
+        report = self.backtest(
+            [1, 0, 0, 1, 0], [0, 0, 1, 0, 0], order_type="LIMIT"
+        )
+        self.assertEqual(2, len(report.trades))
+        trade = report.trades[0]
+        self.assertEqual(START_DATE, trade.opened_at)
+        self.assertEqual(START_DATE + timedelta(hours=3), trade.closed_at)
+        self.assertAlmostEqual(200, trade.net_gain)
+        self.assertEqual(90, report.trades[1].open_price)
+        self.assertEqual(1, report.number_of_positions)
+
+    def test_unfilled_limit_order_stays_pending(self):
+        report = self.backtest(
+            [0, 0, 0, 0, 1], [0, 0, 0, 0, 0], order_type="LIMIT"
+        )
+        self.assertEqual(1, report.number_of_orders)
+        self.assertEqual(0, len(report.trades))
+        self.assertEqual(10, report.positions[1].amount_pending)
+        self.assertAlmostEqual(0, report.growth)
+
+    def test_fees_and_percentage_of_portfolio(self):
+        report = self.backtest(
+            [1, 0, 0, 0, 0],
+            [0, 0, 1, 0, 0],
+            percentage_of_portfolio=50,
+            fee_percentage=1
+        )
+        amount = 500 / 101
+        self.assertAlmostEqual(amount, report.trades[0].amount)
+        self.assertAlmostEqual(
+            amount * 120 * 0.99 - 500, report.total_net_gain
+        )
+        self.assertAlmostEqual(500 + amount * 120 * 0.99, report.total_value)
+
+    def test_precision(self):
+        report = self.backtest(
+            [1, 0, 0, 0, 0], [0, 0, 0, 0, 0], fee_percentage=1, precision=2
+        )
+        self.assertEqual(9.9, report.trades[0].amount)
+        self.assertAlmostEqual(999.9, report.total_cost)
+
+    def test_signals_outside_date_range_are_ignored(self):
+        report = VectorBacktestService().backtest(
+            data=create_ohlcv_data_frame(CANDLES, START_DATE),
+            entries=[1, 0, 1, 0, 0],
+            exits=[0, 0, 0, 1, 0],
+            start_date=START_DATE + timedelta(hours=1),
+            end_date=START_DATE + timedelta(hours=4),
+            initial_balance=1000,
+            target_symbol="BTC",
+            trading_symbol="EUR",
+        )
+        self.assertEqual(4, report.number_of_runs)
+        self.assertEqual(120, report.trades[0].open_price)
+
+    def test_signals_must_match_data(self):
+
+        with self.assertRaises(OperationalException):
+            self.backtest([1, 0], [0, 1])
+
+    def test_unfilled_limit_sell_keeps_position(self):
+        report = VectorBacktestService().backtest(
+            data=create_ohlcv_data_frame([10, 10, 12, 8, 7], START_DATE),
+            entries=[1, 0, 0, 0, 0],
+            exits=[0, 0, 1, 0, 0],
+            start_date=START_DATE,
+            end_date=START_DATE + timedelta(hours=4),
+            initial_balance=1000,
+            target_symbol="BTC",
+            trading_symbol="EUR",
+            order_type="LIMIT"
+        )
+        self.assertEqual(2, report.number_of_orders)
+        self.assertAlmostEqual(700, report.total_value)
+        self.assertAlmostEqual(-300, report.growth)
+        self.assertEqual(100, report.positions[1].amount)
+        self.assertEqual(0, report.positions[1].amount_pending)